@@ -0,0 +1,92 @@
+"""Cost of the debug logs in the hot paths.
+
+Each hot path is timed at INFO level and at DEBUG level, where the
+messages are formatted but dropped by a :py:class:`logging.NullHandler` .
+The debug messages are only formatted when they are logged, so at INFO
+level the only overhead left is checking the level, which is also timed.
+
+Run with::
+
+    python benchmarks/logging_overhead.py
+"""
+import logging
+import os
+import timeit
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from pygame_cards.abstract import AbstractCard, AbstractCardGraphics
+from pygame_cards.classics import CardSets
+from pygame_cards.hands import AlignedHand, RoundedHand
+from pygame_cards.io.utils import item_to_json
+from pygame_cards.manager import CardsManager
+from pygame_cards.set import CardsSet
+
+
+def get_cards(n: int) -> CardsSet:
+    cards = CardsSet([AbstractCard(f"{i}") for i in range(n)])
+    for card in cards:
+        card.graphics_type = AbstractCardGraphics
+    return cards
+
+
+def hot_paths() -> dict:
+    """The functions to time, by name."""
+    deck = list(CardSets.n52)
+    aligned = AlignedHand(get_cards(13), size=(700, 200), card_size=(50, 75))
+    rounded = RoundedHand(get_cards(13), card_size=(100, 150))
+    rounded.surface
+
+    manager = CardsManager(headless=True)
+    manager.add_set(aligned, (0, 0))
+    manager.add_set(rounded, (0, 250))
+    positions = [(x, y) for x in range(0, 700, 7) for y in (50, 400)]
+
+    def update_manager():
+        for pos in positions:
+            manager.mouse_pos = pos
+            manager.update(1)
+
+    def rebuild_rounded():
+        rounded.clear_cache()
+        rounded.surface
+
+    return {
+        "item_to_json(n52)": lambda: item_to_json(deck),
+        "AlignedHand.get_card_at": lambda: [
+            aligned.get_card_at((x, 100)) for x in range(0, 700, 7)
+        ],
+        "RoundedHand.surface": rebuild_rounded,
+        "CardsManager.update": update_manager,
+    }
+
+
+def set_level(level: int) -> None:
+    for name in ["pygame_cards", "pywonders"]:
+        logging.getLogger(name).setLevel(level)
+
+
+def best_time(func, number: int = 20, repeat: int = 10) -> float:
+    """The best time of a call (Unit: ms)."""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1000
+
+
+if __name__ == "__main__":
+    pygame.init()
+    for name in ["pygame_cards", "pywonders"]:
+        logger = logging.getLogger(name)
+        logger.addHandler(logging.NullHandler())
+        logger.propagate = False
+
+    for name, func in hot_paths().items():
+        set_level(logging.DEBUG)
+        at_debug = best_time(func)
+        set_level(logging.INFO)
+        at_info = best_time(func)
+        print(f"{name:>25}: {at_info:8.3f} ms at INFO, {at_debug:8.3f} ms at DEBUG")
+
+    logger = logging.getLogger("pygame_cards.io.json")
+    check = best_time(lambda: logger.isEnabledFor(logging.DEBUG), number=100_000)
+    print(f"{'Level check':>25}: {check * 1e6:8.1f} ns")
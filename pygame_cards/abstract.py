@@ -1,22 +1,24 @@
 from __future__ import annotations
 from abc import abstractproperty
 from dataclasses import dataclass, field
+from functools import cached_property
+import itertools
 import logging
-import threading
-from typing import TYPE_CHECKING, Type
+from typing import TYPE_CHECKING, Callable, ClassVar, Hashable, Type
 import pygame
 from pygame_cards import constants
+from pygame_cards.profiling import profiler
 
 
 if TYPE_CHECKING:
     from pygame_cards.set import CardsSet
 
 
-_CARDS_COUNTER = 0
-_COUNTER_LOCK = threading.Lock()
+# Unique ids of the cards, next() on a count is atomic so no lock is needed
+_CARDS_IDS = itertools.count()
 
 
-@dataclass
+@dataclass(slots=True)
 class AbstractCard:
     """The minimum required for a class.
 
@@ -24,12 +26,17 @@ class AbstractCard:
     @dataclass(eq=False)
     such that you can inherit from the hash method, which is safely
     handled by the u_id attribute.
+    Add `slots=True` to the decorator to store the attributes in slots
+    instead of a `__dict__` , which makes the cards smaller and faster
+    to create.
 
     :param name: The name of the card
     :param u_id: A unique identifier for each card. Cards can be in
         two similar exemplar, but will have different u_ids.
     :param graphics_type: The type of graphics we want to use.
-    :param logger: A :py:class:`logging.Logger` object.
+        Can be set on the card or as a class attribute of the card type.
+    :param logger: A :py:class:`logging.Logger` object shared by all the
+        cards of the same type.
         Useful for debugging purposes.
 
     """
@@ -37,22 +44,29 @@ class AbstractCard:
     name: str
 
     u_id: int = field(init=False)
-    logger: logging.Logger = field(init=False, repr=False)
+    logger: ClassVar[logging.Logger]
 
-    graphics_type: Type[AbstractCardGraphics] = field(
+    _graphics_type: Type[AbstractCardGraphics] = field(
         init=False,
         compare=False,
         repr=False,
     )
     _graphics: AbstractCardGraphics = field(init=False, compare=False, repr=False)
+    # The graphics type set as class attribute
+    _default_graphics_type: ClassVar[Type[AbstractCardGraphics] | None] = None
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        # Assing a logger
+        cls.logger = logging.getLogger(f"pywonders.cards.{cls.__name__}")
+        # A class attribute would hide the property of the cards
+        graphics_type = cls.__dict__.get("graphics_type")
+        if isinstance(graphics_type, type):
+            cls._default_graphics_type = graphics_type
+            delattr(cls, "graphics_type")
 
     def __post_init__(self):
         # Get a thread safe unique ID for that card
-        with _COUNTER_LOCK:
-            global _CARDS_COUNTER
-            self.u_id = _CARDS_COUNTER
-            _CARDS_COUNTER += 1
-        self.logger = logging.getLogger(f"pywonders.cards.{type(self).__name__}")
+        self.u_id = next(_CARDS_IDS)
 
     def __repr__(self) -> str:
         return f"Card({self.name})"
@@ -60,11 +74,21 @@ class AbstractCard:
     def __hash__(self) -> int:
         return self.u_id
 
+    @property
+    def graphics_type(self) -> Type[AbstractCardGraphics] | None:
+        """The type of graphics of the card, None if not specified."""
+        return getattr(self, "_graphics_type", self._default_graphics_type)
+
+    @graphics_type.setter
+    def graphics_type(self, graphics_type: Type[AbstractCardGraphics]) -> None:
+        self._graphics_type = graphics_type
+
     @property
     def graphics(self) -> AbstractCardGraphics:
         """The graphics for the card."""
         if not hasattr(self, "_graphics"):
-            if not hasattr(self, "graphics_type"):
+            graphics_type = self.graphics_type
+            if graphics_type is None:
                 raise RuntimeError(
                     f"Cannot show graphics of {self}, "
                     "because not graphics_type was specified. "
@@ -72,7 +96,7 @@ class AbstractCard:
                     "'graphics_type' class."
                 )
             else:
-                self._graphics = self.graphics_type(self)
+                self._graphics = graphics_type(self)
 
         return self._graphics
 
@@ -83,8 +107,12 @@ class AbstractCard:
 
     def n_exemplar_in_set(self, set: CardsSet) -> int:
         """Check how many time a card is in a set."""
-        test_set = [c for c in set if c.name == self.name]
-        return len(test_set)
+        if hasattr(set, "count_with"):
+            return set.count_with("name", self.name)
+        return sum(1 for c in set if c.name == self.name)
+
+
+AbstractCard.logger = logging.getLogger("pywonders.cards.AbstractCard")
 
 
 class AbstractGraphic:
@@ -115,9 +143,16 @@ class AbstractGraphic:
     logger: logging.Logger
     size: tuple[int, int]
 
+    # Functions called with the graphic when its size changed
+    _resize_callbacks: tuple[Callable[[AbstractGraphic], None], ...] = ()
+
     def __init_subclass__(cls) -> None:
         # Assing a logger
         cls.logger = logging.getLogger(f"pygame_cards.graphics.{cls.__name__}")
+        # Count the rebuilds of the cached surface for profiling
+        surface = cls.__dict__.get("surface")
+        if isinstance(surface, cached_property):
+            surface.func = profiler.counted_rebuilds(surface.func)
 
     def clear_cache(self) -> None:
         """Clear the cache of this graphics.
@@ -152,15 +187,48 @@ class AbstractGraphic:
             return
         self._size = size
         self.clear_cache()
+        for callback in self._resize_callbacks:
+            callback(self)
+
+    def add_resize_callback(self, callback: Callable[[AbstractGraphic], None]) -> None:
+        """Call a function with this graphic each time its size changes.
+
+        Used by the managers to keep track of where the graphics are.
+        """
+        self._resize_callbacks = (*self._resize_callbacks, callback)
+
+    def remove_resize_callback(
+        self, callback: Callable[[AbstractGraphic], None]
+    ) -> None:
+        """Stop calling a function added with :py:meth:`add_resize_callback` ."""
+        self._resize_callbacks = tuple(
+            c for c in self._resize_callbacks if c != callback
+        )
 
 
 @dataclass
 class AbstractCardGraphics(AbstractGraphic):
-    """A base representation for what a card should look like."""
+    """A base representation for what a card should look like.
+
+    Graphics can share their rendered surface with other graphics showing
+    the same card by decorating their surface with
+    :py:func:`~pygame_cards.cache.cached_surface` and implementing
+    :py:attr:`render_key` .
+    """
 
     card: AbstractCard
     size: tuple[int, int] = constants.CARD_SIZE
 
+    @property
+    def render_key(self) -> Hashable | None:
+        """A key identifying what the card looks like.
+
+        Two graphics of the same type, with the same size and the same
+        render key are assumed to have the same surface.
+        If None (default), the surface is not shared.
+        """
+        return None
+
     @property
     def surface(self) -> pygame.Surface:
         """The surface of the card."""
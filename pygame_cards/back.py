@@ -1,21 +1,131 @@
 import sys
 from functools import cached_property
+from pathlib import Path
+import weakref
 
 import pygame
+from pygame_emojis import load_svg
 
 from pygame_cards.abstract import AbstractCard, AbstractCardGraphics
+from pygame_cards.cache import SurfaceCache
+from pygame_cards.effects import outer_border
 from pygame_cards.utils import DEFAULT_CARDBACK
 
+#: The card backs already rendered by :py:func:`load_card_back`
+card_backs_cache = SurfaceCache(max_bytes=16 * 1024 * 1024, name="card_backs")
+# The ids of the surfaces given to load_card_back whose deletion is watched
+_card_back_sources: set[int] = set()
+
+
+def _forget_card_backs(surface_id: int) -> None:
+    """Remove the card backs of a surface that does not exist anymore."""
+    _card_back_sources.discard(surface_id)
+    for key in card_backs_cache.keys():
+        if key[0] == surface_id:
+            card_backs_cache.discard(key)
+
+
+def load_card_back(
+    card_back: Path | str | pygame.Surface,
+    size: tuple[int, int],
+    border_radius: int = 0,
+    add_border: bool = False,
+) -> pygame.Surface:
+    """Return the card back rendered for the given size.
+
+    Card backs are rendered only once for the same parameters and
+    the surface is shared by all the graphics using it, so never
+    draw directly on it.
+
+    :arg card_back: The path to the image file or a pygame surface.
+        If a path is given, the image will be loaded from the file.
+        Svg files are loaded directly at the desired size.
+        A surface is identified by its id and not modified, so draw
+        on a new surface to change the card back.
+    :arg size: The size of the card back.
+    :arg border_radius: The radius of the rounded corners.
+    :arg add_border: Whether to draw a border around the card back.
+    """
+    if isinstance(card_back, Path | str):
+        card_back = Path(card_back)
+        source = card_back
+    elif isinstance(card_back, pygame.Surface):
+        # Keep no reference to the surface, its card backs are removed
+        # from the cache when it is deleted
+        source = id(card_back)
+    else:
+        raise TypeError("card_back")
+    key = (source, tuple(size), border_radius, add_border)
+
+    surface = card_backs_cache.get(key)
+    if surface is None:
+        surface = _render_card_back(card_back, size, border_radius, add_border)
+        card_backs_cache.put(key, surface)
+        if isinstance(card_back, pygame.Surface) and source not in _card_back_sources:
+            _card_back_sources.add(source)
+            weakref.finalize(card_back, _forget_card_backs, source)
+    return surface
+
+
+def _render_card_back(
+    card_back: Path | pygame.Surface,
+    size: tuple[int, int],
+    border_radius: int,
+    add_border: bool,
+) -> pygame.Surface:
+    """Render the surface of :py:func:`load_card_back` ."""
+    if isinstance(card_back, Path):
+        if card_back.suffix == ".svg":
+            _card_back = pygame.Surface(size)
+            _card_back.fill("white")
+            _card_back.blit(load_svg(card_back, size), (0, 0))
+        elif card_back.is_file():
+            _card_back = pygame.image.load(card_back)
+        else:
+            raise FileNotFoundError(card_back)
+    else:
+        _card_back = card_back
+
+    if _card_back.get_size() != size:
+        _card_back = pygame.transform.scale(_card_back, size)
+    elif _card_back is card_back:
+        # Don't modify the surface given
+        _card_back = _card_back.copy()
+
+    if border_radius:
+        # Round the corners of the card
+        # https://stackoverflow.com/a/63701005/15368670
+        rect_image = pygame.Surface(size, pygame.SRCALPHA)
+        pygame.draw.rect(
+            rect_image,
+            (255, 255, 255),
+            (0, 0, *size),
+            border_radius=border_radius,
+        )
+        _card_back = _card_back.convert_alpha()
+        _card_back.blit(rect_image, (0, 0), None, pygame.BLEND_RGBA_MIN)
+
+    if add_border:
+        outer_border(_card_back, radius=border_radius, inplace=True)
+
+    return _card_back
+
 
 class CardBackGraphics(AbstractCardGraphics):
     """A simple graphics for a card back.
 
     You can assign that graphics to any card you want.
+
+    .. warning::
+        The surface is shared with all the card backs of the same size,
+        and with the decks.
+        Never draw on it, also in daughter classes: draw on a copy of
+        ``super().surface`` instead.
     """
 
     @cached_property
     def surface(self) -> pygame.Surface:
-        return pygame.transform.scale(pygame.image.load(DEFAULT_CARDBACK), self.size)
+        return load_card_back(DEFAULT_CARDBACK, self.size)
 
 
 if __name__ == "__main__":
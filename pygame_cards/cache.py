@@ -0,0 +1,214 @@
+"""Caches for sharing rendered surfaces between graphics.
+
+Rendering a card face is much more expensive than blitting it.
+Many graphics show exactly the same thing (two exemplars of the same card,
+a card moving back to a set with a size it already had), so they can
+share the same rendered :py:class:`pygame.Surface` .
+
+The :py:data:`surface_cache` is the process wide cache used by the
+:py:func:`cached_surface` decorator.
+Graphics opt in by using the decorator instead of :py:func:`functools.cached_property`
+for their surface and by returning a non None
+:py:attr:`~pygame_cards.abstract.AbstractCardGraphics.render_key` .
+
+.. warning::
+    Surfaces from the shared cache are shared between graphics.
+    Never draw directly on them, make a copy first.
+"""
+from __future__ import annotations
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import cached_property
+import logging
+from typing import Hashable
+
+import pygame
+
+
+# Default memory budget for the shared cache (in bytes)
+DEFAULT_MAX_BYTES: int = 64 * 1024 * 1024
+
+#: The caches registered with a name
+named_caches: dict[str, SurfaceCache] = {}
+
+
+@dataclass
+class CacheStats:
+    """Statistics on the usage of a cache.
+
+    :param hits: Number of lookups that found the surface.
+    :param misses: Number of lookups that did not find the surface.
+    :param evictions: Number of surfaces removed to respect the budget.
+    :param n_items: The number of surfaces currently stored.
+    :param n_bytes: The memory currently used by the surfaces.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    n_items: int = 0
+    n_bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Proportion of lookups that were hits."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def surface_bytes(surface: pygame.Surface) -> int:
+    """Return the memory used by the pixels of a surface."""
+    return surface.get_pitch() * surface.get_height()
+
+
+class SurfaceCache:
+    """A least recently used cache of surfaces with a memory budget.
+
+    When adding a surface would make the cache exceed its budget,
+    the least recently used surfaces are evicted.
+
+    :param max_bytes: The memory budget of the cache in bytes.
+        Surfaces larger than the budget are never stored.
+    :param name: If given, the cache is registered in :py:data:`named_caches` ,
+        such that its statistics are reported by
+        :py:mod:`pygame_cards.profiling` .
+    """
+
+    def __init__(
+        self, max_bytes: int = DEFAULT_MAX_BYTES, name: str | None = None
+    ) -> None:
+        self._surfaces: OrderedDict[Hashable, pygame.Surface] = OrderedDict()
+        self._n_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self.max_bytes = max_bytes
+        self.logger = logging.getLogger(f"pygame_cards.cache.{type(self).__name__}")
+        if name is not None:
+            named_caches[name] = self
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, max_bytes: int) -> None:
+        """Set the memory budget, evicting surfaces if needed."""
+        if max_bytes < 0:
+            raise ValueError(f"Budget must be positive, got {max_bytes = }")
+        self._max_bytes = max_bytes
+        self._evict(0)
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._surfaces
+
+    def keys(self) -> list[Hashable]:
+        """The keys of the stored surfaces, from the least recently used."""
+        return list(self._surfaces)
+
+    def get(self, key: Hashable) -> pygame.Surface | None:
+        """Return the surface stored for the key, None if not stored."""
+        surface = self._surfaces.get(key)
+        if surface is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._surfaces.move_to_end(key)
+        return surface
+
+    def put(self, key: Hashable, surface: pygame.Surface) -> None:
+        """Store a surface for the key."""
+        self.discard(key)
+        n_bytes = surface_bytes(surface)
+        if n_bytes > self.max_bytes:
+            self.logger.debug("Surface larger than the cache budget, not stored.")
+            return
+        self._evict(n_bytes)
+        self._surfaces[key] = surface
+        self._n_bytes += n_bytes
+
+    def discard(self, key: Hashable) -> None:
+        """Remove the surface of the key if it is stored."""
+        surface = self._surfaces.pop(key, None)
+        if surface is not None:
+            self._n_bytes -= surface_bytes(surface)
+
+    def clear(self) -> None:
+        """Remove all the surfaces from the cache."""
+        self._surfaces.clear()
+        self._n_bytes = 0
+
+    def reset_stats(self) -> None:
+        """Reset the hits, misses and evictions counters."""
+        self._hits, self._misses, self._evictions = 0, 0, 0
+
+    @property
+    def stats(self) -> CacheStats:
+        """The current statistics of the cache."""
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            n_items=len(self._surfaces),
+            n_bytes=self._n_bytes,
+        )
+
+    def _evict(self, n_bytes_needed: int) -> None:
+        """Evict the least recently used surfaces to free the memory needed."""
+        while self._surfaces and self._n_bytes + n_bytes_needed > self.max_bytes:
+            _, surface = self._surfaces.popitem(last=False)
+            self._n_bytes -= surface_bytes(surface)
+            self._evictions += 1
+
+
+#: The cache shared by all the graphics using :py:func:`cached_surface`
+surface_cache = SurfaceCache(name="surface")
+
+
+class cached_surface(cached_property):
+    """Decorator for a surface shared between graphics showing the same thing.
+
+    Works like :py:func:`functools.cached_property` , so
+    :py:meth:`~pygame_cards.abstract.AbstractGraphic.clear_cache` still
+    works the same.
+    When the instance cache is empty, the surface is looked up in the
+    :py:data:`surface_cache` using the key
+    ``(type(graphic), graphic.render_key, graphic.size)`` and only
+    rendered if not found there.
+    If the `render_key` of the graphic is None, the surface is never shared.
+
+    .. code::
+
+        class MyCardGraphics(AbstractCardGraphics):
+
+            @property
+            def render_key(self):
+                return self.card.name
+
+            @cached_surface
+            def surface(self) -> pygame.Surface:
+                ...
+    """
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        instance_cache = instance.__dict__
+        if self.attrname in instance_cache:
+            return instance_cache[self.attrname]
+
+        render_key = instance.render_key
+        if render_key is None:
+            surface = self.func(instance)
+        else:
+            key = (type(instance), render_key, tuple(instance.size))
+            surface = surface_cache.get(key)
+            if surface is None:
+                surface = self.func(instance)
+                surface_cache.put(key, surface)
+
+        instance_cache[self.attrname] = surface
+        return surface
@@ -10,12 +10,15 @@ from __future__ import annotations
 from dataclasses import dataclass
 from enum import Enum
 from functools import cached_property
+import logging
 from logging import warning
+from pathlib import Path
 import random
 import sys
 import pygame
 from pygame_cards.abstract import AbstractCard
 from pygame_cards.abstract import AbstractCardGraphics
+from pygame_cards.cache import SurfaceCache, cached_surface
 from pygame_emojis import load_emoji, load_svg, find_code, _SVG_DIR
 
 from pygame_cards.effects import outer_halo, Decay
@@ -63,9 +66,122 @@ LevelEmojis: dict[Level, str] = {
 }
 
 
+class GlyphAtlas:
+    """Rasterized glyphs shared by all the classic cards.
+
+    Rendering emojis from svg files is slow, and a deck contains many
+    times the same suit symbols, faces and labels.
+    The atlas rasterizes each glyph once per size and every
+    :py:class:`EmojisFrenchSuits` composes its surface from the atlas.
+
+    The glyphs are stored in a :py:class:`~pygame_cards.cache.SurfaceCache` ,
+    so the least recently used are evicted when the budget is exceeded.
+
+    .. warning::
+        The glyphs are shared, never draw directly on them.
+
+    :param max_bytes: The memory budget of the glyphs in bytes.
+    :param name: The name of the cache of the glyphs,
+        see :py:class:`~pygame_cards.cache.SurfaceCache` .
+    """
+
+    def __init__(
+        self, max_bytes: int = 16 * 1024 * 1024, name: str | None = None
+    ) -> None:
+        self._glyphs = SurfaceCache(max_bytes=max_bytes, name=name)
+        self._fonts: dict[int, pygame.font.Font] = {}
+        self._faces_files: dict[tuple[Level, Colors], Path] = {}
+
+    @cached_property
+    def svg_index(self) -> dict[str, Path]:
+        """The svg files of the emojis, indexed by their name.
+
+        The emojis directory is scanned only once, at first use.
+        """
+        return {file.stem: file for file in _SVG_DIR.rglob("*.svg")}
+
+    def clear(self) -> None:
+        """Remove all the glyphs from the atlas."""
+        self._glyphs.clear()
+        self._fonts.clear()
+
+    def font(self, font_size: int) -> pygame.font.Font:
+        """The default font with the requested size."""
+        if font_size not in self._fonts:
+            self._fonts[font_size] = pygame.font.Font(None, font_size)
+        return self._fonts[font_size]
+
+    def emoji(
+        self, emoji: str, size: tuple[float, float], flipped: bool = False
+    ) -> pygame.Surface:
+        """The emoji rasterized at the given size.
+
+        :arg flipped: Whether the emoji should be upside down.
+        """
+        key = ("emoji", emoji, size, flipped)
+        glyph = self._glyphs.get(key)
+        if glyph is None:
+            glyph = (
+                pygame.transform.flip(self.emoji(emoji, size), False, True)
+                if flipped
+                else load_emoji(emoji, size)
+            )
+            self._glyphs.put(key, glyph)
+        return glyph
+
+    def face_file(self, level: Level, color: Colors) -> Path:
+        """The svg file of the face for the level in the color."""
+        if (level, color) not in self._faces_files:
+            code = "-".join(find_code(LevelEmojis[level]))
+            self._faces_files[(level, color)] = next(
+                file
+                for stem, file in self.svg_index.items()
+                if stem.startswith(code) and HEXEmojiColor[color] in stem
+            )
+        return self._faces_files[(level, color)]
+
+    def face(
+        self,
+        level: Level,
+        color: Colors,
+        size: tuple[float, float],
+        flipped: bool = False,
+    ) -> pygame.Surface:
+        """The face of the level in the color, rasterized at the given size.
+
+        :arg flipped: Whether the face should be upside down.
+        """
+        key = ("face", level, color, size, flipped)
+        glyph = self._glyphs.get(key)
+        if glyph is None:
+            glyph = (
+                pygame.transform.flip(self.face(level, color, size), False, True)
+                if flipped
+                else load_svg(self.face_file(level, color), size=size)
+            )
+            self._glyphs.put(key, glyph)
+        return glyph
+
+    def label(self, text: str, color: str, font_size: int) -> pygame.Surface:
+        """The text rendered with the default font."""
+        key = ("label", text, color, font_size)
+        glyph = self._glyphs.get(key)
+        if glyph is None:
+            glyph = self.font(font_size).render(text, True, color)
+            self._glyphs.put(key, glyph)
+        return glyph
+
+
+#: The atlas used by the classic cards graphics
+glyph_atlas = GlyphAtlas(name="glyphs")
+
+
 @dataclass
 class EmojisFrenchSuits(AbstractCardGraphics):
-    """A graphics showing the cards with emojis."""
+    """A graphics showing the cards with emojis.
+
+    The glyphs are taken from the :py:data:`glyph_atlas` .
+    """
 
     card: NumberCard
 
@@ -80,6 +196,10 @@ class EmojisFrenchSuits(AbstractCardGraphics):
         self.__dict__.pop("top_label", None)
         self.__dict__.pop("icon_size", None)
 
+    @property
+    def render_key(self) -> tuple[int | Level, Colors]:
+        return (self.card.number, self.card.color)
+
     @cached_property
     def symbols_rows(self):
         return [self.size[1] / 8 * (i + 1) - self.icon_size[0] / 2 for i in range(7)]
@@ -97,142 +217,130 @@ class EmojisFrenchSuits(AbstractCardGraphics):
             pygame.SRCALPHA,
         )
 
-        s.blit(
-            load_emoji(
-                self.card.color.value,
-                (int(self.size[0] * scale), int(self.size[1] * scale / 1.5)),
-            ),
-            (0, int(self.size[1] * scale) / 2),
-        )
-
-        r = int(0.1 * min(*self.size))
-        font = pygame.font.Font(None, int(self.size[1] * 0.12))
         x_pos_text = int(self.size[0] * scale / 4)
         if isinstance(self.card.number, int) and self.card.number >= 10:
             x_pos_text = x_pos_text / 4
-        s.blit(
-            font.render(
-                str(
-                    self.card.number
-                    if isinstance(self.card.number, int)
-                    else self.card.number.value
+        s.blits(
+            [
+                (
+                    glyph_atlas.emoji(
+                        self.card.color.value,
+                        (int(self.size[0] * scale), int(self.size[1] * scale / 1.5)),
+                    ),
+                    (0, int(self.size[1] * scale) / 2),
                 ),
-                True,
-                RGBColor[self.card.color],
-            ),
-            (x_pos_text, 0),
+                (
+                    glyph_atlas.label(
+                        str(
+                            self.card.number
+                            if isinstance(self.card.number, int)
+                            else self.card.number.value
+                        ),
+                        RGBColor[self.card.color],
+                        int(self.size[1] * 0.12),
+                    ),
+                    (x_pos_text, 0),
+                ),
+            ]
         )
         return s
 
-    @cached_property
+    @cached_surface
     def surface(self) -> pygame.Surface:
         scale = 0.02
         scale_size = 0.15
         y_offset = self.size[1] * scale_size * 0.8
         s = super().surface
-        s.blit(
-            self.top_label,
-            (int(self.size[0] * scale), int(self.size[1] * scale)),
-        )
-        # s.blit(
-        #    pygame.transform.flip(self.top_label, flip_x=True, flip_y=True),
-        #    (
-        #        int(self.size[0] * scale),
-        #        self.size[1] - int(self.size[1] * scale_size) - y_offset,
-        #    ),
-        # )
-        # s.blit(
-        #    self.top_label,
-        #    (
-        #        self.size[0] - int(self.size[0] * scale_size),
-        #        int(self.size[1] * scale),
-        #    ),
-        # )
-        s.blit(
-            pygame.transform.flip(self.top_label, flip_x=True, flip_y=True),
+        blits = [
             (
-                self.size[0] - int(self.size[0] * scale_size),
-                self.size[1] - int(self.size[1] * scale_size) - y_offset,
+                self.top_label,
+                (int(self.size[0] * scale), int(self.size[1] * scale)),
             ),
-        )
+            (
+                pygame.transform.flip(self.top_label, flip_x=True, flip_y=True),
+                (
+                    self.size[0] - int(self.size[0] * scale_size),
+                    self.size[1] - int(self.size[1] * scale_size) - y_offset,
+                ),
+            ),
+        ]
         # Add a face to the card
         if self.card.number in LevelEmojis:
-            code_list = find_code(LevelEmojis[self.card.number])
-            code = "-".join(code_list)
-            emojis_files = [f for f in _SVG_DIR.rglob(f"{code}*.svg")]
-            good_color = [
-                e for e in emojis_files if HEXEmojiColor[self.card.color] in e.stem
-            ]
             # Dimension for the face
             w = self.size[0] * 0.8
             h = self.size[1] * 0.4
-            face_surf = load_svg(good_color[0], size=(w, h))
-            s.blit(
-                pygame.transform.flip(face_surf, False, True),
-                ((self.size[0] - w) / 2, (self.size[1] - h)),
-            )
-            s.blit(
-                face_surf,
-                ((self.size[0] - w) / 2, (self.size[1] / 2 - h)),
-            )
+            face_args = (self.card.number, self.card.color, (w, h))
+            blits += [
+                (
+                    glyph_atlas.face(*face_args, flipped=True),
+                    ((self.size[0] - w) / 2, (self.size[1] - h)),
+                ),
+                (
+                    glyph_atlas.face(*face_args),
+                    ((self.size[0] - w) / 2, (self.size[1] / 2 - h)),
+                ),
+            ]
 
         elif self.card.number == Level.AS:
             # Dimension for the face
             w = self.size[0] * 0.8
-            s.blit(
-                load_emoji(self.card.color.value, (w, w)),
-                (((self.size[0] - w) / 2, (self.size[1] - w) / 2)),
+            blits.append(
+                (
+                    glyph_atlas.emoji(self.card.color.value, (w, w)),
+                    ((self.size[0] - w) / 2, (self.size[1] - w) / 2),
+                )
             )
 
         elif isinstance(self.card.number, int):
             # place the icons
 
-            icon_s = load_emoji(self.card.color.value, self.icon_size)
-            flipped_icon = pygame.transform.flip(icon_s, False, True)
+            icon_s = glyph_atlas.emoji(self.card.color.value, self.icon_size)
+            flipped_icon = glyph_atlas.emoji(
+                self.card.color.value, self.icon_size, flipped=True
+            )
             r = self.symbols_rows
             c = self.symbols_cols
-            self.logger.debug(f"{r=}, {c=}, {s.get_size()}, {icon_s.get_size()}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"{r=}, {c=}, {s.get_size()}, {icon_s.get_size()}")
             if self.card.number in [2, 3]:
-                s.blit(icon_s, (c[1], r[0]))
-                s.blit(flipped_icon, (c[1], r[-1]))
+                blits.append((icon_s, (c[1], r[0])))
+                blits.append((flipped_icon, (c[1], r[-1])))
             if self.card.number > 3:
-                s.blit(icon_s, (c[0], r[0]))
-                s.blit(icon_s, (c[2], r[0]))
-                s.blit(flipped_icon, (c[0], r[-1]))
-                s.blit(flipped_icon, (c[2], r[-1]))
+                blits.append((icon_s, (c[0], r[0])))
+                blits.append((icon_s, (c[2], r[0])))
+                blits.append((flipped_icon, (c[0], r[-1])))
+                blits.append((flipped_icon, (c[2], r[-1])))
             if self.card.number in [6, 7, 8]:
-                s.blit(icon_s, (c[0], r[3]))
-                s.blit(icon_s, (c[2], r[3]))
+                blits.append((icon_s, (c[0], r[3])))
+                blits.append((icon_s, (c[2], r[3])))
             if self.card.number in [3, 5, 9]:
                 # Middle icon
-                s.blit(icon_s, (c[1], r[3]))
+                blits.append((icon_s, (c[1], r[3])))
             if self.card.number in [7, 8]:
                 # Middle mid top
-                s.blit(icon_s, (c[1], (r[1] + r[2]) // 2))
+                blits.append((icon_s, (c[1], (r[1] + r[2]) // 2)))
             if self.card.number == 8:
                 # Middle mid down
-                s.blit(
-                    flipped_icon,
-                    (c[1], (r[4] + r[5]) // 2),
-                )
+                blits.append((flipped_icon, (c[1], (r[4] + r[5]) // 2)))
             if self.card.number in [9, 10]:
                 # Middle mid top
-                s.blit(icon_s, (c[0], r[2]))
-                s.blit(icon_s, (c[2], r[2]))
+                blits.append((icon_s, (c[0], r[2])))
+                blits.append((icon_s, (c[2], r[2])))
 
-                s.blit(flipped_icon, (c[0], r[4]))
-                s.blit(flipped_icon, (c[2], r[4]))
+                blits.append((flipped_icon, (c[0], r[4])))
+                blits.append((flipped_icon, (c[2], r[4])))
             if self.card.number == 10:
-                s.blit(icon_s, (c[1], r[1]))
-                s.blit(flipped_icon, (c[1], r[5]))
+                blits.append((icon_s, (c[1], r[1])))
+                blits.append((flipped_icon, (c[1], r[5])))
 
         else:
             warning(f"Could not decorate {self.card}")
 
+        s.blits(blits)
         return s
 
 
-@dataclass(repr=False, eq=False)
+@dataclass(repr=False, eq=False, slots=True)
 class NumberCard(AbstractCard):
     number: int | Level
     color: Colors
@@ -269,35 +377,47 @@ class NumberCard(AbstractCard):
 class CardSets:
     """Default card sets that can be used.
 
+    Each access gives a new set with new cards, which can be shuffled,
+    drawn or modified freely.
+    The names, numbers and colors of the cards are computed only once
+    and shared between the sets.
+
     :param n52: A 52 game cards.
     :param n36: A 36 game cards.
     """
 
+    # The arguments of the cards of each set: {name: [(name, number, color)]}
+    _prototypes: dict[str, list[tuple[str, int | Level, Colors]]] = {}
+
     @classmethod
-    @property
-    def n52(self) -> DefaultCardsSet[NumberCard]:
-        cardset = DefaultCardsSet(
-            [
-                NumberCard(f"{n} of {c.value}", n, c)
+    def _from_prototype(
+        cls, name: str, lowest_number: int
+    ) -> DefaultCardsSet[NumberCard]:
+        """Create the default set from the arguments of its cards.
+
+        :arg name: The name of the set.
+        :arg lowest_number: The lowest number card of each color.
+        """
+        prototype = cls._prototypes.get(name)
+        if prototype is None:
+            prototype = cls._prototypes[name] = [
+                (f"{n} of {c.value}", n, c)
                 for c in Colors
-                for n in [i for i in range(2, 11)] + [l for l in Level]
+                for n in [i for i in range(lowest_number, 11)] + [l for l in Level]
             ]
-        )
-        cardset.name = "n52"
+        cardset = DefaultCardsSet([NumberCard(*args) for args in prototype])
+        cardset.name = name
         return cardset
 
+    @classmethod
+    @property
+    def n52(self) -> DefaultCardsSet[NumberCard]:
+        return self._from_prototype("n52", 2)
+
     @classmethod
     @property
     def n36(self) -> CardsSet[NumberCard]:
-        cardset = DefaultCardsSet(
-            [
-                NumberCard(f"{n} of {c.value}", n, c)
-                for c in Colors
-                for n in [i for i in range(6, 11)] + [l for l in Level]
-            ]
-        )
-        cardset.name = "n36"
-        return cardset
+        return self._from_prototype("n36", 6)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,120 @@
+"""Compact encoding of the cards as integer codes.
+
+Simulations over many deals do not need the card objects, only which
+card is where.
+A :py:class:`CardRegistry` gives each card a code, such that card sets
+can be converted to :py:mod:`numpy` arrays of codes and back.
+Shuffling, dealing, filtering and counting can then be done with array
+operations on the codes.
+
+.. code::
+
+    deck = CardSets.n52
+    codes = deck.to_codes()
+    registry = deck.registry
+
+    rng = numpy.random.default_rng()
+    # Shuffle and deal 5 cards to 4 players
+    hands = rng.permutation(codes)[:20].reshape(4, 5)
+    # Count the hearts of each player
+    hearts = registry.values("color") == Colors.HEART
+    n_hearts = hearts[hands].sum(axis=1)
+    # Back to the cards
+    first_hand = CardsSet.from_codes(hands[0], registry)
+"""
+from __future__ import annotations
+from typing import Any, Iterable
+
+import numpy as np
+
+from pygame_cards.abstract import AbstractCard
+
+
+class CardRegistry:
+    """Give each card a code, the index of the card in the registry.
+
+    Cards are registered the first time they are encoded, so the codes
+    of the cards already registered never change.
+    The codes are :py:class:`numpy.uint8` while the registry has less than
+    256 cards and :py:class:`numpy.int16` above.
+
+    :param cards: The cards to register.
+    """
+
+    def __init__(self, cards: Iterable[AbstractCard] = ()) -> None:
+        self.cards: list[AbstractCard] = []
+        self._codes: dict[AbstractCard, int] = {}
+        # Arrays of the attributes of the cards: {attribute: values}
+        self._values: dict[str, np.ndarray] = {}
+        self.register(cards)
+
+    def __len__(self) -> int:
+        return len(self.cards)
+
+    def __contains__(self, card: AbstractCard) -> bool:
+        return card in self._codes
+
+    @property
+    def dtype(self) -> type[np.integer]:
+        """The type of the codes."""
+        if len(self.cards) <= np.iinfo(np.uint8).max + 1:
+            return np.uint8
+        if len(self.cards) <= np.iinfo(np.int16).max + 1:
+            return np.int16
+        return np.int32
+
+    def register(self, cards: Iterable[AbstractCard]) -> None:
+        """Give a code to the cards not registered yet."""
+        for card in cards:
+            if card not in self._codes:
+                self._codes[card] = len(self.cards)
+                self.cards.append(card)
+                self._values.clear()
+
+    def code(self, card: AbstractCard) -> int:
+        """The code of a card, registering it if needed."""
+        if card not in self._codes:
+            self.register([card])
+        return self._codes[card]
+
+    def encode(self, cards: Iterable[AbstractCard]) -> np.ndarray:
+        """Convert cards to an array of codes, registering unknown cards."""
+        cards = list(cards)
+        self.register(cards)
+        codes = self._codes
+        return np.fromiter(
+            (codes[card] for card in cards), dtype=self.dtype, count=len(cards)
+        )
+
+    def decode(self, codes: Iterable[int] | np.ndarray) -> list[AbstractCard]:
+        """Convert an array of codes to the cards."""
+        cards = self.cards
+        return [cards[code] for code in np.asarray(codes).ravel().tolist()]
+
+    def values(self, attribute: str, dtype: Any = None) -> np.ndarray:
+        """An array with the attribute of each registered card.
+
+        Indexing the array with codes gives the attribute of the cards:
+        ``registry.values("name")[codes]`` .
+        The array is computed once and kept until new cards are registered.
+
+        :arg attribute: The name of the attribute of the cards.
+        :arg dtype: The type of the array. By default, guessed by numpy.
+        """
+        key = attribute if dtype is None else f"{attribute}:{np.dtype(dtype)}"
+        if key not in self._values:
+            values = [getattr(card, attribute) for card in self.cards]
+            if dtype is None and all(
+                type(value) in (int, float, bool, str) for value in values
+            ):
+                array = np.array(values)
+            else:
+                # Keep objects such as enums as they are
+                array = np.empty(len(values), dtype=object if dtype is None else dtype)
+                array[:] = values
+            self._values[key] = array
+        return self._values[key]
+
+    def counts(self, codes: np.ndarray) -> np.ndarray:
+        """How many times each registered card is in the codes."""
+        return np.bincount(np.asarray(codes).ravel(), minlength=len(self.cards))
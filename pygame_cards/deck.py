@@ -3,13 +3,13 @@ from pathlib import Path
 from numpy import linspace
 
 import pygame
-from pygame_emojis import load_svg
 
 from pygame_cards.abstract import AbstractCard
-from pygame_cards.effects import outer_border, outer_halo
+from pygame_cards.back import load_card_back
+from pygame_cards.effects import outer_halo
 from pygame_cards.hands import CardsetGraphic
 from pygame_cards.set import CardsSet
-from pygame_cards.utils import DEFAULT_CARDBACK
+from pygame_cards.utils import DEFAULT_CARDBACK, merge_rects
 
 
 class CardBackOwner(CardsetGraphic):
@@ -31,6 +31,9 @@ class CardBackOwner(CardsetGraphic):
             If a path is given, the image will be loaded from the file.
             For improving the graphics, we recommend using a svg file as
             they can be loaded for the desired size directly.
+            The rendered card back is shared with the other graphics
+            using the same card back, see
+            :py:func:`~pygame_cards.back.load_card_back` .
 
         """
         super().__init__(*args, **kwargs)
@@ -46,40 +49,114 @@ class CardBackOwner(CardsetGraphic):
     def card_back(
         self, card_back: Path | str | pygame.Surface, add_border: bool = True
     ):
-        if isinstance(card_back, Path | str):
-            if Path(card_back).suffix == ".svg":
-                _card_back = pygame.Surface(self.card_size)
-                _card_back.fill("white")
-                _card_back.blit(load_svg(card_back, self.card_size), (0, 0))
-            elif Path(card_back).is_file():
-                _card_back = pygame.image.load(card_back)
-            else:
-                raise FileNotFoundError(card_back)
-        elif isinstance(card_back, pygame.Surface):
-            _card_back = card_back
-        else:
-            raise TypeError("card_back")
-
-        if _card_back.get_size() != self.card_size:
-            _card_back = pygame.transform.scale(_card_back, self.card_size)
-
-        if self.card_border_radius:
-            # Round the corners of the card
-            # https://stackoverflow.com/a/63701005/15368670
-            rect_image = pygame.Surface(self.card_size, pygame.SRCALPHA)
-            pygame.draw.rect(
-                rect_image,
-                (255, 255, 255),
-                (0, 0, *self.card_size),
-                border_radius=self.card_border_radius,
-            )
-            _card_back = _card_back.copy().convert_alpha()
-            _card_back.blit(rect_image, (0, 0), None, pygame.BLEND_RGBA_MIN)
+        self._card_back = load_card_back(
+            card_back,
+            self.card_size,
+            border_radius=self.card_border_radius,
+            add_border=add_border,
+        )
 
-        if add_border:
-            outer_border(_card_back, radius=self.card_border_radius, inplace=True)
 
-        self._card_back = _card_back
+class PileEdges:
+    """The edges of the cards of a pile, seen under the top card.
+
+    The cards of the pile are all the same card back, stacked with an
+    offset at each card.
+    Each card is assumed to be opaque, except in its rounded corners, so
+    a card is only visible on the left and below the next card, and in
+    the corners of the next card.
+    These regions are the stripes of the card, only the stripes are
+    blitted.
+
+    :param size: The size of the surface of the pile.
+    :param positions: The position of each card of the pile, from the bottom.
+    :param card_back: The surface of the card back.
+    :param border_radius: The radius of the rounded corners of the card back.
+    :param layout: What the pile was created for, used to find out whether
+        it must be created again.
+    """
+
+    def __init__(
+        self,
+        size: tuple[int, int],
+        positions: list[tuple[int, int]],
+        card_back: pygame.Surface,
+        border_radius: int,
+        layout: tuple,
+    ) -> None:
+        self.positions = positions
+        self.card_back = card_back
+        self.layout = layout
+        self.surface = pygame.Surface(size, pygame.SRCALPHA)
+        # Number of cards whose stripes are on the surface
+        self.n_cards = 0
+
+        # The stripes of all the cards, each stripe is the region where
+        # it is blitted and the area of the card back
+        self.stripes: list[tuple[pygame.Rect, pygame.Rect]] = []
+        # Index in the stripes where the stripes of each card start
+        self.starts = [0]
+        r = border_radius
+        card_size = card_back.get_size()
+        for pos, next_pos in zip(positions, positions[1:]):
+            rect = pygame.Rect(pos, card_size)
+            next_rect = pygame.Rect(next_pos, card_size)
+            regions = [
+                # Left and below the next card
+                (rect.left, rect.top, next_rect.left - rect.left, rect.height),
+                (
+                    rect.left,
+                    next_rect.bottom,
+                    rect.width,
+                    rect.bottom - next_rect.bottom,
+                ),
+                # Rounded corners of the next card
+                (next_rect.left, next_rect.top, r, r),
+                (next_rect.right - r, next_rect.top, r, r),
+                (next_rect.left, next_rect.bottom - r, r, r),
+                (next_rect.right - r, next_rect.bottom - r, r, r),
+            ]
+            for region in regions:
+                region = rect.clip(region)
+                if region.width > 0 and region.height > 0:
+                    self.stripes.append((region, region.move(-rect.left, -rect.top)))
+            self.starts.append(len(self.stripes))
+        self.regions = [region for region, _ in self.stripes]
+
+    def update(self, n_cards: int) -> pygame.Surface:
+        """Show the edges of the first cards of the pile.
+
+        Only the stripes of the cards added or removed since the last
+        update are drawn.
+
+        :arg n_cards: The number of cards whose edges are shown.
+        :return surface: The surface with the edges, updated in place.
+        """
+        n_cards = min(n_cards, len(self.starts) - 1)
+        start, end = self.starts[self.n_cards], self.starts[n_cards]
+        if n_cards > self.n_cards:
+            self.surface.blits(
+                [
+                    (self.card_back, region, area)
+                    for region, area in self.stripes[start:end]
+                ]
+            )
+        elif n_cards < self.n_cards:
+            # Clear the removed stripes and redraw the remaining ones
+            dirty = merge_rects(self.regions[end:start])
+            for rect in dirty:
+                self.surface.set_clip(rect)
+                self.surface.fill((0, 0, 0, 0))
+                self.surface.blits(
+                    [
+                        (self.card_back, *self.stripes[i])
+                        for i in rect.collidelistall(self.regions)
+                        if i < end
+                    ]
+                )
+            self.surface.set_clip(None)
+        self.n_cards = n_cards
+        return self.surface
 
 
 class Deck(CardBackOwner):
@@ -88,6 +165,9 @@ class Deck(CardBackOwner):
     A deck simply shows its back.
     """
 
+    # The edges of the hidden cards, see PileEdges
+    _edges: PileEdges | None = None
+
     def __init__(
         self,
         *args,
@@ -108,34 +188,55 @@ class Deck(CardBackOwner):
 
     @cached_property
     def surface(self) -> pygame.Surface:
-        """Should make a pile of cards."""
-        surf = pygame.Surface(self.size, pygame.SRCALPHA)
+        """Should make a pile of cards.
 
-        # Calculate positions for the cards
-        x_positions = linspace(
-            0,
-            self.size[0] - self.card_size[0],
-            self.max_cards or len(self.cardset),
-            dtype=int,
-        )
-        y_positions = linspace(
-            self.size[1] - self.card_size[1],
-            0,
+        Only the top card is fully visible, the cards under it only show
+        their edges.
+        When the cards are hidden, the edges are kept on a separate surface
+        updated when cards are added or drawn, so the pile costs a single
+        blit of the top card whatever the number of cards.
+        """
+        edges = self._pile_edges()
+        if self.visible:
+            return self.compose_cards(edges.positions)
+
+        n_cards = min(len(self.cardset), len(edges.positions))
+        surf = edges.update(max(n_cards - 1, 0)).copy()
+        if n_cards:
+            surf.blit(self.card_back, edges.positions[n_cards - 1])
+        return surf
+
+    def _pile_edges(self) -> PileEdges:
+        """The edges of the pile, created again if the layout changed."""
+        layout = (
+            tuple(self.size),
+            tuple(self.card_size),
+            self.card_border_radius,
             self.max_cards or len(self.cardset),
-            dtype=int,
+            self.card_back,
         )
-
-        # Blit all cards at their positions
-        for card, x, y in zip(self.cardset, x_positions, y_positions):
-            surf.blit(
-                card.graphics.surface if self.visible else self.card_back,
-                (x, y)
-                # (
-                #    (self.size[0] - self.card_size[0]) // 2,
-                #    (self.size[1] - self.card_size[1]) // 2,
-                # ),
+        if self._edges is None or self._edges.layout != layout:
+            # Calculate positions for the cards
+            x_positions = linspace(
+                0,
+                self.size[0] - self.card_size[0],
+                self.max_cards or len(self.cardset),
+                dtype=int,
             )
-        return surf
+            y_positions = linspace(
+                self.size[1] - self.card_size[1],
+                0,
+                self.max_cards or len(self.cardset),
+                dtype=int,
+            )
+            self._edges = PileEdges(
+                self.size,
+                [(int(x), int(y)) for x, y in zip(x_positions, y_positions)],
+                self.card_back,
+                self.card_border_radius,
+                layout,
+            )
+        return self._edges
 
     def get_card_at(self, pos: tuple[int, int]) -> AbstractCard | None:
         if self.cardset:
@@ -2,9 +2,11 @@
 
 
 from enum import auto
-from math import sqrt
+
+import numpy
 import pygame
 
+from pygame_cards.cache import SurfaceCache
 from pygame_cards.utils import AutoName
 
 
@@ -47,6 +49,28 @@ def outer_border(
     return s
 
 
+#: The halos already computed by :py:func:`outer_halo`
+halo_cache = SurfaceCache(max_bytes=16 * 1024 * 1024, name="halo")
+
+
+def _halo_decay(distances: numpy.ndarray, radius: int, decay: Decay) -> numpy.ndarray:
+    """Decay of the halo at the distances from the inner surface.
+
+    When distance = 0, decay = 0, and distance = radius, decay = 1
+    """
+    match decay:
+        case Decay.LINEAR:
+            return numpy.clip(distances / radius, 0, 1)
+        case Decay.QUADRATIC:
+            # a*x**2 + c
+            a = 1.0 / radius**2
+            return 1 - a * (numpy.minimum(distances, radius) - radius) ** 2
+        case Decay.NONE:
+            return numpy.ones_like(distances)
+        case _:
+            raise NotImplementedError(f"{decay = } not implemented.")
+
+
 def outer_halo(
     inner_surface: pygame.Surface,
     radius: int = 20,
@@ -57,6 +81,11 @@ def outer_halo(
 ) -> pygame.Surface:
     """Create a halo around the card.
 
+    Only the size of the inner surface is used, so halos are stored
+    in the :py:data:`halo_cache` and computed only once for the
+    same parameters.
+    The returned surface is shared, copy it before drawing on it.
+
     :arg radius: The radius of the halo in pixels.
     :arg fill_inside: If false, it is transparent where the card is.
         Else, fill with the inner_color.
@@ -67,67 +96,71 @@ def outer_halo(
     inner_size = inner_surface.get_size()
     inner_size = (int(inner_size[0]), int(inner_size[1]))
     radius = int(radius)
-    surf = pygame.Surface(
-        (inner_size[0] + 2 * radius, inner_size[1] + 2 * int(radius)),
-        pygame.SRCALPHA,
+    inner_color, outer_color = pygame.Color(inner_color), pygame.Color(outer_color)
+    key = (
+        inner_size,
+        radius,
+        tuple(inner_color),
+        tuple(outer_color),
+        decay,
+        fill_inside,
     )
+
+    surf = halo_cache.get(key)
+    if surf is None:
+        surf = _compute_outer_halo(
+            inner_size, radius, inner_color, outer_color, decay, fill_inside
+        )
+        halo_cache.put(key, surf)
+    return surf
+
+
+def _compute_outer_halo(
+    inner_size: tuple[int, int],
+    radius: int,
+    inner_color: pygame.Color,
+    outer_color: pygame.Color,
+    decay: Decay,
+    fill_inside: bool,
+) -> pygame.Surface:
+    """Compute the surface of :py:func:`outer_halo` ."""
+    w, h = inner_size
+    surf = pygame.Surface((w + 2 * radius, h + 2 * radius), pygame.SRCALPHA)
     if fill_inside:
         surf.fill(inner_color, pygame.Rect(radius, radius, *inner_size))
-    # A line with the pixel values for the halo, the value will be between 0 and radius
-    # When x = 0, decay = 0, and x= radius, decay = 1
-    match decay:
-        case Decay.LINEAR:
-            decay_func = lambda x: min(max(x / radius, 0), 1)
-        case Decay.QUADRATIC:
-            # a*x**2 + c
-            a = 1.0 / radius**2
-            decay_func = lambda x: 1 - a * (min(x, radius) - radius) ** 2
-        case Decay.NONE:
-            decay_func = lambda x: 1
-        case _:
-            raise NotImplementedError(f"{decay = } not implemented.")
-
-    halo_colors = [
-        inner_color.lerp(outer_color, decay_func(i)) for i in range(int(radius))
-    ]
-    # A line surface to put the halo on
-    line_surf = pygame.Surface((int(radius), 1), pygame.SRCALPHA)
-    for i, c in enumerate(halo_colors):
-        line_surf.set_at((i, 0), c)
-
-    blit_right = [
-        (line_surf, (inner_size[0] + radius, i))
-        for i in range(radius, inner_size[1] + radius)
-    ]
-    surf.blits(blit_right)
-
-    line_surf = pygame.transform.rotate(line_surf, 90)
-    blit_top = [(line_surf, (i, 0)) for i in range(radius, inner_size[0] + radius)]
-    surf.blits(blit_top)
-
-    line_surf = pygame.transform.rotate(line_surf, 90)
-    blit_left = [(line_surf, (0, i)) for i in range(radius, inner_size[1] + radius)]
-    surf.blits(blit_left)
-
-    line_surf = pygame.transform.rotate(line_surf, 90)
-    blit_bot = [
-        (line_surf, (i, radius + inner_size[1]))
-        for i in range(radius, inner_size[0] + radius)
-    ]
-    surf.blits(blit_bot)
-
-    # Now do the same for the edge but it is 2D
-    coords = sum([[(i, j) for i in range(radius)] for j in range(radius)], start=[])
-    rads = [sqrt(i**2 + j**2) for i, j in coords]
-    angle_surf = pygame.Surface((radius, radius), pygame.SRCALPHA)
-    for coord, r in zip(coords, rads):
-        angle_surf.set_at(coord, inner_color.lerp(outer_color, decay_func(r)))
-    surf.blit(angle_surf, (inner_size[0] + radius, inner_size[1] + radius))
-    angle_surf = pygame.transform.rotate(angle_surf, 90)
-    surf.blit(angle_surf, (inner_size[0] + radius, 0))
-    angle_surf = pygame.transform.rotate(angle_surf, 90)
-    surf.blit(angle_surf, (0, 0))
-    angle_surf = pygame.transform.rotate(angle_surf, 90)
-    surf.blit(angle_surf, (0, inner_size[1] + radius))
+    if radius <= 0:
+        return surf
+
+    inner_rgba = numpy.array(inner_color, dtype=float)
+    outer_rgba = numpy.array(outer_color, dtype=float)
+
+    def halo_colors(distances: numpy.ndarray) -> numpy.ndarray:
+        # Same as pygame.Color.lerp, but for all the distances
+        t = _halo_decay(distances, radius, decay)[..., None]
+        return numpy.floor(inner_rgba * (1 - t) + outer_rgba * t + 0.5)
+
+    # Colors from the inner surface to the outside, for the sides
+    line = halo_colors(numpy.arange(radius, dtype=float))
+    # Colors of the bottom right angle, the other are symmetric
+    i = numpy.arange(radius)
+    angle = halo_colors(numpy.sqrt(i[:, None] ** 2 + i[None, :] ** 2))
+
+    pixels = pygame.surfarray.pixels3d(surf)
+    alpha = pygame.surfarray.pixels_alpha(surf)
+    for region, colors in [
+        # Sides
+        ((slice(w + radius, None), slice(radius, h + radius)), line[:, None]),
+        ((slice(None, radius), slice(radius, h + radius)), line[::-1, None]),
+        ((slice(radius, w + radius), slice(None, radius)), line[None, ::-1]),
+        ((slice(radius, w + radius), slice(h + radius, None)), line[None, :]),
+        # Angles
+        ((slice(w + radius, None), slice(h + radius, None)), angle),
+        ((slice(w + radius, None), slice(None, radius)), angle[:, ::-1]),
+        ((slice(None, radius), slice(None, radius)), angle[::-1, ::-1]),
+        ((slice(None, radius), slice(h + radius, None)), angle[::-1, :]),
+    ]:
+        pixels[region] = colors[..., :3]
+        alpha[region] = colors[..., 3]
+    del pixels, alpha
 
     return surf
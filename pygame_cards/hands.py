@@ -1,18 +1,36 @@
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
 from enum import auto
 from functools import cached_property
 import logging
 from math import cos, sin, sqrt
 import math
+import weakref
 
 import pygame
 
 from pygame_cards.abstract import AbstractCard
+from pygame_cards.cache import SurfaceCache
 from pygame_cards.utils import AutoName
 from pygame_cards.effects import outer_halo
 from pygame_cards.set import CardsSet, CardsetGraphic
 from pygame_cards import constants
 
 
+#: Rotated surfaces of the cards, shared by all the :py:class:`RoundedHand`
+rotation_cache = SurfaceCache(max_bytes=32 * 1024 * 1024, name="rotation")
+# The ids of the source surfaces whose deletion is watched
+_rotation_sources: set[int] = set()
+
+
+def _forget_rotations(surface_id: int) -> None:
+    """Remove the rotations of a surface that does not exist anymore."""
+    _rotation_sources.discard(surface_id)
+    for key in rotation_cache.keys():
+        if key[0] == surface_id:
+            rotation_cache.discard(key)
+
+
 class CardOverlap(AutoName):
     """How card overlap in the hand."""
 
@@ -20,6 +38,71 @@ class CardOverlap(AutoName):
     right = auto()
 
 
+@dataclass
+class FanGeometry:
+    """Where the cards of a :py:class:`RoundedHand` are.
+
+    The positions are from the bottom left of the hand, with the y axis
+    going up.
+    The angles are from the vertical, positive on the right
+    (Unit: Degrees).
+
+    :param center: The center of the circle on which the card centers are.
+    :param radius: The radius of that circle.
+    :param card_diagonal: The length of the diagonal of the cards.
+    :param card_width: The width of the cards.
+    :param angles: The angle of each card, increasing.
+    :param angle_step: The angle between two cards, before rounding.
+    """
+
+    center: tuple[float, float]
+    radius: float
+    card_diagonal: float
+    card_width: float
+    angles: list[float]
+    angle_step: float
+
+    def card_index_at(self, pos: tuple[float, float]) -> int | None:
+        """Return the index of the card on top at the position, None if no card."""
+        dx, dy = pos[0] - self.center[0], pos[1] - self.center[1]
+        dist_to_center = sqrt(dx**2 + dy**2)
+        if (
+            not self.angles
+            or dist_to_center > self.radius + self.card_diagonal / 2
+            or dist_to_center < self.radius - self.card_diagonal / 2
+        ):
+            return None
+
+        # A card is at the position if the position is closer than half a
+        # card width to the line from the center through the card center.
+        # So the angle of the card must be close to the angle of the position.
+        half_width = self.card_width / 2
+        if dist_to_center <= half_width:
+            index = len(self.angles) - 1
+        else:
+            tolerance = math.degrees(math.asin(half_width / dist_to_center))
+            max_angle = math.degrees(math.atan2(dx, dy)) + tolerance
+            # Last card with an angle smaller than the max angle
+            index = len(self.angles) - 1
+            if self.angle_step:
+                index = math.floor((max_angle - self.angles[0]) / self.angle_step)
+                index = min(max(index, 0), len(self.angles) - 1)
+            # Correct for the rounding of the angles
+            while index + 1 < len(self.angles) and self.angles[index + 1] < max_angle:
+                index += 1
+            while index >= 0 and self.angles[index] >= max_angle:
+                index -= 1
+
+        # Verify the candidate and the card under it
+        for candidate in [index, index - 1]:
+            if candidate < 0:
+                break
+            angle = math.radians(self.angles[candidate])
+            if abs(dx * cos(angle) - dy * sin(angle)) < half_width:
+                return candidate
+        return None
+
+
 class BaseHand(CardsetGraphic):
     """A base class for a hand.
 
@@ -30,6 +113,9 @@ class BaseHand(CardsetGraphic):
         which is the standard in card games.
         This also implies that the cards are located at the opposite side
         of their overlap.
+    :param n_scales: The number of surfaces that were rescaled.
+    :param n_avoided_scales: The number of surfaces that could be used
+        without rescaling them. Useful for profiling.
 
 
     """
@@ -40,9 +126,57 @@ class BaseHand(CardsetGraphic):
         overlap_hide: CardOverlap = CardOverlap.right,
         **kwargs,
     ):
+        self.n_scales = 0
+        self.n_avoided_scales = 0
+        # Rescaled surfaces of the cards: {card: (card_surface, scaled_surface)}
+        self._scaled_surfaces: dict[
+            AbstractCard, tuple[pygame.Surface, pygame.Surface]
+        ] = {}
         super().__init__(*args, **kwargs)
         self.overlap_hide = overlap_hide
 
+    def clear_cache(self) -> None:
+        super().clear_cache()
+        # Forget the cards that are not in the hand anymore
+        cards = set(self.cardset)
+        self._scaled_surfaces = {
+            card: surfaces
+            for card, surfaces in self._scaled_surfaces.items()
+            if card in cards
+        }
+
+    def _fit(
+        self, surface: pygame.Surface, size: tuple[float, float]
+    ) -> pygame.Surface:
+        """Rescale the surface to the size, only if it has another size."""
+        size = (int(size[0]), int(size[1]))
+        if surface.get_size() == size:
+            self.n_avoided_scales += 1
+            return surface
+        self.n_scales += 1
+        return pygame.transform.scale(surface, size)
+
+    def card_surface(self, card: AbstractCard) -> pygame.Surface:
+        """The surface of the card with the card size of the hand.
+
+        The surface of the card is used directly if it has already the
+        card size. Else the rescaled surface is kept in the hand until the
+        surface of the card changes.
+        """
+        surface = card.graphics.surface
+        scaled = self._scaled_surfaces.get(card)
+        if (
+            scaled is not None
+            and scaled[0] is surface
+            and scaled[1].get_size() == (int(self.card_size[0]), int(self.card_size[1]))
+        ):
+            self.n_avoided_scales += 1
+            return scaled[1]
+        fitted = self._fit(surface, self.card_size)
+        if fitted is not surface:
+            self._scaled_surfaces[card] = (surface, fitted)
+        return fitted
+
 
 class AlignedHand(BaseHand):
     """A hand of card with all the cards aligned.
@@ -66,22 +200,25 @@ class AlignedHand(BaseHand):
         super().__init__(*args, **kwargs)
         self.card_spacing = card_spacing
 
+    def clear_cache(self) -> None:
+        self.__dict__.pop("x_positions", None)
+        super().clear_cache()
+
     @cached_property
     def surface(self) -> pygame.Surface:
         """The surface of the hand."""
-        surf = pygame.Surface(self.size, pygame.SRCALPHA)
-
-        x_positions, offset = self.calculate_x_positions()
+        y_position = self.calculate_y_position()
 
-        for i, (card, x_pos) in enumerate(zip(self.cardset, x_positions)):
-            self.logger.debug(f"{card}")
-            card_surf = card.graphics.surface
-            card_surf = pygame.transform.scale(card_surf, self.card_size)
+        return self.compose_cards([(x_pos, y_position) for x_pos in self.x_positions])
 
-            self.logger.debug(f"{card=},{x_pos=}")
-            surf.blit(card_surf, (x_pos, self.calculate_y_position()))
+    @cached_property
+    def x_positions(self) -> list[float]:
+        """The x position of each card, see :py:meth:`calculate_x_positions` .
 
-        return surf
+        Increasing if the overlap hides the right cards, decreasing else.
+        """
+        x_positions, _ = self.calculate_x_positions()
+        return x_positions
 
     def remove_card(self, card: AbstractCard) -> None:
         super().remove_card(card)
@@ -118,81 +255,70 @@ class AlignedHand(BaseHand):
             else self.size[0] - self.card_size[0] - x_pos
             for x_pos in x_positions
         ]
-        self.logger.debug(f"{x_positions=}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"{x_positions=}")
 
         return x_positions, offset
 
+    def render_hovered_sprite(
+        self, card: AbstractCard, radius: float = 20, **kwargs
+    ) -> tuple[pygame.Surface, tuple[float, float]]:
+        """The hovered card with a halo around it.
+
+        :arg radius: The radius of the halo.
+        :arg kwargs: Passed to :py:func:`~pygame_cards.effects.outer_halo` .
+        """
+        index = self.cardset.index(card)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"{index=}")
+        x_pos = self.x_positions[index]
+
+        card.graphics.size = self.card_size
+        card_surf = self.card_surface(card)
+        highlighted_surf = self._fit(
+            outer_halo(card_surf, radius=radius, **kwargs),
+            (self.card_size[0] + 2 * radius, self.card_size[1] + 2 * radius),
+        )
+        sprite = pygame.Surface(highlighted_surf.get_size(), pygame.SRCALPHA)
+        sprite.blit(highlighted_surf, (0, 0))
+        sprite.blit(card_surf, (radius, radius))
+        return sprite, (x_pos - radius, self.calculate_y_position() - radius)
+
     def with_hovered(
         self, card: AbstractCard | None, radius: float = 20, **kwargs
     ) -> pygame.Surface:
         if card is None:
             return pygame.Surface((0, 0))
-        index = self.cardset.index(card)
-        self.logger.debug(f"{index=}")
-        x_posistions, _ = self.calculate_x_positions()
-        x_pos = x_posistions[index]
-
-        card.graphics.size = self.card_size
-        highlighted_surf = outer_halo(card.graphics.surface, radius=radius, **kwargs)
-        # assume the center will be on it
+        sprite, position = self.render_hovered_sprite(card, radius=radius, **kwargs)
         out_surf = pygame.Surface(self.size, pygame.SRCALPHA)
-        highlighted_surf = pygame.transform.scale(
-            highlighted_surf,
-            (self.card_size[0] + 2 * radius, self.card_size[1] + 2 * radius),
-        )
-        out_surf.blit(
-            highlighted_surf,
-            (x_pos - radius, self.calculate_y_position() - radius),
-        )
-        out_surf.blit(
-            card.graphics.surface,
-            (x_pos, self.calculate_y_position()),
-        )
+        out_surf.blit(sprite, position)
         return out_surf
 
     def get_card_at(self, pos: tuple[int, int]) -> AbstractCard | None:
-        s = self.surface.get_size()
-        if not (pos[0] < s[0] and pos[1] < s[1]):
-            self.logger.error(f"get_card_at({pos=}) not in {s}.")
+        if not (pos[0] < int(self.size[0]) and pos[1] < int(self.size[1])):
+            self.logger.error(f"get_card_at({pos=}) not in {self.size}.")
             return None
 
-        x_positions, offset = self.calculate_x_positions()
-        self.logger.debug(f"get_card_at({pos=}): {x_positions=}, {self.overlap_hide=}")
-
-        # TODO: make this work
-        for card_index, x_pos in enumerate(x_positions):
-            if pos[0] < x_pos or pos[0] > x_pos + self.card_size[0]:
-                self.logger.debug(
-                    f"get_card_at({pos=}):: {card_index=} is not Between the card"
-                    " boundaries"
-                )
-                continue
-            if (
-                self.overlap_hide == CardOverlap.right
-                # Check that is not under the next card
-                and pos[0] - x_pos
-                > self.card_size[0] + self.card_spacing * self.card_size[0]
-            ) or (
-                self.overlap_hide == CardOverlap.left
-                and pos[0] - x_pos < self.card_spacing * self.card_size[0]
-            ):
-                self.logger.debug(
-                    f"get_card_at({pos=}):: {card_index=} is  going to be under the"
-                    " next card"
-                )
-                continue
-            if x_pos - pos[0] > self.card_size[0] + offset:
-                self.logger.debug(f"get_card_at({pos=}): is in offset.")
-                continue  # Between two cards, in the offset
-
-            self.logger.debug(f"get_card_at({pos=}): found index {card_index}.")
-            return self.cardset[card_index]
+        x_positions = self.x_positions
+        width = self.card_size[0]
+        spacing = self.card_spacing * width
+        if self.overlap_hide == CardOverlap.right:
+            # Positions are increasing, find the first card starting
+            # after pos - width, where the next card does not hide it
+            index = bisect_left(x_positions, pos[0] - min(width, width + spacing))
+            if index < len(x_positions) and x_positions[index] <= pos[0]:
+                return self.cardset[index]
+        else:
+            # Positions are decreasing
+            index = bisect_left(x_positions, max(spacing, 0) - pos[0], key=lambda x: -x)
+            if index < len(x_positions) and x_positions[index] >= pos[0] - width:
+                return self.cardset[index]
 
         return None
 
     def get_card_positions(self) -> dict[AbstractCard, tuple[int, int]]:
         y = self.calculate_y_position()
-        xs, _ = self.calculate_x_positions()
+        xs = self.x_positions
 
         return {card: (x, y) for card, x in zip(self.cardset, xs)}
 
@@ -209,13 +335,27 @@ class RoundedHand(BaseHand):
         If 0, the cards are all aligned.
         If not zero, the cards will be placed on an arc of a circle
         with the given angle.
-
+    :param angle_quantum: The angles of the cards are rounded to a
+        multiple of this value (Unit: Degrees).
+        This allows to reuse the rotated surfaces of the cards from the
+        :py:data:`rotation_cache` when the hand changes, but the cards
+        are then slightly off their exact angles.
+        If 0 (default), the angles are not rounded.
+
+    The cards are spread over the whole angle.
+    When cards are removed from the hand, the other cards stay on the
+    same grid of angles, such that most of them keep their angle and their
+    rotated surface: the fan gets narrower and is centered up to half
+    the angle between two cards.
+    The cards are spread again over the whole angle when cards are added
+    or reordered.
     """
 
     def __init__(
         self,
         *args,
         angle: float = 90,
+        angle_quantum: float = 0,
         **kwargs,
     ):
         if not "size" in kwargs:
@@ -224,6 +364,73 @@ class RoundedHand(BaseHand):
 
         super().__init__(*args, **kwargs)
         self.angle = angle
+        self.angle_quantum = angle_quantum
+        # The last layout of the fan: (cards, angle, angle_step, offset), with
+        # the offset of the center of the fan in half angle steps
+        self._fan: tuple[list[AbstractCard], float, float, int] | None = None
+
+    def _quantize(self, angle: float) -> float:
+        """Round the angle to the angle quantum."""
+        if not self.angle_quantum:
+            return angle
+        return round(angle / self.angle_quantum) * self.angle_quantum
+
+    def rotated_card_surface(self, card: AbstractCard, angle: float) -> pygame.Surface:
+        """The surface of the card rotated clockwise by the angle.
+
+        Rotated surfaces are kept in the :py:data:`rotation_cache` .
+        """
+        surface = self.card_surface(card)
+        # Keep no reference to the surface, its rotations are removed
+        # from the cache when it is deleted
+        surface_id = id(surface)
+        key = (surface_id, surface.get_size(), angle)
+        rotated = rotation_cache.get(key)
+        if rotated is None:
+            rotated = pygame.transform.rotate(surface, -angle)
+            rotation_cache.put(key, rotated)
+            if surface_id not in _rotation_sources:
+                _rotation_sources.add(surface_id)
+                weakref.finalize(surface, _forget_rotations, surface_id)
+        return rotated
+
+    def _fan_after_removal(self, cards: list[AbstractCard]) -> tuple[float, int] | None:
+        """The angle step and the offset of the center of the fan (in half
+        steps), if the cards can stay on the grid of angles of the last layout.
+
+        This is the case when cards were only removed since the last layout.
+        Of the offsets keeping the fan centered up to half a step, the one
+        keeping the angle of the most cards is chosen.
+        """
+        if self._fan is None:
+            return None
+        previous_cards, angle, angle_step, offset = self._fan
+        if angle != self.angle or len(cards) >= len(previous_cards):
+            return None
+        # Shift of the index of each card since the last layout
+        shifts: dict[int, int] = {}
+        previous = iter(enumerate(previous_cards))
+        for i, card in enumerate(cards):
+            for j, previous_card in previous:
+                if previous_card is card:
+                    shifts[j - i] = shifts.get(j - i, 0) + 1
+                    break
+            else:
+                # A card was added or the cards were reordered
+                return None
+        removed = len(previous_cards) - len(cards)
+
+        def new_offset(shift: int) -> int:
+            # The offset keeping the angle of the cards with that shift
+            return offset + 2 * shift - removed
+
+        centered = [
+            shift for shift in range(-1, removed + 2) if abs(new_offset(shift)) <= 1
+        ]
+        shift = max(
+            centered, key=lambda shift: (shifts.get(shift, 0), -abs(new_offset(shift)))
+        )
+        return angle_step, new_offset(shift)
 
     def _max_card_h(self) -> float:
         """Return the maximum height that a card can do in surface."""
@@ -232,21 +439,34 @@ class RoundedHand(BaseHand):
             + self.card_size[1] * self.card_size[1]
         )
 
-    @cached_property
-    def surface(self) -> pygame.Surface:
-        """The surface of the hand."""
-        surf = pygame.Surface(self.size, pygame.SRCALPHA)
+    def clear_cache(self) -> None:
+        self.__dict__.pop("geometry", None)
+        super().clear_cache()
 
-        if self.angle == 0 or len(self.cardset) == 0:
+    @cached_property
+    def geometry(self) -> FanGeometry:
+        """Where the cards are in the hand, computed once per layout."""
+        cards = list(self.cardset)
+        if self.angle == 0 or len(cards) <= 1:
             # Special cases, show aligned
-            angles = [0] * len(self.cardset)
+            angles = [0] * len(cards)
+            angle_step = 0
+            self._fan = None
         else:
-            angle_step = self.angle / (len(self.cardset) - 1)
-            self.logger.debug(f"{angle_step=}")
+            angle_step, offset = self._fan_after_removal(cards) or (
+                self.angle / (len(cards) - 1),
+                0,
+            )
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"{angle_step=}")
             # from the center, angle = 0, which is the central card and ref point.
+            # The angles are computed from integer half steps, such that the
+            # cards keeping their place on the grid get exactly the same angle
             angles = [
-                -self.angle / 2 + i * angle_step for i in range(len(self.cardset))
+                self._quantize((2 * i - (len(cards) - 1) + offset) * angle_step / 2)
+                for i in range(len(cards))
             ]
+            self._fan = (cards, self.angle, angle_step, offset)
         # Radius of the circle around the cards (from center to card centers)
         # Trust me, I am an engineer
         card_diagonal = sqrt(self.card_size[0] ** 2 + self.card_size[1] ** 2)
@@ -257,22 +477,36 @@ class RoundedHand(BaseHand):
             (self.size[1] - self.card_size[1] - card_diagonal / 2)
             / (1 - cos(math.radians(self.angle / 2))),
         )
-        self.logger.debug(f"{radius = }")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"{radius = }")
         # TODO: correct the angle if the radius is smaller than a threshold
 
-        # The center of the circle where cards centers are located
-        center_pos = (
-            self.size[0] / 2,
-            # Direclty under the middle card at radius dist
-            self.size[1] - radius - self.card_size[1] / 2,
+        return FanGeometry(
+            # The center of the circle where cards centers are located
+            center=(
+                self.size[0] / 2,
+                # Direclty under the middle card at radius dist
+                self.size[1] - radius - self.card_size[1] / 2,
+            ),
+            radius=radius,
+            card_diagonal=card_diagonal,
+            card_width=self.card_size[0],
+            angles=angles,
+            angle_step=angle_step,
         )
 
-        self.logger.debug(f"{angles=}")
+    @cached_property
+    def surface(self) -> pygame.Surface:
+        """The surface of the hand."""
+        surf = pygame.Surface(self.size, pygame.SRCALPHA)
+
+        geometry = self.geometry
+        angles = geometry.angles
+        radius = geometry.radius
+        center_pos = geometry.center
+
         rotated_surfs = [
-            pygame.transform.rotate(
-                pygame.transform.scale(card.graphics.surface, self.card_size),
-                -angle,
-            )
+            self.rotated_card_surface(card, angle)
             for card, angle in zip(self.cardset, angles)
         ]
         # Position the cards with their offset from the center
@@ -296,7 +530,9 @@ class RoundedHand(BaseHand):
             )
             for a, card_surf in zip(angles, rotated_surfs)
         ]
-        self.logger.debug(f"{card_positions=}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"{angles=}")
+            self.logger.debug(f"{card_positions=}")
 
         for card_surf, card_pos in zip(rotated_surfs, card_positions):
             surf.blit(
@@ -304,56 +540,17 @@ class RoundedHand(BaseHand):
                 card_pos,
             )
 
-        self._radius = radius
-        self._center_pos = center_pos
-        self._card_diagonal = card_diagonal
-        self._angles = angles
-
         return surf
 
     def get_card_at(self, pos: tuple[int, int]) -> AbstractCard | None:
         # We think pos1 from bottom instead of top
         if pos[0] < 0 or pos[1] < 0 or pos[0] > self.size[0] or pos[1] > self.size[1]:
-            self.logger.debug(f"{pos=} ut of bound")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"{pos=} ut of bound")
             return None
 
-        pos = (pos[0], self.size[1] - pos[1])
-        self.logger.debug(f"Converted {pos=}")
-        self.logger.debug(f"Center {self._center_pos=}")
-
-        dist_to_center = sqrt(
-            (pos[0] - self._center_pos[0]) ** 2 + (pos[1] - self._center_pos[1]) ** 2
-        )
-        self.logger.debug(f"{dist_to_center=}")
-        if (
-            dist_to_center > self._radius + self._card_diagonal / 2
-            or dist_to_center < self._radius - self._card_diagonal / 2
-        ):
-            self.logger.debug(f"{pos=} is not in radius range")
-            return None
-
-        for card, angle in zip(reversed(self.cardset), reversed(self._angles)):
-            # Reverse because cards at the end are over the previous
-            self.logger.debug(f"Check {card=} with {angle=}")
-            card_center = (
-                (self._center_pos[0] + sin(math.radians(angle)) * self._radius),
-                (self._center_pos[1] + cos(math.radians(angle)) * self._radius),
-            )
-            dist_to_card_center = sqrt(
-                (pos[0] - card_center[0]) ** 2 + (pos[1] - card_center[1]) ** 2
-            )
-            # Cosine theorem to find angle (center, card, pos)
-            # {\displaystyle a^{2}=c^{2}+b^{2}-2bc\cos \alpha }.
-            a = math.acos(
-                (dist_to_center**2 - dist_to_card_center**2 - self._radius**2)
-                / (-2 * dist_to_card_center * self._radius)
-            )
-            # Distance to the line from the center to the center of the card
-            dist_to_line = sin(a) * dist_to_card_center
-            self.logger.debug(f"Calculated {dist_to_line=}")
-            if dist_to_line < self.card_size[0] / 2:
-                return card
-        return None
+        index = self.geometry.card_index_at((pos[0], self.size[1] - pos[1]))
+        return None if index is None else self.cardset[index]
 
     def get_card_positions(self) -> dict[AbstractCard, tuple[int, int]]:
         # use aligned hand as a proxy
@@ -440,31 +637,18 @@ class VerticalPileGraphic(Pile):
             height = width / self.card_size[0] * self.card_size[1]
 
             self.card_size = (width, height)
-            self.logger.debug(f"setting card size to {self.card_size=}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"setting card size to {self.card_size=}")
 
     @cached_property
     def surface(self) -> pygame.Surface:
-        # Create the surface
-        surf = pygame.Surface(self.size, pygame.SRCALPHA)
-
-        # Calculate how we position the cards
-        n_cards = len(self.cardset)
-        if n_cards == 0:
-            return surf
-
-        self.logger.debug(f"{self.size=}, {self.card_size=}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"{self.size=}, {self.card_size=}")
 
         x_position = (self.size[0] - self.card_size[0]) / 2
 
         # Add the cards on the surface
-        surf.blits(
-            [
-                (card.graphics.surface, (x_position, y))
-                for card, y in zip(self.cardset, self.y_positions)
-            ],
-        )
-
-        return surf
+        return self.compose_cards([(x_position, y) for y in self.y_positions])
 
     @cached_property
     def y_positions(self) -> list[int]:
@@ -484,11 +668,10 @@ class VerticalPileGraphic(Pile):
         if not self.cardset:
             # No cards case
             return None
-        # Iterate over the cards and position to find the correct card
-
-        for card_idx in range(len(self.cardset)):
-            if pos[1] < self.y_positions[card_idx]:
-                return card_idx - 1
+        # The first card starting after the position
+        card_idx = bisect_right(self.y_positions, pos[1])
+        if card_idx < len(self.cardset):
+            return card_idx - 1
         if pos[1] < self.y_positions[-1] + self.card_size[1]:
             # Last card is on top
             return len(self.cardset) - 1
@@ -527,25 +710,10 @@ class HorizontalPileGraphic(Pile):
 
     @cached_property
     def surface(self) -> pygame.Surface:
-        # Create the surface
-        surf = pygame.Surface(self.size, pygame.SRCALPHA)
-
-        # Calculate how we position the cards
-        n_cards = len(self.cardset)
-        if n_cards == 0:
-            return surf
-
         y_position = (self.size[1] - self.card_size[1]) / 2
 
         # Add the cards on the surface
-        surf.blits(
-            [
-                (card.graphics.surface, (x, y_position))
-                for card, x in zip(self.cardset, self.x_positions)
-            ],
-        )
-
-        return surf
+        return self.compose_cards([(x, y_position) for x in self.x_positions])
 
     @cached_property
     def x_positions(self) -> list[int]:
@@ -566,11 +734,10 @@ class HorizontalPileGraphic(Pile):
         if not self.cardset:
             # No cards case
             return None
-        # Iterate over the cards and position to find the correct card
-
-        for card_idx in range(len(self.cardset)):
-            if pos[0] < self.x_positions[card_idx]:
-                return card_idx - 1
+        # The first card starting after the position
+        card_idx = bisect_right(self.x_positions, pos[0])
+        if card_idx < len(self.cardset):
+            return card_idx - 1
         if pos[0] < self.x_positions[-1] + self.card_size[0]:
             # Last card is on top
             return len(self.cardset) - 1
@@ -1,3 +1,4 @@
+from dataclasses import fields
 import logging
 from types import NoneType
 from typing import Any
@@ -18,7 +19,8 @@ def to_json(object: Any):
 
 
 def key_to_json(key: Any) -> Any:
-    _logger.debug(f"key_to_json: Converting {key}")
+    if _logger.isEnabledFor(logging.DEBUG):
+        _logger.debug(f"key_to_json: Converting {key}")
     try:
         key = str(key)
         return key
@@ -28,8 +30,11 @@ def key_to_json(key: Any) -> Any:
 
 def item_to_json(item: Any) -> Any:
     """Convert an item to a json."""
-    _logger.debug(f"item_to_json: Converting type {type(item)} ")
-    _logger.debug(f"item_to_json: Converting {item} ")
+    # Formatting the items is expensive, only do it when logged
+    debug = _logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        _logger.debug(f"item_to_json: Converting type {type(item)} ")
+        _logger.debug(f"item_to_json: Converting {item} ")
     if isinstance(item, (int, str, float, bool, NoneType)):
         json_item = item
     elif isinstance(item, dict):
@@ -37,21 +42,34 @@ def item_to_json(item: Any) -> Any:
     elif isinstance(item, list):
         json_item = list_to_json(item)
     elif isinstance(item, AbstractCard):
-        json_item = dic_to_json(item.__dict__)
+        json_item = dic_to_json(card_attributes(item))
         json_item.pop("u_id")  # Remove the id as will not be used in json
     elif isinstance(item, logging.Logger):
         json_item = None
     elif hasattr(item, "__dict__"):
-        _logger.debug(f"item_to_json: Found __dict__, now try converting {item} ")
+        if debug:
+            _logger.debug(f"item_to_json: Found __dict__, now try converting {item} ")
         json_item = dic_to_json(item.__dict__)
     else:
         _logger.exception(f"No conversion defined for object {item}")
         json_item = None
-    _logger.debug(f"item_to_json: converted {item} to {json_item}")
+    if debug:
+        _logger.debug(f"item_to_json: converted {item} to {json_item}")
 
     return json_item
 
 
+def card_attributes(card: AbstractCard) -> dict[str, Any]:
+    """The attributes of a card, stored in slots or in its `__dict__` ."""
+    attributes = {
+        field.name: getattr(card, field.name)
+        for field in fields(card)
+        if hasattr(card, field.name)
+    }
+    attributes.update(getattr(card, "__dict__", {}))
+    return attributes
+
+
 def dic_to_json(dic: dict) -> dict:
     """Convert a dictionary to another python dictionary.
 
@@ -1,8 +1,8 @@
 """Game Manager for cards in pygame."""
 from dataclasses import dataclass
 import logging
-import random
-from typing import Callable
+from typing import Callable, Iterable
+import warnings
 
 import pygame
 from pygame_cards.abstract import AbstractCard as Card
@@ -19,6 +19,9 @@ from pygame_cards.hands import (
 
 from pygame_cards.set import CardsSet
 from pygame_cards.effects import Decay, outer_halo
+from pygame_cards.physics import CardParticles
+from pygame_cards.profiling import profiler
+from pygame_cards.utils import SpatialGrid, merge_rects
 
 
 @dataclass
@@ -52,6 +55,201 @@ class CardSetRights:
             self.draggable_out = lambda card: drag_out
 
 
+@dataclass
+class ManagedCardSet:
+    """What the manager knows about a card set graphics it manages.
+
+    :param card_set: The card set graphics.
+    :param position: The position of the set on screen.
+    :param rights: What the manager can do with the set.
+    :param z_order: The order in which the set is drawn, the sets with
+        larger values are on top. Sets with the same value are drawn in
+        the order they were added.
+        Change it with :py:meth:`CardsManager.set_z_order` .
+    :param bounds: The region of the screen covered by the set.
+    """
+
+    card_set: CardsetGraphic
+    position: tuple[int, int]
+    rights: CardSetRights
+    z_order: int
+    bounds: pygame.Rect
+
+
+class DragSprite:
+    """The cards being dragged, pre-rendered tilted at different angles.
+
+    Rotating the surface of the dragged cards every frame is expensive,
+    especially for a stack of cards.
+    Instead, the frames are rendered once when the drag starts and the
+    frame with the closest angle is shown.
+
+    :param surface: The surface of the dragged cards.
+    :param max_angle: The maximum tilt angle (Unit: Degrees).
+        Larger angles are shown with the maximum angle.
+    :param angle_step: The angle between two frames (Unit: Degrees).
+    """
+
+    def __init__(
+        self,
+        surface: pygame.Surface,
+        max_angle: float = 30,
+        angle_step: float = 5,
+    ) -> None:
+        self.angle_step = angle_step
+        self.n_steps = int(max_angle // angle_step) if angle_step else 0
+        self.frames = [
+            surface if i == 0 else pygame.transform.rotate(surface, -i * angle_step)
+            for i in range(-self.n_steps, self.n_steps + 1)
+        ]
+
+    def frame(self, angle: float) -> tuple[pygame.Surface, float]:
+        """Return the frame the closest to the angle and its angle."""
+        step = round(angle / self.angle_step) if self.angle_step else 0
+        step = min(max(step, -self.n_steps), self.n_steps)
+        return self.frames[step + self.n_steps], step * self.angle_step
+
+
+def ease_out(t: float) -> float:
+    """Quadratic easing, fast at the start and slow at the end."""
+    return 1 - (1 - t) ** 2
+
+
+class CardAnimation:
+    """A card moving from a set to another.
+
+    The card is in none of the sets while it moves, so the surfaces of the
+    sets are not redrawn during the move.
+
+    :param card: The card moving.
+    :param from_set: The set the card comes from.
+    :param to_set: The set where the card goes.
+    :param start: The position where the card starts on the screen.
+    :param end: The position where the card stops on the screen.
+    :param duration: The duration of the move (Unit: ms).
+    :param easing: A function of the proportion of the time elapsed giving
+        the proportion of the path done.
+    """
+
+    def __init__(
+        self,
+        card: Card,
+        from_set: CardsetGraphic,
+        to_set: CardsetGraphic,
+        start: tuple[float, float],
+        end: tuple[float, float],
+        duration: float = 300,
+        easing: Callable[[float], float] = ease_out,
+    ) -> None:
+        self.card = card
+        self.from_set = from_set
+        self.to_set = to_set
+        self.start = start
+        self.end = end
+        self.duration = duration
+        self.easing = easing
+        self.elapsed = 0.0
+
+    @property
+    def done(self) -> bool:
+        return self.elapsed >= self.duration
+
+    @property
+    def position(self) -> tuple[float, float]:
+        """The current position of the card on the screen."""
+        t = self.easing(min(self.elapsed / self.duration, 1) if self.duration else 1)
+        return (
+            self.start[0] + (self.end[0] - self.start[0]) * t,
+            self.start[1] + (self.end[1] - self.start[1]) * t,
+        )
+
+    @property
+    def rect(self) -> pygame.Rect:
+        """The region covered by the card on the screen."""
+        return pygame.Rect(self.position, self.card.graphics.surface.get_size())
+
+
+class _CardSetsView(list):
+    """The managed sets, as returned by :py:attr:`CardsManager.card_sets` .
+
+    Changing the list is deprecated. For compatibility, adding and
+    removing sets are still forwarded to the manager, the added sets are
+    shown at the top left of the screen.
+    Other changes only change this list.
+    """
+
+    def __init__(self, manager: "CardsManager", card_sets: Iterable[CardsetGraphic]):
+        super().__init__(card_sets)
+        self._manager = manager
+
+    def _warn(self, method: str, effect: str = "") -> None:
+        warnings.warn(
+            f"Changing CardsManager.card_sets with {method}() is deprecated{effect},"
+            " use add_set(), remove_set() and set_z_order() instead.",
+            DeprecationWarning,
+            stacklevel=3,
+        )
+
+    def append(self, card_set: CardsetGraphic) -> None:
+        self._warn("append")
+        self._manager.add_set(card_set, (0, 0))
+        super().append(card_set)
+
+    def extend(self, card_sets: Iterable[CardsetGraphic]) -> None:
+        self._warn("extend")
+        for card_set in card_sets:
+            self._manager.add_set(card_set, (0, 0))
+            super().append(card_set)
+
+    def __iadd__(self, card_sets: Iterable[CardsetGraphic]) -> "_CardSetsView":
+        self._warn("+=")
+        for card_set in card_sets:
+            self._manager.add_set(card_set, (0, 0))
+            super().append(card_set)
+        return self
+
+    def insert(self, index: int, card_set: CardsetGraphic) -> None:
+        self._warn("insert")
+        self._manager.add_set(card_set, (0, 0))
+        super().insert(index, card_set)
+
+    def remove(self, card_set: CardsetGraphic) -> None:
+        self._warn("remove")
+        super().remove(card_set)
+        self._manager.remove_set(card_set)
+
+    def pop(self, index: int = -1) -> CardsetGraphic:
+        self._warn("pop")
+        card_set = super().pop(index)
+        self._manager.remove_set(card_set)
+        return card_set
+
+    def __delitem__(self, index: int | slice) -> None:
+        self._warn("del")
+        removed = self[index] if isinstance(index, slice) else [self[index]]
+        super().__delitem__(index)
+        for card_set in removed:
+            self._manager.remove_set(card_set)
+
+    def clear(self) -> None:
+        self._warn("clear")
+        for card_set in self:
+            self._manager.remove_set(card_set)
+        super().clear()
+
+    def __setitem__(self, index, value) -> None:
+        self._warn("[]=", " and has no effect on the manager")
+        super().__setitem__(index, value)
+
+    def sort(self, *args, **kwargs) -> None:
+        self._warn("sort", " and has no effect on the manager")
+        super().sort(*args, **kwargs)
+
+    def reverse(self) -> None:
+        self._warn("reverse", " and has no effect on the manager")
+        super().reverse()
+
+
 class CardsManager(Manager):
     """A card manager handling cardset graphics.
 
@@ -70,9 +268,14 @@ class CardsManager(Manager):
 
     """
 
-    card_sets: list[CardsetGraphic]
-    _card_sets_positions: list[tuple[int, int]]
-    _card_sets_rigths: list[CardSetRights]
+    # The managed sets, in the order they are drawn
+    _card_sets: dict[CardsetGraphic, ManagedCardSet]
+    # The rank of each set in the drawing order
+    _draw_ranks: dict[CardsetGraphic, int]
+    # Where the sets are on screen, for finding the sets under the mouse
+    _card_sets_index: SpatialGrid
+    # Whether sets were moved or removed since the last update
+    _card_sets_changed: bool = False
 
     # Attributes for recoreding past moves
     last_mouse_pos: tuple[int, int] = (0, 0)
@@ -89,22 +292,75 @@ class CardsManager(Manager):
     _cardset_under_acquisition: CardsSet | None = None
     _cardset_of_acquisition: CardsSet | None = None
     _graphics_cardset_under_acquisition: VerticalPileGraphic | None = None
+    _drag_sprite: DragSprite | None = None
+    # The cards bouncing in crazy mode
+    crazy_cards: CardParticles | None = None
+    # The cards moving between sets
+    animations: list[CardAnimation]
     mouse_pos = None
     _current_time: int = 0
     _time_last_down: int = 0
 
-    def __init__(self, click_time: int = 150) -> None:
+    def __init__(
+        self,
+        click_time: int = 150,
+        dirty_rects: bool = False,
+        background: pygame.Surface | None = None,
+        drag_max_tilt: float = 30,
+        drag_tilt_step: float = 5,
+        headless: bool = False,
+        pointer: Callable[[], tuple[int, int]] | None = None,
+        post_event: Callable[[pygame.event.Event], None] | None = None,
+    ) -> None:
         """Create a manager.
 
         :arg click_time: The time you need from the mousebutton down
             to the mouse button up [ms]
+        :arg dirty_rects: Whether :py:meth:`draw` should only redraw
+            the regions of the window that changed since the last draw.
+            The window must then not be cleared between the draws and
+            only the regions returned by :py:meth:`draw` need to be
+            updated on the display.
+        :arg background: In dirty rects mode, the background restored
+            under the cards. If not given, the window content at the
+            first draw is used.
+        :arg drag_max_tilt: The maximum angle of the dragged cards when
+            they are rotated with the mouse speed (Unit: Degrees).
+        :arg drag_tilt_step: The angle between the pre-rendered
+            frames of the dragged cards (Unit: Degrees).
+            See :py:class:`DragSprite` .
+        :arg headless: Whether to run without a window.
+            Nothing is rendered and :py:meth:`draw` does nothing, the
+            cards under the pointer are found from the layouts of the sets.
+            Useful for tests and bots.
+        :arg pointer: A function returning the position of the pointer,
+            used when no mouse event gave it.
+            By default the position of the mouse, or in headless mode the
+            last known position.
+        :arg post_event: A function receiving the events generated by
+            the manager (see :py:mod:`pygame_cards.events`).
+            By default they are posted to the pygame event queue.
 
         """
         super().__init__()
-        self.card_sets = []
-        self._card_sets_positions = []
-        self._card_sets_rigths = []
+        self._card_sets = {}
+        self._draw_ranks = {}
+        self._n_added_sets = 0
+        self.animations = []
+        self._card_sets_index = SpatialGrid()
         self.click_time = click_time
+        self.dirty_rects = dirty_rects
+        self.set_background(background)
+        self.drag_max_tilt = drag_max_tilt
+        self.drag_tilt_step = drag_tilt_step
+        self.headless = headless
+        if pointer is None:
+            pointer = self._last_pointer_pos if headless else pygame.mouse.get_pos
+        self.pointer = pointer
+        self.post_event = pygame.event.post if post_event is None else post_event
+
+    def _last_pointer_pos(self) -> tuple[int, int]:
+        return self.last_mouse_pos
 
     def add_set(
         self,
@@ -112,16 +368,101 @@ class CardsManager(Manager):
         position: tuple[int, int],
         # Attributes to handled how the user can handled the cards
         card_set_rights: CardSetRights = CardSetRights(),
+        z_order: int | None = None,
     ):
         """Add a card set graphics to be managed.
 
         :arg card_set: The cardset graphics to add.
         :arg position: The position where to show it on screen.
+        :arg z_order: The order in which the set is drawn, see
+            :py:class:`ManagedCardSet` . By default, the set is drawn on
+            top of the sets already added.
+
+        """
+        if card_set in self._card_sets:
+            raise ValueError(f"{card_set} is already managed.")
+        record = ManagedCardSet(
+            card_set,
+            position,
+            card_set_rights,
+            z_order=self._n_added_sets if z_order is None else z_order,
+            bounds=pygame.Rect(position, card_set.size),
+        )
+        self._n_added_sets += 1
+        self._card_sets[card_set] = record
+        self._sort_card_sets()
+        self._card_sets_index.insert(card_set, record.bounds)
+        card_set.add_resize_callback(self._on_set_resized)
+        self._card_sets_changed = True
 
+    def remove_set(self, card_set: CardsetGraphic) -> None:
+        """Stop managing a card set graphics.
+
+        :arg card_set: The cardset graphics to remove.
+        """
+        del self._card_sets[card_set]
+        del self._draw_ranks[card_set]
+        self._card_sets_index.remove(card_set)
+        card_set.remove_resize_callback(self._on_set_resized)
+        if self._cardset_under_mouse is card_set:
+            self._cardset_under_mouse = None
+            self._card_under_mouse = None
+        self._card_sets_changed = True
+
+    def move_set(self, card_set: CardsetGraphic, position: tuple[int, int]) -> None:
+        """Move a managed card set graphics.
+
+        :arg card_set: The cardset graphics to move.
+        :arg position: The new position where to show it on screen.
         """
-        self.card_sets.append(card_set)
-        self._card_sets_positions.append(position)
-        self._card_sets_rigths.append(card_set_rights)
+        record = self._card_sets[card_set]
+        record.position = position
+        record.bounds = pygame.Rect(position, card_set.size)
+        self._card_sets_index.insert(card_set, record.bounds)
+        self._card_sets_changed = True
+
+    def set_z_order(self, card_set: CardsetGraphic, z_order: int) -> None:
+        """Change the order in which a managed card set graphics is drawn.
+
+        :arg card_set: The cardset graphics.
+        :arg z_order: The new order, see :py:class:`ManagedCardSet` .
+        """
+        self._card_sets[card_set].z_order = z_order
+        self._sort_card_sets()
+        self._card_sets_changed = True
+        self.invalidate()
+
+    def _sort_card_sets(self) -> None:
+        """Sort the sets in the order they are drawn."""
+        # The sort is stable, so sets with the same z order keep their order
+        self._card_sets = dict(
+            sorted(self._card_sets.items(), key=lambda item: item[1].z_order)
+        )
+        self._draw_ranks = {card_set: i for i, card_set in enumerate(self._card_sets)}
+
+    @property
+    def card_sets(self) -> list[CardsetGraphic]:
+        """The managed card set graphics, in the order they are drawn.
+
+        .. deprecated::
+            Changing this list to add or remove sets is deprecated and
+            raises a :py:class:`DeprecationWarning` .
+            Use :py:meth:`add_set` , :py:meth:`remove_set` and
+            :py:meth:`set_z_order` instead.
+        """
+        return _CardSetsView(self, self._card_sets)
+
+    def get_position(self, card_set: CardsetGraphic) -> tuple[int, int]:
+        """The position of a managed card set graphics on screen."""
+        return self._card_sets[card_set].position
+
+    def _on_set_resized(self, card_set: CardsetGraphic) -> None:
+        """Update the bounds of the set."""
+        record = self._card_sets.get(card_set)
+        if record is not None:
+            record.bounds = pygame.Rect(record.position, card_set.size)
+            self._card_sets_index.insert(card_set, record.bounds)
+            self._card_sets_changed = True
 
     def process_events(self, event: pygame.event.Event):
         """Process a pygame event."""
@@ -142,6 +483,7 @@ class CardsManager(Manager):
                     self._clicked = True
                 self.mouse_pos = event.pos
 
+    @profiler.profiled("manager.update")
     def update(self, time: int) -> bool:
         """Update the manager with the new time.
 
@@ -151,55 +493,55 @@ class CardsManager(Manager):
             in ms.
         :return: whether the surface was updated or not.
         """
+        # Avoid formatting the debug messages when they are not logged
+        debug = self.logger.isEnabledFor(logging.DEBUG)
 
         if self.mouse_pos is None:
             # update the mouse pos if not in an event
-            self.mouse_pos = pygame.mouse.get_pos()
-
-        if self.last_mouse_pos != self.mouse_pos:
-            # Find the card set under the mouse
-            cardsets_under_mouse = [
-                card_set
-                for card_set, position in zip(self.card_sets, self._card_sets_positions)
-                if card_set.surface.get_rect()
-                .move(*position)
-                .collidepoint(self.mouse_pos)
-            ]
-            self.logger.debug(f"{cardsets_under_mouse = }")
-
-            # Try to find the card under the mouse
-            self._cardset_under_mouse = None
-            self._card_under_mouse = None
-            for card_set in reversed(cardsets_under_mouse):
-                self._cardset_under_mouse = card_set
-                position = self._card_sets_positions[self.card_sets.index(card_set)]
-                mousepos_in_set = (
-                    self.mouse_pos[0] - position[0],
-                    self.mouse_pos[1] - position[1],
-                )
-                self.logger.debug(
-                    f"{mousepos_in_set = }, {self.mouse_pos = } - {position = }"
+            self.mouse_pos = self.pointer()
+
+        if self.last_mouse_pos != self.mouse_pos or self._card_sets_changed:
+            with profiler.phase("manager.update.hit_test"):
+                self._card_sets_changed = False
+                # Find the card set under the mouse
+                cardsets_under_mouse = sorted(
+                    self._card_sets_index.items_at(self.mouse_pos),
+                    key=self._draw_ranks.__getitem__,
                 )
 
-                if self.get_cardset_rights(card_set).drag_multiple_cards:
-                    sub_card_set = card_set.get_cards_at(mousepos_in_set)
-                    if sub_card_set is not None:
-                        self._subcardset_under_mouse = sub_card_set
+                # Try to find the card under the mouse
+                self._cardset_under_mouse = None
+                self._card_under_mouse = None
+                for card_set in reversed(cardsets_under_mouse):
+                    self._cardset_under_mouse = card_set
+                    position = self._card_sets[card_set].position
+                    mousepos_in_set = (
+                        self.mouse_pos[0] - position[0],
+                        self.mouse_pos[1] - position[1],
+                    )
+                    if debug:
+                        self.logger.debug(
+                            f"{mousepos_in_set = }, {self.mouse_pos = } - {position = }"
+                        )
 
-                card = card_set.get_card_at(mousepos_in_set)
-                if card is not None:
-                    # Card was found
-                    self._card_under_mouse = card
-                    break
-            self.logger.debug(f"{cardsets_under_mouse = }")
-            self.logger.debug(f"{self._cardset_under_mouse = }")
-            self.logger.debug(f"{self._card_under_mouse = }")
+                    if self.get_cardset_rights(card_set).drag_multiple_cards:
+                        sub_card_set = card_set.get_cards_at(mousepos_in_set)
+                        if sub_card_set is not None:
+                            self._subcardset_under_mouse = sub_card_set
+
+                    card = card_set.get_card_at(mousepos_in_set)
+                    if card is not None:
+                        # Card was found
+                        self._card_under_mouse = card
+                        break
+                if debug:
+                    self.logger.debug(f"{cardsets_under_mouse = }")
+                    self.logger.debug(f"{self._cardset_under_mouse = }")
+                    self.logger.debug(f"{self._card_under_mouse = }")
 
         if self._is_aquiring_card and self._stop_aquiring_card:
             # Was a single click
-            _card_set_rights = self._card_sets_rigths[
-                self.card_sets.index(self._cardset_under_mouse)
-            ]
+            _card_set_rights = self.get_cardset_rights(self._cardset_under_mouse)
             if _card_set_rights.clickable and (
                 (self._current_time - self._time_last_down) <= self.click_time
             ):
@@ -207,7 +549,7 @@ class CardsManager(Manager):
                 clicked_event = cardsset_clicked(
                     self._cardset_under_mouse, self._card_under_mouse
                 )
-                pygame.event.post(clicked_event)
+                self.post_event(clicked_event)
             # Single click done
             self._is_aquiring_card, self._stop_aquiring_card = False, False
 
@@ -217,26 +559,26 @@ class CardsManager(Manager):
             and self._card_under_acquisition is None
             and self._cardset_under_acquisition is None
         ):
-            _card_set_rights = self._card_sets_rigths[
-                self.card_sets.index(self._cardset_under_mouse)
-            ]
+            _card_set_rights = self.get_cardset_rights(self._cardset_under_mouse)
             if _card_set_rights.draggable_out(self._card_under_mouse):
                 # User starts to aquire a card
                 self._cardset_of_acquisition = self._cardset_under_mouse
                 if _card_set_rights.drag_multiple_cards:
                     self._cardset_under_acquisition = self._subcardset_under_mouse
-                    self.logger.debug(
-                        f"Under acquisition {self._cardset_under_acquisition}"
-                    )
+                    if debug:
+                        self.logger.debug(
+                            f"Under acquisition {self._cardset_under_acquisition}"
+                        )
                     for card in self._cardset_under_acquisition:
                         self._cardset_of_acquisition.remove_card(card)
                         card.graphics.clear_cache()
                 else:
                     self._card_under_acquisition = self._card_under_mouse
 
-                    self.logger.debug(
-                        f"Under acquisition {self._card_under_acquisition}"
-                    )
+                    if debug:
+                        self.logger.debug(
+                            f"Under acquisition {self._card_under_acquisition}"
+                        )
                     self._cardset_of_acquisition.remove_card(
                         self._card_under_acquisition
                     )
@@ -257,7 +599,7 @@ class CardsManager(Manager):
             ):
                 if self._card_under_acquisition:
                     # Check for click event
-                    pygame.event.post(
+                    self.post_event(
                         cardsset_clicked(
                             self._cardset_under_mouse,
                             self._card_under_acquisition,
@@ -267,7 +609,7 @@ class CardsManager(Manager):
                     self._cardset_under_acquisition
                     and len(self._cardset_under_acquisition) == 1
                 ):
-                    pygame.event.post(
+                    self.post_event(
                         cardsset_clicked(
                             self._cardset_under_mouse,
                             self._cardset_under_acquisition[0],
@@ -283,7 +625,7 @@ class CardsManager(Manager):
             ):
                 self._cardset_under_mouse.append_card(self._card_under_acquisition)
 
-                pygame.event.post(
+                self.post_event(
                     card_moved(
                         self._card_under_acquisition,
                         self._cardset_of_acquisition,
@@ -300,7 +642,7 @@ class CardsManager(Manager):
                 for card in self._cardset_under_acquisition:
                     self._cardset_under_mouse.append_card(card)
 
-                    pygame.event.post(
+                    self.post_event(
                         card_moved(
                             card,
                             self._cardset_of_acquisition,
@@ -319,6 +661,7 @@ class CardsManager(Manager):
             self._cardset_of_acquisition = None
             self._card_under_acquisition = None
             self._graphics_cardset_under_acquisition = None
+            self._drag_sprite = None
             self._cardset_under_acquisition = None
             self._stop_aquiring_card = False
 
@@ -327,7 +670,7 @@ class CardsManager(Manager):
             and self._cardset_under_mouse is not None
             and self.get_cardset_rights(self._cardset_under_mouse).clickable
         ):
-            pygame.event.post(
+            self.post_event(
                 cardsset_clicked(
                     self._cardset_under_mouse,
                     self._card_under_mouse,
@@ -343,59 +686,198 @@ class CardsManager(Manager):
         self._clicked = False
         self._current_time += time
 
-    def get_cardset_rights(self, cards_set: CardsetGraphic) -> CardSetRights:
-        return self._card_sets_rigths[self.card_sets.index(cards_set)]
+        if self.crazy_cards is not None:
+            self.crazy_cards.update(time)
+        self._update_animations(time)
 
-    def draw(self, window: pygame.Surface, rotate_moving_card: bool = True):
-        """Draw the cards on the screen."""
-        for card_set, position in zip(self.card_sets, self._card_sets_positions):
-            if (
-                card_set == self._cardset_under_mouse
-                and self._card_under_acquisition is not None
-                and self.get_cardset_rights(card_set).draggable_in(
-                    self._card_under_acquisition
-                )
-            ):
-                # Add halo to the set under which the card is
-                radius = (card_set.size[0] + card_set.size[1]) // 50
-                window.blit(
-                    outer_halo(
-                        card_set.surface,
-                        radius=radius,
-                        decay=Decay.NONE,
-                        inner_color=pygame.Color(255, 255, 255, 60),
-                    ),
-                    (position[0] - radius, position[1] - radius),
+    def animate_card_move(
+        self,
+        card: Card,
+        from_set: CardsetGraphic,
+        to_set: CardsetGraphic,
+        duration: float = 300,
+        easing: Callable[[float], float] = ease_out,
+    ) -> CardAnimation:
+        """Move a card from a set to another, with an animation.
+
+        The card is removed from its set and moves on the screen while
+        :py:meth:`update` is called, then it is appended to the other set
+        and a CARD_MOVED event is posted.
+
+        :arg card: The card to move.
+        :arg from_set: The managed set containing the card.
+        :arg to_set: The managed set where the card goes.
+        :arg duration: The duration of the move (Unit: ms).
+        :arg easing: See :py:class:`CardAnimation` .
+        """
+        from_x, from_y = self._card_sets[from_set].position
+        x, y = from_set.get_card_positions()[card]
+        from_set.remove_card(card)
+
+        # Land after the cards already moving to the set
+        landing = to_set.landing_positions(
+            [
+                animation.card
+                for animation in self.animations
+                if animation.to_set is to_set
+            ]
+            + [card]
+        )[card]
+        to_x, to_y = self._card_sets[to_set].position
+
+        animation = CardAnimation(
+            card,
+            from_set,
+            to_set,
+            start=(from_x + x, from_y + y),
+            end=(to_x + landing[0], to_y + landing[1]),
+            duration=duration,
+            easing=easing,
+        )
+        self.animations.append(animation)
+        return animation
+
+    def _update_animations(self, time: float) -> None:
+        """Move the cards of the animations and land the ones arrived."""
+        for animation in self.animations:
+            animation.elapsed += time
+        # Cards land in a set in the order they started moving to it
+        waiting_sets = set()
+        moving = []
+        for animation in self.animations:
+            if animation.done and animation.to_set not in waiting_sets:
+                animation.to_set.append_card(animation.card)
+                self.post_event(
+                    card_moved(animation.card, animation.from_set, animation.to_set)
                 )
+            else:
+                waiting_sets.add(animation.to_set)
+                moving.append(animation)
+        self.animations = moving
+
+    def _draw_animations(self, window: pygame.Surface) -> None:
+        """Blit all the moving cards at once."""
+        if self.animations:
+            window.blits(
+                [
+                    (animation.card.graphics.surface, animation.position)
+                    for animation in self.animations
+                ],
+                doreturn=False,
+            )
 
-            # Show the cardset
-            window.blit(card_set.surface, position)
+    def get_cardset_rights(self, cards_set: CardsetGraphic) -> CardSetRights:
+        return self._card_sets[cards_set].rights
 
-            if (
-                card_set == self._cardset_under_mouse
-                and self._card_under_mouse is not None
-                and self._card_under_acquisition is None
-                and self.get_cardset_rights(card_set).highlight_hovered_card
-            ):
-                # Show the hovered card
-                hover = card_set.with_hovered(self._card_under_mouse)
-                window.blit(
-                    hover,
-                    position,
-                )
+    @profiler.profiled("manager.draw")
+    def draw(
+        self, window: pygame.Surface, rotate_moving_card: bool = True
+    ) -> list[pygame.Rect]:
+        """Draw the cards on the screen.
+
+        :return: The regions of the window that were drawn.
+            In dirty rects mode, pass them to :py:func:`pygame.display.update` .
+            In headless mode, nothing is drawn.
+        """
+        if self.headless:
+            return []
+        if self.dirty_rects:
+            return self._draw_dirty(window, rotate_moving_card)
+
+        for record in self._card_sets.values():
+            self._draw_cardset(window, record.card_set, record.position)
+        self._draw_animations(window)
+        sprite = self._moving_sprite(rotate_moving_card)
+        if sprite is not None:
+            window.blit(*sprite)
+        if self.crazy_cards is not None:
+            self.crazy_cards.draw(window)
+        return [window.get_rect()]
+
+    def set_background(self, background: pygame.Surface | None) -> None:
+        """Set the background restored under the cards in dirty rects mode.
+
+        If None, the content of the window is used at the next draw.
+        """
+        self.background = background
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Force the next draw in dirty rects mode to redraw everything."""
+        self._drawn_cardsets = {}
+        self._drawn_sprite = None
+        self._drawn_animations = []
+        self._full_redraw = True
+
+    def _shows_halo(self, card_set: CardsetGraphic) -> bool:
+        """Whether the halo of a possible drop is shown around the set."""
+        return (
+            card_set == self._cardset_under_mouse
+            and self._card_under_acquisition is not None
+            and self.get_cardset_rights(card_set).draggable_in(
+                self._card_under_acquisition
+            )
+        )
+
+    def _shows_hovered(self, card_set: CardsetGraphic) -> bool:
+        """Whether a hovered card is highlighted in the set."""
+        return (
+            card_set == self._cardset_under_mouse
+            and self._card_under_mouse is not None
+            and self._card_under_acquisition is None
+            and self.get_cardset_rights(card_set).highlight_hovered_card
+        )
+
+    def _halo_radius(self, card_set: CardsetGraphic) -> int:
+        return (card_set.size[0] + card_set.size[1]) // 50
+
+    def _draw_cardset(
+        self,
+        window: pygame.Surface,
+        card_set: CardsetGraphic,
+        position: tuple[int, int],
+    ) -> None:
+        """Draw a card set with its halo and hovered card."""
+        if self._shows_halo(card_set):
+            # Add halo to the set under which the card is
+            radius = self._halo_radius(card_set)
+            window.blit(
+                outer_halo(
+                    card_set.surface,
+                    radius=radius,
+                    decay=Decay.NONE,
+                    inner_color=pygame.Color(255, 255, 255, 60),
+                ),
+                (position[0] - radius, position[1] - radius),
+            )
+
+        # Show the cardset
+        window.blit(card_set.surface, position)
+
+        if self._shows_hovered(card_set):
+            # Show the hovered card
+            sprite, offset = card_set.hovered_sprite(self._card_under_mouse)
+            # Clip to the set, as when the set was drawn with the hovered card
+            dest = sprite.get_rect(
+                topleft=(position[0] + offset[0], position[1] + offset[1])
+            )
+            clipped = dest.clip(pygame.Rect(position, card_set.size))
+            window.blit(sprite, clipped, clipped.move(-dest.x, -dest.y))
+
+    def _moving_sprite(
+        self, rotate_moving_card: bool
+    ) -> tuple[pygame.Surface, tuple[float, float]] | None:
+        """The surface of the cards under acquisition and where to blit it."""
+        # Angle is proportional to speed
+        angle = self.mouse_speed[0] * 0.5 if rotate_moving_card else 0
         if self._card_under_acquisition is not None:
             # Plot the card under acquisition
             card_surf = self._card_under_acquisition.graphics.surface
             if rotate_moving_card:
-                # Angle is proportional to speed
-                angle = self.mouse_speed[0] * 0.5
-                card_surf = pygame.transform.rotate(card_surf, -angle)
-            window.blit(
-                card_surf,
-                (
-                    self.last_mouse_pos[0] - card_surf.get_size()[0] / 2,
-                    self.last_mouse_pos[1] - card_surf.get_size()[1] * 0.1,
-                ),
+                card_surf, angle = self._drag_frame(card_surf, angle)
+            return card_surf, (
+                self.last_mouse_pos[0] - card_surf.get_size()[0] / 2,
+                self.last_mouse_pos[1] - card_surf.get_size()[1] * 0.1,
             )
 
         if self._cardset_under_acquisition:
@@ -410,81 +892,131 @@ class CardsManager(Manager):
             graphic = self._graphics_cardset_under_acquisition
             surf = graphic.surface
             if rotate_moving_card:
-                # Angle is proportional to speed
-                angle = self.mouse_speed[0] * 0.5
-                surf = pygame.transform.rotate(surf, -angle)
-            window.blit(
-                surf,
-                (
-                    self.last_mouse_pos[0]
-                    + (
-                        card_size[0] / 2 - surf.get_width()
-                        if angle > 0
-                        else -card_size[0] / 2
-                    ),
-                    self.last_mouse_pos[1] - card_size[1] * 0.1,
+                surf, angle = self._drag_frame(surf, angle)
+            return surf, (
+                self.last_mouse_pos[0]
+                + (
+                    card_size[0] / 2 - surf.get_width()
+                    if angle > 0
+                    else -card_size[0] / 2
                 ),
+                self.last_mouse_pos[1] - card_size[1] * 0.1,
+            )
+
+        return None
+
+    def _drag_frame(
+        self, surface: pygame.Surface, angle: float
+    ) -> tuple[pygame.Surface, float]:
+        """The dragged surface tilted at the closest pre-rendered angle."""
+        if self._drag_sprite is None:
+            # Drag just started
+            self._drag_sprite = DragSprite(
+                surface, self.drag_max_tilt, self.drag_tilt_step
             )
+        return self._drag_sprite.frame(angle)
+
+    def _draw_dirty(
+        self, window: pygame.Surface, rotate_moving_card: bool
+    ) -> list[pygame.Rect]:
+        """Draw only the regions of the window that changed."""
+        if self.background is None:
+            self.background = window.copy()
+
+        # What each set looks like and where it is drawn
+        drawn_cardsets: dict[CardsetGraphic, tuple[tuple, pygame.Rect]] = {}
+        for card_set, record in self._card_sets.items():
+            halo = self._shows_halo(card_set)
+            hovered = self._card_under_mouse if self._shows_hovered(card_set) else None
+            rect = card_set.surface.get_rect(topleft=record.position)
+            if halo:
+                radius = self._halo_radius(card_set)
+                rect.inflate_ip(2 * radius, 2 * radius)
+            drawn_cardsets[card_set] = ((card_set.surface, halo, hovered), rect)
+
+        sprite = self._moving_sprite(rotate_moving_card)
+        drawn_sprite = (
+            None
+            if sprite is None
+            else (
+                self._card_under_acquisition,
+                self._cardset_under_acquisition,
+                sprite[0].get_rect(topleft=sprite[1]),
+            )
+        )
 
-    def start_crazy(self, screen: pygame.Surface):
+        drawn_animations = [animation.rect for animation in self.animations]
+
+        if self._full_redraw or self.crazy_cards is not None:
+            # Crazy cards can be anywhere
+            dirty = [window.get_rect()]
+        else:
+            dirty = []
+            for card_set, (state, rect) in drawn_cardsets.items():
+                previous = self._drawn_cardsets.get(card_set)
+                if previous is None:
+                    dirty.append(rect)
+                elif rect != previous[1] or any(
+                    a is not b for a, b in zip(state, previous[0])
+                ):
+                    dirty.append(rect.union(previous[1]))
+            for card_set in self._drawn_cardsets.keys() - drawn_cardsets.keys():
+                dirty.append(self._drawn_cardsets[card_set][1])
+            if drawn_sprite != self._drawn_sprite:
+                dirty.extend(s[2] for s in [drawn_sprite, self._drawn_sprite] if s)
+            dirty.extend(drawn_animations + self._drawn_animations)
+            dirty = merge_rects(dirty)
+
+        clip = window.get_clip()
+        for rect in dirty:
+            window.set_clip(rect)
+            window.blit(self.background, rect, rect)
+            for card_set, record in self._card_sets.items():
+                if drawn_cardsets[card_set][1].colliderect(rect):
+                    self._draw_cardset(window, card_set, record.position)
+            if rect.collidelist(drawn_animations) != -1:
+                self._draw_animations(window)
+            if sprite is not None and drawn_sprite[2].colliderect(rect):
+                window.blit(*sprite)
+        window.set_clip(clip)
+        if self.crazy_cards is not None:
+            self.crazy_cards.draw(window)
+
+        self._drawn_cardsets = drawn_cardsets
+        self._drawn_sprite = drawn_sprite
+        self._drawn_animations = drawn_animations
+        self._full_redraw = False
+        return dirty
+
+    def start_crazy(self, screen: pygame.Surface, **kwargs) -> CardParticles:
         """Start the crazy mode.
 
         Good way to end a game.
+        All the cards of the sets start bouncing on the screen.
+        The cards are moved by :py:meth:`update` and shown by :py:meth:`draw` ,
+        so this returns immediately.
+
+        :arg screen: The surface on which the cards bounce.
+        :arg kwargs: Passed to :py:class:`~pygame_cards.physics.CardParticles` .
         """
         # Get all cards available in the cardsets
         cards = []
-        x_positions = []
-        y_positions = []
-        for cardset, pos in zip(self.card_sets, self._card_sets_positions):
-            positions = cardset.get_card_positions()
-            set_x, set_y = pos
+        positions = []
+        for cardset, record in self._card_sets.items():
+            card_positions = cardset.get_card_positions()
+            set_x, set_y = record.position
             for card in cardset.cardset:
-                x, y = positions[card]
-                x_positions.append(x + set_x)
-                y_positions.append(y + set_y)
+                x, y = card_positions[card]
+                positions.append((x + set_x, y + set_y))
                 cards.append(card)
 
-        cards = sum([cardset.cardset], [])
-
-        x_velocities = [random.randint(-10, 10) for _ in range(len(cards))]
-        y_velocities = [random.randint(-10, 10) for _ in range(len(cards))]
-        y_acceleration = 1
-
-        fps = 30
-        clock = pygame.time.Clock()
-
-        while True:
-            # Update the position of all the cards based on the velocity and gravity
-            for i in range(len(cards)):
-                x, y = x_positions[i], y_positions[i]
-                x_positions[i] += x_velocities[i]
-                y_positions[i] += y_velocities[i]
-                y_velocities[i] += y_acceleration
-                if y_positions[i] > screen.get_height() - cards[i].graphics.size[1]:
-                    y_velocities[i] = -y_velocities[i]
-                if (
-                    x_positions[i] < 0
-                    or x_positions[i] > screen.get_width() - cards[i].graphics.size[0]
-                ):
-                    x_velocities[i] = -x_velocities[i]
-
-            screen.blits(
-                [
-                    (card.graphics.surface, (x, y))
-                    for card, x, y in zip(cards, x_positions, y_positions)
-                ]
-            )
-
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    sys.exit()
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        sys.exit()
-
-            pygame.display.update()
+        self.crazy_cards = CardParticles(cards, positions, screen.get_size(), **kwargs)
+        return self.crazy_cards
 
-            clock.tick(fps)
+    def stop_crazy(self) -> None:
+        """Stop the crazy mode."""
+        self.crazy_cards = None
+        self.invalidate()
 
 
 if __name__ == "__main__":
@@ -531,7 +1063,7 @@ if __name__ == "__main__":
     while 1:
         screen.fill("black")
         screen.blit(button, start_crazy_button_pos)
-        time_delta = clock.tick(60) / 1000.0
+        time_delta = clock.tick(60)
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 sys.exit()
@@ -0,0 +1,105 @@
+"""Physics for animating many cards at once.
+
+The cards are handled as particles: their positions, velocities and sizes
+are stored in :py:mod:`numpy` arrays and all the cards are moved with
+a single vectorized step.
+
+The particles do not take over the game loop, advance them with
+:py:meth:`CardParticles.update` and show them with
+:py:meth:`CardParticles.draw` from your own loop.
+"""
+from __future__ import annotations
+
+import numpy as np
+import pygame
+
+from pygame_cards.abstract import AbstractCard
+
+
+class CardParticles:
+    """Cards bouncing on the bottom and the sides of a region.
+
+    The cards fall with the gravity and bounce on the bottom, the left and
+    the right of the region.
+    Velocities are in pixels per step and steps are made at a fixed rate,
+    so the animation does not depend on the frame rate of the game.
+
+    :param cards: The cards to animate.
+    :param positions: The starting position of each card.
+    :param bounds: The size of the region where the cards bounce.
+    :param max_speed: The maximum starting speed of the cards, in each
+        direction (Unit: Pixels per step).
+    :param gravity: The acceleration towards the bottom
+        (Unit: Pixels per step per step).
+    :param steps_per_second: How many steps are made per second.
+    :param seed: The seed for the random starting velocities.
+    """
+
+    def __init__(
+        self,
+        cards: list[AbstractCard],
+        positions: list[tuple[float, float]],
+        bounds: tuple[int, int],
+        max_speed: int = 10,
+        gravity: float = 1,
+        steps_per_second: float = 30,
+        seed: int | None = None,
+    ) -> None:
+        self.cards = list(cards)
+        self.surfaces = [card.graphics.surface for card in self.cards]
+        self.positions = np.array(positions, dtype=float).reshape(-1, 2)
+        self.sizes = np.array(
+            [card.graphics.size for card in self.cards], dtype=float
+        ).reshape(-1, 2)
+        rng = np.random.default_rng(seed)
+        self.velocities = rng.integers(
+            -max_speed, max_speed + 1, size=self.positions.shape
+        ).astype(float)
+        self.gravity = gravity
+        self.step_time = 1000 / steps_per_second
+        self.bounds = bounds
+        # Time not used yet for a step (Unit: ms)
+        self._time_left = 0.0
+
+    def __len__(self) -> int:
+        return len(self.cards)
+
+    @property
+    def bounds(self) -> tuple[int, int]:
+        """The size of the region where the cards bounce."""
+        return self._bounds
+
+    @bounds.setter
+    def bounds(self, bounds: tuple[int, int]) -> None:
+        self._bounds = bounds
+        # The largest positions before bouncing
+        self._max_positions = np.array(bounds, dtype=float) - self.sizes
+
+    def step(self) -> None:
+        """Move all the cards by one step."""
+        self.positions += self.velocities
+        self.velocities[:, 1] += self.gravity
+        # Bounce by reverting the velocities
+        bottom = self.positions[:, 1] > self._max_positions[:, 1]
+        self.velocities[bottom, 1] *= -1
+        sides = (self.positions[:, 0] < 0) | (
+            self.positions[:, 0] > self._max_positions[:, 0]
+        )
+        self.velocities[sides, 0] *= -1
+
+    def update(self, time: float) -> int:
+        """Make the steps corresponding to the time elapsed.
+
+        :arg time: The time since the last update (Unit: ms).
+        :return: The number of steps made.
+        """
+        self._time_left += time
+        n_steps = int(self._time_left // self.step_time)
+        self._time_left -= n_steps * self.step_time
+        for _ in range(n_steps):
+            self.step()
+        return n_steps
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """Blit all the cards at their positions."""
+        surface.blits(list(zip(self.surfaces, self.positions.tolist())), doreturn=False)
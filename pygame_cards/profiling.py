@@ -0,0 +1,214 @@
+"""Opt-in instrumentation, to find out why a frame was slow.
+
+The instrumentation is disabled by default and costs a single check when
+disabled.
+When enabled with :py:meth:`Profiler.enable` , the :py:data:`profiler`
+records:
+
+* How many times the cached surfaces of each graphic class are rebuilt.
+* How long the phases of the :py:class:`~pygame_cards.manager.CardsManager`
+  take (``manager.update``, ``manager.update.hit_test``, ``manager.draw``).
+* The hits and misses of the named
+  :py:class:`~pygame_cards.cache.SurfaceCache` .
+
+.. code::
+
+    from pygame_cards.profiling import profiler
+
+    profiler.enable()
+    while True:
+        with profiler.frame() as report:
+            ...
+            manager.update(time_delta)
+            manager.draw(screen)
+        if report.duration > 20:
+            print(report)
+    print(profiler.percentiles("manager.draw"))
+"""
+from __future__ import annotations
+from collections import Counter, defaultdict, deque
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from functools import wraps
+import logging
+import time
+from typing import Callable, ContextManager, Iterator
+
+import numpy as np
+
+from pygame_cards.cache import CacheStats, named_caches
+
+
+@dataclass
+class FrameReport:
+    """What happened during a frame.
+
+    :param duration: The duration of the frame (Unit: ms).
+    :param phases: The time spent in each phase (Unit: ms).
+    :param rebuilds: The number of surfaces rebuilt for each graphic class.
+    :param caches: The hits and misses of each named cache.
+    """
+
+    duration: float = 0.0
+    phases: dict[str, float] = field(default_factory=dict)
+    rebuilds: dict[str, int] = field(default_factory=dict)
+    caches: dict[str, CacheStats] = field(default_factory=dict)
+
+    def __str__(self) -> str:
+        lines = [f"Frame: {self.duration:.2f} ms"]
+        lines += [
+            f"  {name}: {duration:.2f} ms" for name, duration in self.phases.items()
+        ]
+        lines += [f"  {name} rebuilds: {n}" for name, n in self.rebuilds.items()]
+        lines += [
+            f"  {name} cache: {stats.hits} hits, {stats.misses} misses"
+            for name, stats in self.caches.items()
+            if stats.hits or stats.misses
+        ]
+        return "\n".join(lines)
+
+
+class _Phase:
+    """Context manager timing a phase."""
+
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler: Profiler, name: str) -> None:
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc) -> None:
+        self.profiler.record(self.name, (time.perf_counter() - self.start) * 1000)
+
+
+class Profiler:
+    """Collect timings and counters of the graphics and managers.
+
+    :param window: The number of last durations kept for each phase,
+        used for the percentiles.
+    """
+
+    def __init__(self, window: int = 300) -> None:
+        self.enabled = False
+        self.window = window
+        self.logger = logging.getLogger(f"pygame_cards.profiling.{type(self).__name__}")
+        self.reset()
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def reset(self) -> None:
+        """Forget everything recorded."""
+        #: Number of surfaces rebuilt for each graphic class
+        self.rebuilds: Counter[str] = Counter()
+        #: Total time spent in each phase (Unit: ms)
+        self.totals: defaultdict[str, float] = defaultdict(float)
+        self._durations: defaultdict[str, deque[float]] = defaultdict(
+            lambda: deque(maxlen=self.window)
+        )
+
+    def record(self, name: str, duration: float) -> None:
+        """Record the duration of a phase (Unit: ms)."""
+        self.totals[name] += duration
+        self._durations[name].append(duration)
+
+    def phase(self, name: str) -> ContextManager:
+        """Context manager timing a phase, doing nothing if disabled."""
+        if not self.enabled:
+            return nullcontext()
+        return _Phase(self, name)
+
+    def profiled(self, name: str) -> Callable[[Callable], Callable]:
+        """Decorator timing each call of a function as a phase."""
+
+        def decorator(func: Callable) -> Callable:
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with _Phase(self, name):
+                    return func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def counted_rebuilds(self, func: Callable) -> Callable:
+        """Wrap the function rendering a surface to count the rebuilds.
+
+        The rebuilds are counted for the class of the graphic and timed
+        as the phase ``"<class name>.surface"`` .
+        """
+
+        @wraps(func)
+        def wrapper(graphic):
+            if not self.enabled:
+                return func(graphic)
+            name = type(graphic).__name__
+            self.rebuilds[name] += 1
+            with _Phase(self, f"{name}.surface"):
+                return func(graphic)
+
+        return wrapper
+
+    def percentiles(
+        self, name: str, q: tuple[float, ...] = (50, 90, 99)
+    ) -> dict[float, float]:
+        """The percentiles of the last durations of a phase (Unit: ms)."""
+        durations = self._durations.get(name)
+        if not durations:
+            return {p: 0.0 for p in q}
+        return dict(zip(q, np.percentile(durations, q).tolist()))
+
+    def cache_stats(self) -> dict[str, CacheStats]:
+        """The statistics of the named caches."""
+        return {name: cache.stats for name, cache in named_caches.items()}
+
+    @contextmanager
+    def frame(self, dump: bool = False) -> Iterator[FrameReport]:
+        """Context manager reporting what happened in a frame.
+
+        The report is filled when leaving the context.
+
+        :arg dump: Whether to log the report at INFO level.
+        """
+        report = FrameReport()
+        if not self.enabled:
+            yield report
+            return
+        totals = dict(self.totals)
+        rebuilds = self.rebuilds.copy()
+        caches = self.cache_stats()
+        start = time.perf_counter()
+        try:
+            yield report
+        finally:
+            report.duration = (time.perf_counter() - start) * 1000
+            report.phases = {
+                name: total - totals.get(name, 0.0)
+                for name, total in self.totals.items()
+                if total != totals.get(name, 0.0)
+            }
+            report.rebuilds = dict(self.rebuilds - rebuilds)
+            report.caches = {}
+            for name, stats in self.cache_stats().items():
+                previous = caches.get(name, CacheStats())
+                report.caches[name] = CacheStats(
+                    hits=stats.hits - previous.hits,
+                    misses=stats.misses - previous.misses,
+                    evictions=stats.evictions - previous.evictions,
+                    n_items=stats.n_items,
+                    n_bytes=stats.n_bytes,
+                )
+            if dump:
+                self.logger.info(str(report))
+
+
+#: The profiler used by all the pygame_cards objects
+profiler = Profiler()
@@ -1,19 +1,42 @@
 from __future__ import annotations
-from functools import cached_property
+from collections import deque
+import copy
+from functools import cache, cached_property
+import heapq
 import itertools
 import json
 import logging
+import math
 from pathlib import Path
 import random
-from typing import Type
+from typing import Any, Iterable, SupportsIndex, Type
 from abc import abstractmethod, abstractproperty
 
+import numpy
 import pygame
 from pygame_cards.abstract import AbstractCard, AbstractGraphic
+from pygame_cards.codes import CardRegistry
 from pygame_cards.io.utils import to_json
+from pygame_cards.utils import merge_rects
 from pygame_cards import constants
 
 _CARDSET_ID_GENERATOR = itertools.count()
+# Value of the attributes that cards do not have
+_MISSING = object()
+
+
+@cache
+def _renders_hovered_sprite(cls: type[CardsetGraphic]) -> bool:
+    """Whether the hovered card of the graphic type is made by its
+    :py:meth:`CardsetGraphic.render_hovered_sprite` rather than by its
+    :py:meth:`CardsetGraphic.with_hovered` .
+    """
+    for klass in cls.__mro__:
+        if "render_hovered_sprite" in klass.__dict__:
+            return klass is not CardsetGraphic
+        if "with_hovered" in klass.__dict__:
+            return False
+    return False
 
 
 class CardsetGraphic(AbstractGraphic):
@@ -30,6 +53,9 @@ class CardsetGraphic(AbstractGraphic):
         graphic. If 0, this is unlimited.
     """
 
+    # The last surface made by compose_cards and what was blitted on it
+    _composition: tuple[pygame.Surface, tuple, list[tuple]] | None = None
+
     def __init__(
         self,
         cardset: CardsSet,
@@ -39,6 +65,10 @@ class CardsetGraphic(AbstractGraphic):
         graphics_type: type | None = None,
         max_cards: int = 0,
     ):
+        # Overlays of the hovered cards: {card: (card_surface, sprite, position)}
+        self._hovered_sprites: dict[
+            AbstractCard, tuple[pygame.Surface, pygame.Surface, tuple[float, float]]
+        ] = {}
         self.cardset = cardset
         self._size = size
         self.card_size = card_size
@@ -58,6 +88,7 @@ class CardsetGraphic(AbstractGraphic):
         super().clear_cache()
         for prop in ["card_border_radius"]:
             self.__dict__.pop(prop, None)
+        self._hovered_sprites = {}
 
     @property
     def card_size(self) -> tuple[int, int]:
@@ -78,6 +109,93 @@ class CardsetGraphic(AbstractGraphic):
     def surface(self) -> pygame.Surface:
         raise NotImplementedError(f"property 'surface' in {type(self).__name__}")
 
+    def card_surface(self, card: AbstractCard) -> pygame.Surface:
+        """The surface of the card, as it is blitted on this graphic.
+
+        Override this if the graphic transforms the surfaces of the cards.
+        """
+        return card.graphics.surface
+
+    def compose_cards(self, positions: list[tuple[float, float]]) -> pygame.Surface:
+        """Create a surface with the cards of the set at the positions.
+
+        The cards are blitted in the order of the set.
+        This can be used to implement :py:attr:`surface` .
+
+        The cards blitted are remembered, so that when the surface is
+        composed again, only the regions where cards changed are redrawn
+        on a copy of the previous surface.
+        Appending a card when the other cards don't move then
+        costs a single blit.
+
+        :arg positions: The position of each card of the set.
+        """
+        # What is blitted: the card, its surface and its position
+        blits = [
+            (card, card.graphics.surface, pos)
+            for card, pos in zip(self.cardset, positions)
+        ]
+        layout = (self.size, self.card_size)
+        previous = self._composition
+
+        if previous is None or previous[1] != layout:
+            surf = pygame.Surface(self.size, pygame.SRCALPHA)
+            surf.blits([(self.card_surface(card), pos) for card, _, pos in blits])
+            self._composition = (surf, layout, blits)
+            return surf
+
+        previous_surf, _, previous_blits = previous
+        # Cards before the first change are still correctly shown
+        first_change = next(
+            (
+                i
+                for i, (blit, previous_blit) in enumerate(zip(blits, previous_blits))
+                if blit[0] is not previous_blit[0]
+                or blit[1] is not previous_blit[1]
+                or blit[2] != previous_blit[2]
+            ),
+            min(len(blits), len(previous_blits)),
+        )
+        dirty = merge_rects(
+            [
+                self._card_rect(surface, pos)
+                for _, surface, pos in blits[first_change:]
+                + previous_blits[first_change:]
+            ]
+        )
+        if not dirty:
+            return previous_surf
+
+        surf = previous_surf.copy()
+        for rect in dirty:
+            surf.set_clip(rect)
+            surf.fill((0, 0, 0, 0))
+            surf.blits(
+                [
+                    (self.card_surface(card), pos)
+                    for card, surface, pos in blits
+                    if rect.colliderect(self._card_rect(surface, pos))
+                ]
+            )
+        surf.set_clip(None)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Recomposed {len(dirty)} regions")
+
+        self._composition = (surf, layout, blits)
+        return surf
+
+    def _card_rect(
+        self, surface: pygame.Surface, pos: tuple[float, float]
+    ) -> pygame.Rect:
+        """The region covered by a card blitted by :py:meth:`compose_cards` ."""
+        # Add a pixel to account for positions rounding
+        return pygame.Rect(
+            math.floor(pos[0]),
+            math.floor(pos[1]),
+            max(surface.get_width(), self.card_size[0]) + 1,
+            max(surface.get_height(), self.card_size[1]) + 1,
+        )
+
     @abstractmethod
     def get_card_at(self, pos: tuple[int, int]) -> AbstractCard | None:
         """Return the card at the given pixel position
@@ -124,10 +242,8 @@ class CardsetGraphic(AbstractGraphic):
 
         :return cards: A cardset with all the cards remaining.
         """
-        cardset = CardsSet()
-        while self.cardset:
-            card = self.cardset.pop(0)
-            cardset.append(card)
+        cardset = CardsSet(self.cardset)
+        self.cardset.clear()
         self.clear_cache()
         return cardset
 
@@ -135,16 +251,56 @@ class CardsetGraphic(AbstractGraphic):
         """Append a card to the cardset."""
 
         self.cardset.append(card)
-        card.graphics.size = self.card_size
-        card.graphics.clear_cache()
+        self._fit_card(card)
         self.clear_cache()
 
     def extend_cards(self, card_set: CardsSet) -> None:
         self.cardset.extend(card_set)
         for card in card_set:
+            self._fit_card(card)
+        self.clear_cache()
+
+    def _fit_card(self, card: AbstractCard) -> None:
+        """Give the card size of this graphic to a card added to the set.
+
+        The surface of the card is rendered again only if its size changed.
+        """
+        if tuple(card.graphics.size) != tuple(self.card_size):
+            # The size of card graphics is a field, that does not clear the cache
             card.graphics.size = self.card_size
             card.graphics.clear_cache()
-        self.clear_cache()
+
+    def hovered_sprite(
+        self, card: AbstractCard
+    ) -> tuple[pygame.Surface, tuple[float, float]]:
+        """The overlay showing the card hovered and where to blit it.
+
+        To customize the overlay, implement :py:meth:`render_hovered_sprite` .
+        The overlays it renders are cached until the cache of this graphic
+        is cleared or the surface of the card changes.
+        Graphics implementing only :py:meth:`with_hovered` are not cached,
+        such that the hovered card can be animated.
+
+        :arg card: The card hovered.
+        :return sprite, position: The overlay and its position on this graphic.
+        """
+        if not _renders_hovered_sprite(type(self)):
+            return self.with_hovered(card), (0, 0)
+        cached = self._hovered_sprites.get(card)
+        if cached is None or cached[0] is not card.graphics.surface:
+            sprite, position = self.render_hovered_sprite(card)
+            cached = (card.graphics.surface, sprite, position)
+            self._hovered_sprites[card] = cached
+        return cached[1], cached[2]
+
+    def render_hovered_sprite(
+        self, card: AbstractCard
+    ) -> tuple[pygame.Surface, tuple[float, float]]:
+        """Render the overlay of :py:meth:`hovered_sprite` .
+
+        By default, the whole graphic made by :py:meth:`with_hovered` .
+        """
+        return self.with_hovered(card), (0, 0)
 
     def with_hovered(self, card: AbstractCard | None) -> pygame.Surface:
         """Show the hand with the card hovered."""
@@ -155,6 +311,21 @@ class CardsetGraphic(AbstractGraphic):
             self._raised_with_hovered_warning = True
         return self.surface
 
+    def landing_positions(
+        self, cards: list[AbstractCard]
+    ) -> dict[AbstractCard, tuple[int, int]]:
+        """Return where the cards would be if they were appended to the set.
+
+        The positions are computed on a copy of this graphic showing a new
+        set, so the set and this graphic are left unchanged.
+        """
+        layout = copy.copy(self)
+        layout.cardset = CardsSet([*self.cardset, *cards])
+        # Forget the layout of the set without the cards, on the copy only
+        layout.clear_cache()
+        positions = layout.get_card_positions()
+        return {card: positions[card] for card in cards}
+
     def get_card_positions(self) -> dict[AbstractCard, tuple[int, int]]:
         """Return the position of each card from the cardset."""
         raise NotImplementedError(
@@ -171,13 +342,47 @@ class CardsSet(list[AbstractCard]):
     If is meant to be used together with
     :py:class:`~pygame_cards.abstract.AbstractCardGraphics`
     for the graphics.
+
+    Lookups by the attributes of the cards can use indexes.
+    The indexes are declared with :py:meth:`add_index` or with the
+    :py:attr:`indexed_attributes` of a daughter class, and are updated
+    when the set is changed.
+    Cards without the attribute are skipped by the lookups, whether the
+    attribute is indexed or not.
+
+    .. code::
+
+        class WondersSet(CardsSet):
+            indexed_attributes = ("name", "era")
+
+    .. warning::
+        The indexes keep the values the attributes had when the cards
+        were added to the set.
+        After changing an indexed attribute of a card in the set,
+        call :py:meth:`reindex` .
+
+    :param indexed_attributes: The attributes of the cards indexed by
+        default. The values of the attributes must be hashable.
     """
 
+    indexed_attributes: tuple[str, ...] = ()
+
     _graphics: CardsetGraphic | None = None
+    _registry: CardRegistry | None = None
+    # The attributes indexed in this set
+    _indexed: tuple[str, ...] = ()
+    # {attribute: {value: {order: card}}}, None if must be rebuilt
+    _index: dict[str, dict[Any, dict[int, AbstractCard]]] | None = None
+    # The order and the indexed values of each card of the set, such that
+    # a removed card is found in the index without searching
+    _entries: list[tuple[int, tuple]] | None = None
+    # The order given to the next card added to the index
+    _next_order: int = 0
 
     def __init__(self, *args: AbstractCard) -> None:
         super().__init__(*args)
         self.u_id = next(_CARDSET_ID_GENERATOR)
+        self._indexed = self.indexed_attributes
 
     def __hash__(self) -> int:
         return hash(f"cs_{self.u_id}")
@@ -194,6 +399,152 @@ class CardsSet(list[AbstractCard]):
         else:
             raise TypeError(f"Invalid index type: {type(index)}")
 
+    # index methods
+    def add_index(self, attribute: str) -> None:
+        """Index the cards of the set by an attribute.
+
+        :arg attribute: The attribute of the cards. Cards without this
+            attribute are not indexed.
+        """
+        if attribute not in self._indexed:
+            self._indexed = self._indexed + (attribute,)
+            self._invalidate_index()
+
+    def reindex(self) -> None:
+        """Rebuild the indexes, after indexed attributes of cards changed."""
+        self._invalidate_index()
+
+    def cards_with(self, attribute: str, value: Any) -> list[AbstractCard]:
+        """The cards of the set with the value of the attribute.
+
+        The cards are in the order of the set.
+        Uses the index of the attribute if there is one.
+        """
+        if attribute not in self._indexed:
+            return [
+                card for card in self if getattr(card, attribute, _MISSING) == value
+            ]
+        return list(self._get_index(attribute).get(value, {}).values())
+
+    def count_with(self, attribute: str, value: Any) -> int:
+        """The number of cards of the set with the value of the attribute."""
+        if attribute not in self._indexed:
+            return sum(
+                1 for card in self if getattr(card, attribute, _MISSING) == value
+            )
+        return len(self._get_index(attribute).get(value, {}))
+
+    def _get_index(self, attribute: str) -> dict[Any, dict[int, AbstractCard]]:
+        """The index of the attribute, rebuilt if the set was reordered."""
+        if self._index is None:
+            self._index = {attribute: {} for attribute in self._indexed}
+            self._entries = []
+            self._next_order = 0
+            self._add_to_index(self)
+        return self._index[attribute]
+
+    def _add_to_index(self, cards: Iterable[AbstractCard]) -> None:
+        """Add cards at the end of the set to the index."""
+        if self._index is None:
+            return
+        for card in cards:
+            order = self._next_order
+            values = tuple(
+                getattr(card, attribute, _MISSING) for attribute in self._index
+            )
+            for index, value in zip(self._index.values(), values):
+                if value is not _MISSING:
+                    index.setdefault(value, {})[order] = card
+            self._entries.append((order, values))
+            self._next_order += 1
+
+    def _remove_from_index(self, index: SupportsIndex | slice) -> None:
+        """Remove the cards at the index of the set from the index.
+
+        Must be called before the cards are removed from the list.
+        The order of the other cards is kept.
+        """
+        if self._index is None:
+            return
+        removed = self._entries[index]
+        del self._entries[index]
+        for order, values in removed if isinstance(index, slice) else (removed,):
+            for attribute_index, value in zip(self._index.values(), values):
+                if value is _MISSING:
+                    continue
+                cards = attribute_index[value]
+                del cards[order]
+                if not cards:
+                    del attribute_index[value]
+
+    def _invalidate_index(self) -> None:
+        """The order of the cards changed, rebuild the index when needed."""
+        self._index = None
+        self._entries = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Copies and pickles append the cards again after restoring the
+        # state, so the index is left out and rebuilt when needed
+        state = self.__dict__.copy()
+        for attribute in ["_index", "_entries", "_next_order"]:
+            state.pop(attribute, None)
+        return state
+
+    # list methods updating the indexes
+    def append(self, card: AbstractCard) -> None:
+        super().append(card)
+        self._add_to_index((card,))
+
+    def extend(self, cards: Iterable[AbstractCard]) -> None:
+        cards = list(cards)
+        super().extend(cards)
+        self._add_to_index(cards)
+
+    def __iadd__(self, cards: Iterable[AbstractCard]) -> CardsSet:
+        self.extend(cards)
+        return self
+
+    def remove(self, card: AbstractCard) -> None:
+        if self._index is None:
+            super().remove(card)
+        else:
+            del self[self.index(card)]
+
+    def pop(self, index: SupportsIndex = -1) -> AbstractCard:
+        card = list.__getitem__(self, index)
+        self._remove_from_index(index)
+        super().pop(index)
+        return card
+
+    def __delitem__(self, index: SupportsIndex | slice) -> None:
+        self._remove_from_index(index)
+        super().__delitem__(index)
+
+    def clear(self) -> None:
+        super().clear()
+        self._invalidate_index()
+
+    def insert(self, index: SupportsIndex, card: AbstractCard) -> None:
+        super().insert(index, card)
+        self._invalidate_index()
+
+    def __setitem__(self, index, value) -> None:
+        super().__setitem__(index, value)
+        self._invalidate_index()
+
+    def __imul__(self, n: SupportsIndex) -> CardsSet:
+        super().__imul__(n)
+        self._invalidate_index()
+        return self
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self._invalidate_index()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._invalidate_index()
+
     # creation methods
     @classmethod
     def generate(cls) -> CardsSet:
@@ -227,8 +578,11 @@ class CardsSet(list[AbstractCard]):
 
         :return: The card requested or None if no card was found.
         """
+        if "name" in self._indexed:
+            cards = self._get_index("name").get(name, {})
+            return next(iter(cards.values()), None)
         for card in self:
-            if card.name == name:
+            if getattr(card, "name", _MISSING) == name:
                 return card
         return None
 
@@ -239,7 +593,7 @@ class CardsSet(list[AbstractCard]):
 
     def filter_by_era(self, era: int) -> CardsSet:
         """Filter the cards corresponding to the requested era."""
-        return CardsSet([card for card in self if card.era == era])
+        return CardsSet(self.cards_with("era", era))
 
     def filter_for_n_players(self, n_players: int) -> CardsSet:
         """Keep only the cards for the requested number of players.
@@ -248,8 +602,27 @@ class CardsSet(list[AbstractCard]):
         by the number of players.
         :return: A new card set that contain only the specifed cards.
         """
+        if "add_card_at_playercount" not in self._indexed:
+            return CardsSet(
+                [
+                    card
+                    for card in self
+                    # Cards without a player count are skipped, as by the index
+                    if getattr(card, "add_card_at_playercount", math.inf) <= n_players
+                ]
+            )
+        index = self._get_index("add_card_at_playercount")
+        # Merge the cards of each player count, in the order of the set
         return CardsSet(
-            [card for card in self if card.add_card_at_playercount <= n_players]
+            card
+            for _, card in heapq.merge(
+                *(
+                    cards.items()
+                    for count, cards in index.items()
+                    if count <= n_players
+                ),
+                key=lambda entry: entry[0],
+            )
         )
 
     def draw(self, n_cards: int) -> CardsSet:
@@ -262,7 +635,22 @@ class CardsSet(list[AbstractCard]):
         """
         if n_cards == -1:
             n_cards = len(self)
-        return CardsSet([self.pop(0) for _ in range(n_cards)])
+        return CardsSet(self._remove_top(n_cards))
+
+    def _remove_top(self, n_cards: int) -> list[AbstractCard]:
+        """Remove the n first cards of the set and return them.
+
+        The cards are removed with a single slice deletion, instead of
+        popping them one by one which shifts the whole list each time.
+        """
+        if n_cards <= 0:
+            # Nothing to remove, as when popping the cards one by one
+            return []
+        if n_cards > len(self):
+            raise IndexError(f"Cannot remove {n_cards} cards from {len(self)} cards.")
+        cards = list.__getitem__(self, slice(0, n_cards))
+        del self[:n_cards]
+        return cards
 
     def distribute(
         self,
@@ -302,8 +690,8 @@ class CardsSet(list[AbstractCard]):
         ]
 
         if not equally and not n_cards and (remaining_cards := (len(self) % n_sets)):
-            for i in range(remaining_cards):
-                dist[i].append(self.pop(0))
+            for i, card in enumerate(self._remove_top(remaining_cards)):
+                dist[i].append(card)
 
         return dist
 
@@ -363,22 +751,52 @@ class CardsSet(list[AbstractCard]):
         # Find how many distriubtions will be required
         n_distributions = cards_per_set * n_sets // n_cards_at_a_time
 
+        # Remove all the distributed cards from the top of the packet at once
+        cards = self._remove_top(n_distributions * n_cards_at_a_time)
         # Loop acts like a real distribution
-        for i in range(0, n_distributions):
+        for i in range(0, len(cards), n_cards_at_a_time):
             # Get the current player
             set_to_distribute = next(cycler)
-            set_to_distribute.extend(
-                # Remove n_cards_at_a_time cards from the top of the packet
-                [self.pop(0) for _ in range(n_cards_at_a_time)]
-            )
+            set_to_distribute.extend(cards[i : i + n_cards_at_a_time])
 
         if not equally and not n_cards:
-            for _ in range(len(self)):
+            for card in self._remove_top(len(self)):
                 set_to_distribute = next(cycler)
-                set_to_distribute.append(self.pop(0))
+                set_to_distribute.append(card)
 
         return None
 
+    # encoding methods
+    @property
+    def registry(self) -> CardRegistry:
+        """The registry giving the codes of the cards of this set.
+
+        Created with the cards of the set the first time it is needed.
+        Sets made from the codes share the registry.
+        """
+        if self._registry is None:
+            self._registry = CardRegistry(self)
+        return self._registry
+
+    @registry.setter
+    def registry(self, registry: CardRegistry) -> None:
+        self._registry = registry
+
+    def to_codes(self) -> numpy.ndarray:
+        """The codes of the cards of the set, see :py:mod:`pygame_cards.codes` ."""
+        return self.registry.encode(self)
+
+    @classmethod
+    def from_codes(cls, codes: numpy.ndarray, registry: CardRegistry) -> CardsSet:
+        """Create a set with the cards of the codes.
+
+        :arg codes: The codes of the cards, in the order of the set.
+        :arg registry: The registry that gave the codes.
+        """
+        cardset = cls(registry.decode(codes))
+        cardset.registry = registry
+        return cardset
+
     # io methods
     def to_json(self, file: Path) -> None:
         """Save the cards set as a json file."""
@@ -399,3 +817,79 @@ class CardsSet(list[AbstractCard]):
     @graphics.setter
     def graphics(self, value: CardsetGraphic) -> None:
         self._graphics = value
+
+
+class CardsPacket:
+    """A packet of cards, dealt from the top.
+
+    Has the same dealing methods as :py:class:`CardsSet` , with the same
+    results, but the cards are stored in a :py:class:`collections.deque` .
+    Taking a card from the top of the packet does not shift the other
+    cards, so dealing a packet one card at a time is linear in the number
+    of cards instead of quadratic.
+    Prefer it to a :py:class:`CardsSet` for large shoes dealt card by card.
+
+    The first card is the top of the packet.
+    The drawn and distributed cards are :py:class:`CardsSet` .
+
+    :param cards: The cards of the packet, from the top.
+    """
+
+    def __init__(self, cards: Iterable[AbstractCard] = ()) -> None:
+        self._cards: deque[AbstractCard] = deque(cards)
+
+    def __len__(self) -> int:
+        return len(self._cards)
+
+    def __iter__(self):
+        return iter(self._cards)
+
+    def __contains__(self, card: AbstractCard) -> bool:
+        return card in self._cards
+
+    def __getitem__(self, index: int) -> AbstractCard:
+        return self._cards[index]
+
+    def __repr__(self) -> str:
+        return f"{type(self)}({list(self._cards)})"
+
+    def append(self, card: AbstractCard) -> None:
+        """Put a card at the bottom of the packet."""
+        self._cards.append(card)
+
+    def extend(self, cards: Iterable[AbstractCard]) -> None:
+        """Put cards at the bottom of the packet."""
+        self._cards.extend(cards)
+
+    def pop(self, index: int = -1) -> AbstractCard:
+        """Remove a card and return it, the top card with ``pop(0)`` ."""
+        if index == 0:
+            return self._cards.popleft()
+        card = self._cards[index]
+        del self._cards[index]
+        return card
+
+    def shuffle(self) -> None:
+        """Shuffle the cards in the packet, as :py:meth:`CardsSet.shuffle` ."""
+        cards = list(self._cards)
+        random.shuffle(cards)
+        self._cards = deque(cards)
+
+    def to_set(self) -> CardsSet:
+        """A card set with the cards of the packet, from the top."""
+        return CardsSet(self._cards)
+
+    def _remove_top(self, n_cards: int) -> list[AbstractCard]:
+        """Remove the n first cards of the packet and return them."""
+        if n_cards <= 0:
+            return []
+        if n_cards > len(self._cards):
+            raise IndexError(f"Cannot remove {n_cards} cards from {len(self)} cards.")
+        popleft = self._cards.popleft
+        return [popleft() for _ in range(n_cards)]
+
+    # The dealing methods only take the cards with _remove_top
+    draw = CardsSet.draw
+    distribute = CardsSet.distribute
+    distribute_to = CardsSet.distribute_to
+    _find_ncards_per_set = CardsSet._find_ncards_per_set
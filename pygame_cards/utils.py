@@ -1,6 +1,7 @@
 from enum import Enum
 from pathlib import Path
-from pygame import Surface
+from typing import Hashable
+from pygame import Rect, Surface
 
 import pygame_cards
 
@@ -47,3 +48,105 @@ def position_for_centering(
     size_under = surface_under.get_size()
 
     return (size_under[0] - size_on[0]) // 2, (size_under[1] - size_on[1]) // 2
+
+
+def merge_rects(rects: list[Rect]) -> list[Rect]:
+    """Merge the overlapping rects, such that no region is covered twice.
+
+    Useful for redrawing only some regions of a surface.
+    """
+    merged: list[Rect] = []
+    for rect in rects:
+        rect = Rect(rect)
+        # Absorb all the merged rects overlapping the new one
+        while (i := rect.collidelist(merged)) != -1:
+            rect.union_ip(merged.pop(i))
+        merged.append(rect)
+    return merged
+
+
+class SpatialGrid:
+    """Index of rectangles, to find quickly which ones contain a point.
+
+    The plane is divided in square cells and each item is registered in
+    the cells its rectangle overlaps, so that a lookup only checks the
+    items of a single cell.
+
+    :param cell_size: The size of the cells (Unit: Pixels).
+        Should be about the size of the indexed rectangles.
+    """
+
+    def __init__(self, cell_size: int = 128) -> None:
+        self.cell_size = cell_size
+        self._cells: dict[tuple[int, int], list[Hashable]] = {}
+        self._rects: dict[Hashable, Rect] = {}
+        # Insertion order of the items
+        self._orders: dict[Hashable, int] = {}
+        self._n_inserted = 0
+
+    def __len__(self) -> int:
+        return len(self._rects)
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self._rects
+
+    def _cells_of(self, rect: Rect) -> list[tuple[int, int]]:
+        """The cells overlapped by the rectangle."""
+        if rect.width <= 0 or rect.height <= 0:
+            return []
+        return [
+            (i, j)
+            for i in range(
+                rect.left // self.cell_size, (rect.right - 1) // self.cell_size + 1
+            )
+            for j in range(
+                rect.top // self.cell_size, (rect.bottom - 1) // self.cell_size + 1
+            )
+        ]
+
+    def insert(self, item: Hashable, rect: Rect) -> None:
+        """Add an item or update its rectangle.
+
+        An updated item keeps its order.
+        """
+        rect = Rect(rect)
+        if item in self._rects:
+            if self._rects[item] == rect:
+                return
+            self.remove(item, keep_order=True)
+        if item not in self._orders:
+            self._orders[item] = self._n_inserted
+            self._n_inserted += 1
+        self._rects[item] = rect
+        for cell in self._cells_of(rect):
+            self._cells.setdefault(cell, []).append(item)
+
+    def remove(self, item: Hashable, keep_order: bool = False) -> None:
+        """Remove an item from the index."""
+        rect = self._rects.pop(item)
+        if not keep_order:
+            del self._orders[item]
+        for cell in self._cells_of(rect):
+            items = self._cells[cell]
+            items.remove(item)
+            if not items:
+                del self._cells[cell]
+
+    def rect(self, item: Hashable) -> Rect:
+        """The rectangle of the item."""
+        return self._rects[item]
+
+    def items_at(self, point: tuple[int, int]) -> list[Hashable]:
+        """Return the items whose rectangle contains the point.
+
+        The items are sorted in the order they were inserted.
+        """
+        cell = (int(point[0] // self.cell_size), int(point[1] // self.cell_size))
+        return sorted(
+            (
+                item
+                for item in self._cells.get(cell, [])
+                if self._rects[item].collidepoint(point)
+            ),
+            key=self._orders.__getitem__,
+        )
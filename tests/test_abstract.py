@@ -1,5 +1,21 @@
+from dataclasses import dataclass
 import unittest
-from pygame_cards.abstract import AbstractCard
+from pygame_cards.abstract import AbstractCard, AbstractCardGraphics
+from pygame_cards.io.utils import card_attributes
+
+
+@dataclass(eq=False)
+class DictCard(AbstractCard):
+    """A card type not using slots."""
+
+    value: int = 0
+
+    graphics_type = AbstractCardGraphics
+
+
+@dataclass(eq=False, slots=True)
+class SlottedCard(AbstractCard):
+    value: int = 0
 
 
 class TestCard(unittest.TestCase):
@@ -20,7 +36,39 @@ class TestCard(unittest.TestCase):
 
     def test_uid_not_exposed_in_dict(self):
         card = AbstractCard("A")
-        self.assertIn("name", card.__dict__)
+        self.assertIn("name", card_attributes(card))
+
+    def test_slots(self):
+        self.assertFalse(hasattr(AbstractCard("A"), "__dict__"))
+        self.assertFalse(hasattr(SlottedCard("A"), "__dict__"))
+        self.assertEqual(card_attributes(SlottedCard("A", 3))["value"], 3)
+        self.assertEqual(card_attributes(DictCard("A", 3))["value"], 3)
+
+    def test_hash_and_eq(self):
+        card, card2 = AbstractCard("A"), AbstractCard("A")
+        self.assertEqual(hash(card), card.u_id)
+        self.assertEqual(card, card)
+        self.assertNotEqual(card, card2)
+        self.assertEqual(len({card, card2, card}), 2)
+
+    def test_class_logger(self):
+        self.assertIs(AbstractCard("A").logger, AbstractCard("B").logger)
+        self.assertEqual(SlottedCard("A").logger.name, "pywonders.cards.SlottedCard")
+
+    def test_graphics_type(self):
+        self.assertIsNone(AbstractCard("A").graphics_type)
+        self.assertRaises(RuntimeError, getattr, AbstractCard("A"), "graphics")
+        card = DictCard("A")
+        self.assertIs(card.graphics_type, AbstractCardGraphics)
+        self.assertIsInstance(card.graphics, AbstractCardGraphics)
+
+        class OtherGraphics(AbstractCardGraphics):
+            pass
+
+        card = SlottedCard("A")
+        card.graphics_type = OtherGraphics
+        self.assertIsInstance(card.graphics, OtherGraphics)
+        self.assertIs(DictCard("B").graphics_type, AbstractCardGraphics)
 
 
 if __name__ == "__main__":
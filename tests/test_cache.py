@@ -0,0 +1,88 @@
+import unittest
+import pygame
+from pygame_cards.abstract import AbstractCard, AbstractCardGraphics
+from pygame_cards.cache import SurfaceCache, cached_surface, surface_cache
+
+
+class CountingGraphics(AbstractCardGraphics):
+    """Graphics counting how many times they are rendered."""
+
+    n_renders = 0
+
+    @property
+    def render_key(self):
+        return self.card.name
+
+    @cached_surface
+    def surface(self) -> pygame.Surface:
+        type(self).n_renders += 1
+        return pygame.Surface(self.size)
+
+
+class TestSurfaceCache(unittest.TestCase):
+    def test_get_put(self):
+        cache = SurfaceCache()
+        surf = pygame.Surface((10, 10))
+        self.assertIsNone(cache.get("a"))
+        cache.put("a", surf)
+        self.assertIs(cache.get("a"), surf)
+        self.assertEqual(cache.stats.hits, 1)
+        self.assertEqual(cache.stats.misses, 1)
+
+    def test_lru_eviction(self):
+        surf_bytes = pygame.Surface((10, 10), pygame.SRCALPHA).get_pitch() * 10
+        cache = SurfaceCache(max_bytes=2 * surf_bytes)
+        for key in ["a", "b"]:
+            cache.put(key, pygame.Surface((10, 10), pygame.SRCALPHA))
+        # Use a such that b is the least recently used
+        cache.get("a")
+        cache.put("c", pygame.Surface((10, 10), pygame.SRCALPHA))
+
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertIn("c", cache)
+        self.assertEqual(cache.stats.evictions, 1)
+        self.assertEqual(cache.stats.n_bytes, 2 * surf_bytes)
+
+    def test_too_large_not_stored(self):
+        cache = SurfaceCache(max_bytes=10)
+        cache.put("a", pygame.Surface((10, 10)))
+        self.assertEqual(len(cache), 0)
+
+    def test_reduce_budget_evicts(self):
+        cache = SurfaceCache()
+        cache.put("a", pygame.Surface((10, 10)))
+        cache.max_bytes = 0
+        self.assertEqual(len(cache), 0)
+
+
+class TestCachedSurface(unittest.TestCase):
+    def setUp(self) -> None:
+        surface_cache.clear()
+        CountingGraphics.n_renders = 0
+
+    def test_shared_between_exemplars(self):
+        card, card2 = AbstractCard("A"), AbstractCard("A")
+        card.graphics = CountingGraphics(card)
+        card2.graphics = CountingGraphics(card2)
+
+        self.assertIs(card.graphics.surface, card2.graphics.surface)
+        self.assertEqual(CountingGraphics.n_renders, 1)
+
+    def test_back_to_previous_size(self):
+        card = AbstractCard("A")
+        card.graphics = CountingGraphics(card)
+        card.graphics.surface
+        for size in [(20, 30), (10, 15)]:
+            card.graphics.size = size
+            card.graphics.clear_cache()
+            card.graphics.surface
+        card.graphics.size = (20, 30)
+        card.graphics.clear_cache()
+
+        self.assertEqual(card.graphics.surface.get_size(), (20, 30))
+        self.assertEqual(CountingGraphics.n_renders, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
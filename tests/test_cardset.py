@@ -1,9 +1,13 @@
+import copy
+from dataclasses import dataclass
 import logging
 from pathlib import Path
+import pickle
+import random
 import unittest
 from pygame_cards.abstract import AbstractCard
 from pygame_cards.io.json import from_json
-from pygame_cards.set import CardsSet
+from pygame_cards.set import CardsPacket, CardsSet
 
 
 def get_set_of_size(n: int) -> CardsSet:
@@ -79,6 +83,46 @@ class TestCard(unittest.TestCase):
         self.assertListEqual(drawn, [a, b])
         self.assertListEqual(s, [c])
 
+    def test_draw_all(self):
+        s = get_set_of_size(5)
+        cards = list(s)
+        self.assertListEqual(s.draw(-1), cards)
+        self.assertListEqual(s, [])
+
+    def test_draw_negative(self):
+        s = get_set_of_size(3)
+        self.assertListEqual(s.draw(-2), [])
+        self.assertListEqual(s.draw(0), [])
+        self.assertEqual(len(s), 3)
+
+    def test_draw_too_many(self):
+        s = get_set_of_size(3)
+        self.assertRaises(IndexError, s.draw, 4)
+        self.assertEqual(len(s), 3)
+
+    def test_distribute_to_order(self):
+        """The packet is distributed from the top, in turns."""
+        for n_cards_at_a_time, equally in [(1, True), (2, True), (1, False)]:
+            with self.subTest(n_cards_at_a_time=n_cards_at_a_time, equally=equally):
+                s = get_set_of_size(11)
+                cards = list(s)
+                sets = [CardsSet(), CardsSet(), CardsSet()]
+                s.distribute_to(
+                    sets, equally=equally, n_cards_at_a_time=n_cards_at_a_time
+                )
+                # Same as popping the top card one player after the other
+                expected = [[], [], []]
+                packet = cards.copy()
+                n_distributions = 3 * 3 // n_cards_at_a_time
+                for i in range(n_distributions):
+                    for _ in range(n_cards_at_a_time):
+                        expected[i % 3].append(packet.pop(0))
+                if not equally:
+                    for i in range(n_distributions, n_distributions + len(packet)):
+                        expected[i % 3].append(packet.pop(0))
+                self.assertListEqual([list(s) for s in sets], expected)
+                self.assertListEqual(list(s), packet)
+
     def test_distribute_withleftovers(self):
         """Test that the cards are correctly distributed"""
         n = 13
@@ -139,6 +183,181 @@ class TestCard(unittest.TestCase):
             self.assertNotIn(card, all_cards_after_shuffle)
 
 
+class TestCardsPacket(unittest.TestCase):
+    def test_draw_one_at_a_time(self):
+        """Drawing card by card gives the cards in the order of a set."""
+        cards = get_set_of_size(416)
+        s = CardsSet(cards)
+        packet = CardsPacket(cards)
+        from_set = [s.draw(1) for _ in range(len(cards))]
+        from_packet = [packet.draw(1) for _ in range(len(cards))]
+        self.assertListEqual(from_packet, from_set)
+        self.assertIsInstance(from_packet[0], CardsSet)
+        self.assertEqual(len(packet), 0)
+        self.assertRaises(IndexError, packet.draw, 1)
+
+    def test_draw(self):
+        cards = get_set_of_size(5)
+        packet = CardsPacket(cards)
+        self.assertListEqual(packet.draw(2), cards[:2])
+        self.assertListEqual(packet.draw(-2), [])
+        self.assertRaises(IndexError, packet.draw, 4)
+        self.assertListEqual(packet.draw(-1), cards[2:])
+
+    def test_pop(self):
+        cards = get_set_of_size(5)
+        packet = CardsPacket(cards)
+        self.assertIs(packet.pop(0), cards[0])
+        self.assertIs(packet.pop(), cards[4])
+        self.assertIs(packet.pop(1), cards[2])
+        self.assertListEqual(packet.to_set(), [cards[1], cards[3]])
+
+    def test_same_deals_as_set(self):
+        cards = get_set_of_size(13)
+        for kwargs in [{}, {"n_cards": 2}, {"equally": False}]:
+            with self.subTest(method="distribute", **kwargs):
+                s, packet = CardsSet(cards), CardsPacket(cards)
+                random.seed(1)
+                expected = s.distribute(4, **kwargs)
+                random.seed(1)
+                self.assertListEqual(packet.distribute(4, **kwargs), expected)
+                self.assertListEqual(packet.to_set(), s)
+        for kwargs in [
+            {},
+            {"equally": False},
+            {"n_cards_at_a_time": 3},
+            {"shuffle": True},
+        ]:
+            with self.subTest(method="distribute_to", **kwargs):
+                s, packet = CardsSet(cards), CardsPacket(cards)
+                expected = [CardsSet(), CardsSet(), CardsSet()]
+                random.seed(1)
+                s.distribute_to(expected, **kwargs)
+                sets = [CardsSet(), CardsSet(), CardsSet()]
+                random.seed(1)
+                packet.distribute_to(sets, **kwargs)
+                self.assertListEqual(sets, expected)
+                self.assertListEqual(packet.to_set(), s)
+
+
+@dataclass(eq=False)
+class EraCard(AbstractCard):
+    era: int = 1
+    add_card_at_playercount: int = 1
+
+
+class IndexedSet(CardsSet):
+    indexed_attributes = ("name", "era", "add_card_at_playercount")
+
+
+class TestIndexes(unittest.TestCase):
+    def get_cards(self, n: int, rng: random.Random) -> list[EraCard]:
+        return [
+            EraCard(f"{rng.randint(0, 5)}", rng.randint(1, 3), rng.randint(1, 7))
+            for _ in range(n)
+        ]
+
+    def assertSameLookups(self, cardset: IndexedSet):
+        reference = CardsSet(list(cardset))
+        for name in map(str, range(7)):
+            self.assertIs(cardset.find_by_name(name), reference.find_by_name(name))
+            self.assertEqual(
+                cardset.count_with("name", name), reference.count_with("name", name)
+            )
+        for era in range(4):
+            self.assertListEqual(
+                cardset.filter_by_era(era), reference.filter_by_era(era)
+            )
+        for n_players in range(8):
+            self.assertListEqual(
+                cardset.filter_for_n_players(n_players),
+                reference.filter_for_n_players(n_players),
+            )
+
+    def test_updated_on_mutations(self):
+        rng = random.Random(0)
+        cardset = IndexedSet(self.get_cards(30, rng))
+        mutations = [
+            lambda: cardset.append(*self.get_cards(1, rng)),
+            lambda: cardset.extend(self.get_cards(3, rng)),
+            lambda: cardset.pop(rng.randrange(len(cardset))),
+            lambda: cardset.pop(),
+            lambda: cardset.remove(rng.choice(cardset)),
+            lambda: cardset.draw(2),
+            lambda: cardset.insert(3, *self.get_cards(1, rng)),
+            lambda: cardset.shuffle(),
+            lambda: cardset.__iadd__(self.get_cards(2, rng)),
+            lambda: cardset.__delitem__(slice(2, 5)),
+        ]
+        self.assertSameLookups(cardset)
+        for _ in range(100):
+            rng.choice(mutations)()
+            self.assertSameLookups(cardset)
+
+    def test_add_index(self):
+        cards = self.get_cards(20, random.Random(1))
+        cardset = CardsSet(cards)
+        cardset.add_index("era")
+        self.assertListEqual(
+            cardset.cards_with("era", 2), [card for card in cards if card.era == 2]
+        )
+
+    def test_n_exemplar_in_set(self):
+        card = EraCard("A")
+        cards = [card, EraCard("A"), EraCard("B")]
+        self.assertEqual(card.n_exemplar_in_set(cards), 2)
+        self.assertEqual(card.n_exemplar_in_set(IndexedSet(cards)), 2)
+
+    def test_cards_without_attribute(self):
+        cards = self.get_cards(10, random.Random(2))
+        cards[3:3] = [AbstractCard("0"), AbstractCard("1")]
+        self.assertSameLookups(IndexedSet(cards))
+        self.assertNotIn(cards[3], IndexedSet(cards).filter_for_n_players(7))
+
+    def test_reindex(self):
+        cards = [EraCard("a", era=1), EraCard("b", era=1), EraCard("c", era=2)]
+        cardset = IndexedSet(cards)
+        self.assertEqual(cardset.count_with("era", 1), 2)
+        cards[0].era = 2
+        # The index keeps the value the card had when it was added
+        self.assertEqual(cardset.count_with("era", 1), 2)
+        cardset.reindex()
+        self.assertListEqual(cardset.cards_with("era", 2), [cards[0], cards[2]])
+        cards[1].era = 3
+        cardset.remove(cards[1])
+        self.assertEqual(cardset.count_with("era", 1), 0)
+        self.assertSameLookups(cardset)
+
+    def test_remove_many_with_same_value(self):
+        cards = [EraCard(f"{i}", era=i % 2) for i in range(1000)]
+        cardset = IndexedSet(cards)
+        self.assertEqual(cardset.count_with("era", 0), 500)
+        for card in cards[::2]:
+            cardset.remove(card)
+        self.assertEqual(cardset.count_with("era", 0), 0)
+        self.assertListEqual(cardset.cards_with("era", 1), cards[1::2])
+        cardset.draw(100)
+        self.assertListEqual(cardset.filter_by_era(1), cards[201::2])
+
+    def test_copy_and_pickle(self):
+        cardset = CardsSet([EraCard("a"), EraCard("a"), EraCard("b")])
+        cardset.add_index("name")
+        self.assertEqual(cardset.count_with("name", "a"), 2)
+        for copy_func in [
+            copy.copy,
+            copy.deepcopy,
+            lambda s: pickle.loads(pickle.dumps(s)),
+        ]:
+            with self.subTest(copy_func=copy_func):
+                copied = copy_func(cardset)
+                self.assertEqual(len(copied), 3)
+                self.assertEqual(copied.count_with("name", "a"), 2)
+                self.assertEqual(copied.find_by_name("b").name, "b")
+                self.assertEqual(cardset.count_with("name", "a"), 2)
+                copied.pop()
+                self.assertEqual(cardset.count_with("name", "b"), 1)
+
+
 class TestSaving(unittest.TestCase):
     test_file = Path("testcardsetsaving.json")
 
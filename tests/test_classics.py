@@ -0,0 +1,53 @@
+import unittest
+import pygame
+from pygame_cards.cache import named_caches, surface_bytes
+from pygame_cards.classics import CardSets, Colors, GlyphAtlas, Level, glyph_atlas
+
+
+class TestCardSets(unittest.TestCase):
+    def test_content(self):
+        n52, n36 = CardSets.n52, CardSets.n36
+        self.assertEqual((len(n52), len(n36)), (52, 36))
+        self.assertEqual((n52.name, n36.name), ("n52", "n36"))
+        self.assertEqual(n52[0].name, "2 of ♠")
+        self.assertEqual(n36[0].number, 6)
+        self.assertEqual(n52[-1].number, Level.AS)
+        self.assertEqual(n52[-1].color, Colors.CLUB)
+
+    def test_new_cards_each_access(self):
+        cards = CardSets.n52
+        cards.draw(10)
+        other_cards = CardSets.n52
+        self.assertEqual(len(other_cards), 52)
+        self.assertListEqual(
+            [card.name for card in other_cards[:10]],
+            [card.name for card in CardSets.n52[:10]],
+        )
+        self.assertFalse({card.u_id for card in cards} & {c.u_id for c in other_cards})
+
+
+class TestGlyphAtlas(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        pygame.font.init()
+
+    def test_label_shared(self):
+        atlas = GlyphAtlas()
+        label = atlas.label("K", "red", 20)
+        self.assertIs(atlas.label("K", "red", 20), label)
+        self.assertIsNot(atlas.label("K", "red", 21), label)
+
+    def test_budget(self):
+        label = GlyphAtlas().label("K", "red", 20)
+        atlas = GlyphAtlas(max_bytes=2 * surface_bytes(label))
+        for font_size in range(20, 30):
+            atlas.label("K", "red", font_size)
+        self.assertLessEqual(atlas._glyphs.stats.n_bytes, atlas._glyphs.max_bytes)
+        self.assertGreater(atlas._glyphs.stats.evictions, 0)
+
+    def test_registered_for_profiling(self):
+        self.assertIs(named_caches["glyphs"], glyph_atlas._glyphs)
+
+
+if __name__ == "__main__":
+    unittest.main()
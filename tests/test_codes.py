@@ -0,0 +1,64 @@
+import unittest
+import numpy as np
+from pygame_cards.abstract import AbstractCard
+from pygame_cards.classics import CardSets, Colors, Level
+from pygame_cards.codes import CardRegistry
+from pygame_cards.set import CardsSet
+
+
+class TestCardRegistry(unittest.TestCase):
+    def test_round_trip(self):
+        cards = CardSets.n52
+        codes = cards.to_codes()
+        self.assertEqual(codes.dtype, np.uint8)
+        self.assertListEqual(codes.tolist(), list(range(52)))
+        decoded = CardsSet.from_codes(codes[::-1], cards.registry)
+        self.assertListEqual(decoded, cards[::-1])
+        self.assertIs(decoded.registry, cards.registry)
+
+    def test_same_name_different_codes(self):
+        a, a2 = AbstractCard("A"), AbstractCard("A")
+        registry = CardRegistry([a, a2])
+        self.assertListEqual(registry.encode([a2, a, a2]).tolist(), [1, 0, 1])
+
+    def test_unknown_cards_registered(self):
+        a, b = AbstractCard("A"), AbstractCard("B")
+        registry = CardRegistry([a])
+        self.assertListEqual(registry.encode([b, a]).tolist(), [1, 0])
+        self.assertIn(b, registry)
+        self.assertEqual(registry.code(a), 0)
+
+    def test_large_registry_dtype(self):
+        registry = CardRegistry(AbstractCard(str(i)) for i in range(300))
+        self.assertEqual(registry.encode(registry.cards).dtype, np.int16)
+
+    def test_array_operations(self):
+        cards = CardSets.n52
+        registry = cards.registry
+        codes = np.random.default_rng(0).permutation(cards.to_codes())
+        hands = codes[:20].reshape(4, 5)
+
+        hearts = registry.values("color") == Colors.HEART
+        n_hearts = hearts[hands].sum(axis=1)
+        for hand, n in zip(hands, n_hearts):
+            hand_cards = registry.decode(hand)
+            self.assertEqual(
+                n, len([card for card in hand_cards if card.color == Colors.HEART])
+            )
+
+        kings = codes[registry.values("number")[codes] == Level.KING]
+        self.assertEqual(len(kings), 4)
+
+        counts = registry.counts(hands)
+        self.assertEqual(counts.sum(), 20)
+        self.assertTrue(np.all(counts[hands.ravel()] == 1))
+
+    def test_values_updated_on_register(self):
+        registry = CardRegistry([AbstractCard("A")])
+        self.assertListEqual(registry.values("name").tolist(), ["A"])
+        registry.register([AbstractCard("B")])
+        self.assertListEqual(registry.values("name").tolist(), ["A", "B"])
+
+
+if __name__ == "__main__":
+    unittest.main()
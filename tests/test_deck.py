@@ -0,0 +1,126 @@
+import unittest
+import weakref
+from numpy import linspace
+import pygame
+from pygame_cards.abstract import AbstractCard
+from pygame_cards.back import CardBackGraphics, card_backs_cache, load_card_back
+from pygame_cards.deck import Deck
+from pygame_cards.set import CardsSet
+from pygame_cards.utils import DEFAULT_CARDBACK
+
+
+def get_cards(n: int) -> CardsSet:
+    cards = CardsSet([AbstractCard(f"{i}") for i in range(n)])
+    for card in cards:
+        card.graphics_type = CardBackGraphics
+    return cards
+
+
+def get_deck(n: int, **kwargs) -> Deck:
+    """Return a deck with n cards, without rounded corners."""
+    return Deck(get_cards(n), card_size=(20, 30), card_border_radius_ratio=0, **kwargs)
+
+
+def reference_pile(deck: Deck) -> pygame.Surface:
+    """Pile made by blitting all the cards, as it was done before the edges."""
+    surf = pygame.Surface(deck.size, pygame.SRCALPHA)
+    n_positions = deck.max_cards or len(deck.cardset)
+    x_positions = linspace(0, deck.size[0] - deck.card_size[0], n_positions, dtype=int)
+    y_positions = linspace(deck.size[1] - deck.card_size[1], 0, n_positions, dtype=int)
+    for _, x, y in zip(deck.cardset, x_positions, y_positions):
+        surf.blit(deck.card_back, (x, y))
+    return surf
+
+
+class TestCardBack(unittest.TestCase):
+    def setUp(self) -> None:
+        card_backs_cache.clear()
+
+    def test_loaded_once(self):
+        back = load_card_back(DEFAULT_CARDBACK, (20, 30), add_border=True)
+        self.assertIs(load_card_back(str(DEFAULT_CARDBACK), (20, 30), 0, True), back)
+        self.assertIsNot(load_card_back(DEFAULT_CARDBACK, (20, 30)), back)
+        self.assertIsNot(load_card_back(DEFAULT_CARDBACK, (30, 40), 0, True), back)
+
+    def test_shared_between_decks(self):
+        self.assertIs(get_deck(3).card_back, get_deck(5).card_back)
+
+    def test_shared_between_card_graphics(self):
+        card, card2 = AbstractCard("A"), AbstractCard("B")
+        self.assertIs(CardBackGraphics(card).surface, CardBackGraphics(card2).surface)
+
+    def test_given_surface_not_modified(self):
+        surface = pygame.Surface((20, 30))
+        surface.fill("red")
+        back = load_card_back(surface, (20, 30), add_border=True)
+        self.assertIsNot(back, surface)
+        self.assertEqual(surface.get_at((0, 0)), pygame.Color("red"))
+
+    def test_no_reference_to_given_surface(self):
+        surface = pygame.Surface((20, 30))
+        load_card_back(surface, (20, 30))
+        load_card_back(surface, (10, 15))
+        self.assertEqual(len(card_backs_cache), 2)
+        source = weakref.ref(surface)
+        del surface
+        self.assertIsNone(source())
+        self.assertEqual(len(card_backs_cache), 0)
+
+    def test_file_not_found(self):
+        self.assertRaises(FileNotFoundError, load_card_back, "not_a_file", (20, 30))
+
+
+class TestPileEdges(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Rounded card backs are converted to alpha surfaces
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+
+    def assertSameSurface(self, surf: pygame.Surface, other: pygame.Surface):
+        self.assertEqual(surf.get_size(), other.get_size())
+        w, h = surf.get_size()
+        for x in range(w):
+            for y in range(h):
+                self.assertEqual(surf.get_at((x, y)), other.get_at((x, y)), (x, y))
+
+    def get_rounded_deck(self, n: int) -> Deck:
+        back = pygame.Surface((20, 30))
+        back.fill("red")
+        back.fill("blue", (2, 2, 16, 26))
+        return Deck(
+            get_cards(n),
+            size=(40, 45),
+            card_size=(20, 30),
+            card_border_radius_ratio=0.2,
+            card_back=back,
+        )
+
+    def test_same_as_reference(self):
+        for n in [1, 2, 10, 52]:
+            with self.subTest(n=n):
+                deck = self.get_rounded_deck(n)
+                self.assertSameSurface(deck.surface, reference_pile(deck))
+
+    def test_draw_and_add_cards(self):
+        deck = self.get_rounded_deck(20)
+        for n_cards in [1, 3, 1, 10]:
+            deck.draw_cards(n_cards)
+            self.assertSameSurface(deck.surface, reference_pile(deck))
+        deck.extend_cards(get_cards(4))
+        self.assertSameSurface(deck.surface, reference_pile(deck))
+        deck.draw_cards(-1)
+        self.assertSameSurface(deck.surface, reference_pile(deck))
+
+    def test_edges_updated_in_place(self):
+        deck = self.get_rounded_deck(20)
+        deck.surface
+        edges = deck._edges
+        deck.draw_cards(2)
+        deck.surface
+        self.assertIs(deck._edges, edges)
+        self.assertEqual(edges.n_cards, 17)
+
+
+if __name__ == "__main__":
+    unittest.main()
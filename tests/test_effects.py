@@ -0,0 +1,132 @@
+from math import sqrt
+import unittest
+import pygame
+from pygame_cards.effects import Decay, halo_cache, outer_halo
+
+
+def reference_outer_halo(
+    inner_surface: pygame.Surface,
+    radius: int = 20,
+    inner_color: pygame.Color = pygame.Color((255, 255, 255, 255)),
+    outer_color: pygame.Color = pygame.Color((255, 255, 255, 0)),
+    decay: Decay = Decay.QUADRATIC,
+    fill_inside: bool = True,
+) -> pygame.Surface:
+    """Halo computed pixel by pixel, as it was done before vectorizing."""
+    inner_size = inner_surface.get_size()
+    inner_size = (int(inner_size[0]), int(inner_size[1]))
+    radius = int(radius)
+    surf = pygame.Surface(
+        (inner_size[0] + 2 * radius, inner_size[1] + 2 * int(radius)),
+        pygame.SRCALPHA,
+    )
+    if fill_inside:
+        surf.fill(inner_color, pygame.Rect(radius, radius, *inner_size))
+    # A line with the pixel values for the halo, the value will be between 0 and radius
+    # When x = 0, decay = 0, and x= radius, decay = 1
+    match decay:
+        case Decay.LINEAR:
+            decay_func = lambda x: min(max(x / radius, 0), 1)
+        case Decay.QUADRATIC:
+            # a*x**2 + c
+            a = 1.0 / radius**2
+            decay_func = lambda x: 1 - a * (min(x, radius) - radius) ** 2
+        case Decay.NONE:
+            decay_func = lambda x: 1
+        case _:
+            raise NotImplementedError(f"{decay = } not implemented.")
+
+    halo_colors = [
+        inner_color.lerp(outer_color, decay_func(i)) for i in range(int(radius))
+    ]
+    # A line surface to put the halo on
+    line_surf = pygame.Surface((int(radius), 1), pygame.SRCALPHA)
+    for i, c in enumerate(halo_colors):
+        line_surf.set_at((i, 0), c)
+
+    blit_right = [
+        (line_surf, (inner_size[0] + radius, i))
+        for i in range(radius, inner_size[1] + radius)
+    ]
+    surf.blits(blit_right)
+
+    line_surf = pygame.transform.rotate(line_surf, 90)
+    blit_top = [(line_surf, (i, 0)) for i in range(radius, inner_size[0] + radius)]
+    surf.blits(blit_top)
+
+    line_surf = pygame.transform.rotate(line_surf, 90)
+    blit_left = [(line_surf, (0, i)) for i in range(radius, inner_size[1] + radius)]
+    surf.blits(blit_left)
+
+    line_surf = pygame.transform.rotate(line_surf, 90)
+    blit_bot = [
+        (line_surf, (i, radius + inner_size[1]))
+        for i in range(radius, inner_size[0] + radius)
+    ]
+    surf.blits(blit_bot)
+
+    # Now do the same for the edge but it is 2D
+    coords = sum([[(i, j) for i in range(radius)] for j in range(radius)], start=[])
+    rads = [sqrt(i**2 + j**2) for i, j in coords]
+    angle_surf = pygame.Surface((radius, radius), pygame.SRCALPHA)
+    for coord, r in zip(coords, rads):
+        angle_surf.set_at(coord, inner_color.lerp(outer_color, decay_func(r)))
+    surf.blit(angle_surf, (inner_size[0] + radius, inner_size[1] + radius))
+    angle_surf = pygame.transform.rotate(angle_surf, 90)
+    surf.blit(angle_surf, (inner_size[0] + radius, 0))
+    angle_surf = pygame.transform.rotate(angle_surf, 90)
+    surf.blit(angle_surf, (0, 0))
+    angle_surf = pygame.transform.rotate(angle_surf, 90)
+    surf.blit(angle_surf, (0, inner_size[1] + radius))
+
+    return surf
+
+
+class TestOuterHalo(unittest.TestCase):
+    inner_color = pygame.Color(255, 200, 30, 255)
+    outer_color = pygame.Color(10, 20, 30, 0)
+
+    def setUp(self) -> None:
+        halo_cache.clear()
+
+    def assertSameSurface(self, surf: pygame.Surface, other: pygame.Surface):
+        self.assertEqual(surf.get_size(), other.get_size())
+        w, h = surf.get_size()
+        for x in range(w):
+            for y in range(h):
+                self.assertEqual(surf.get_at((x, y)), other.get_at((x, y)), (x, y))
+
+    def test_same_as_reference(self):
+        for decay in Decay:
+            for fill_inside in [True, False]:
+                with self.subTest(decay=decay, fill_inside=fill_inside):
+                    self.assertSameSurface(
+                        outer_halo(
+                            pygame.Surface((7, 5)),
+                            radius=4,
+                            inner_color=self.inner_color,
+                            outer_color=self.outer_color,
+                            decay=decay,
+                            fill_inside=fill_inside,
+                        ),
+                        reference_outer_halo(
+                            pygame.Surface((7, 5)),
+                            radius=4,
+                            inner_color=self.inner_color,
+                            outer_color=self.outer_color,
+                            decay=decay,
+                            fill_inside=fill_inside,
+                        ),
+                    )
+
+    def test_halo_is_memoized(self):
+        halo = outer_halo(pygame.Surface((10, 10)), radius=3)
+        self.assertIs(outer_halo(pygame.Surface((10, 10)), radius=3), halo)
+        self.assertIsNot(outer_halo(pygame.Surface((10, 10)), radius=4), halo)
+        self.assertIsNot(
+            outer_halo(pygame.Surface((10, 10)), radius=3, decay=Decay.LINEAR), halo
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
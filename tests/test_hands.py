@@ -0,0 +1,421 @@
+from functools import cached_property
+import math
+import random
+import unittest
+import weakref
+import numpy
+import pygame
+from pygame_cards.abstract import AbstractCard, AbstractCardGraphics
+from pygame_cards.hands import (
+    AlignedHand,
+    CardOverlap,
+    HorizontalPileGraphic,
+    RoundedHand,
+    VerticalPileGraphic,
+    rotation_cache,
+)
+from pygame_cards.set import CardsSet
+
+
+class ColoredGraphics(AbstractCardGraphics):
+    """A card with a random color and a transparent corner."""
+
+    @cached_property
+    def surface(self) -> pygame.Surface:
+        surf = pygame.Surface(self.size, pygame.SRCALPHA)
+        surf.fill([random.randint(0, 255) for _ in range(3)])
+        surf.fill((0, 0, 0, 0), pygame.Rect(0, 0, 3, 3))
+        return surf
+
+
+def get_cards(n: int) -> CardsSet:
+    """Return a set of n colored cards."""
+    cards = CardsSet([AbstractCard(f"{i}") for i in range(n)])
+    for card in cards:
+        card.graphics_type = ColoredGraphics
+    return cards
+
+
+def pixels(surface: pygame.Surface) -> numpy.ndarray:
+    return numpy.dstack(
+        [pygame.surfarray.array3d(surface), pygame.surfarray.array_alpha(surface)]
+    )
+
+
+def reference_aligned_card_at(
+    hand: AlignedHand, pos: tuple[int, int]
+) -> AbstractCard | None:
+    """Card picked by scanning all the cards, as it was done before bisect."""
+    s = hand.surface.get_size()
+    if not (pos[0] < s[0] and pos[1] < s[1]):
+        return None
+    x_positions, offset = hand.calculate_x_positions()
+    for card_index, x_pos in enumerate(x_positions):
+        if pos[0] < x_pos or pos[0] > x_pos + hand.card_size[0]:
+            continue
+        if (
+            hand.overlap_hide == CardOverlap.right
+            and pos[0] - x_pos
+            > hand.card_size[0] + hand.card_spacing * hand.card_size[0]
+        ) or (
+            hand.overlap_hide == CardOverlap.left
+            and pos[0] - x_pos < hand.card_spacing * hand.card_size[0]
+        ):
+            continue
+        return hand.cardset[card_index]
+    return None
+
+
+def reference_pile_index_at(positions: list[float], card_length: float, pos: float):
+    """Index picked by scanning all the cards, as it was done before bisect."""
+    for card_idx in range(len(positions)):
+        if pos < positions[card_idx]:
+            return card_idx - 1
+    if pos < positions[-1] + card_length:
+        return len(positions) - 1
+    return None
+
+
+def reference_rounded_card_at(
+    hand: RoundedHand, pos: tuple[int, int]
+) -> AbstractCard | None:
+    """Card picked by checking all the cards, as it was done before the geometry."""
+    if pos[0] < 0 or pos[1] < 0 or pos[0] > hand.size[0] or pos[1] > hand.size[1]:
+        return None
+    geometry = hand.geometry
+    center, radius = geometry.center, geometry.radius
+    pos = (pos[0], hand.size[1] - pos[1])
+    dist_to_center = math.dist(pos, center)
+    if (
+        dist_to_center > radius + geometry.card_diagonal / 2
+        or dist_to_center < radius - geometry.card_diagonal / 2
+    ):
+        return None
+    for card, angle in zip(reversed(hand.cardset), reversed(geometry.angles)):
+        card_center = (
+            center[0] + math.sin(math.radians(angle)) * radius,
+            center[1] + math.cos(math.radians(angle)) * radius,
+        )
+        dist_to_card_center = math.dist(pos, card_center)
+        a = math.acos(
+            (dist_to_center**2 - dist_to_card_center**2 - radius**2)
+            / (-2 * dist_to_card_center * radius)
+        )
+        if math.sin(a) * dist_to_card_center < hand.card_size[0] / 2:
+            return card
+    return None
+
+
+class TestIncrementalSurface(unittest.TestCase):
+    def new_graphics(self, cardset: CardsSet):
+        return [
+            AlignedHand(cardset, size=(200, 50), card_size=(20, 30)),
+            AlignedHand(
+                cardset,
+                size=(200, 50),
+                card_size=(20, 30),
+                overlap_hide=CardOverlap.left,
+            ),
+            VerticalPileGraphic(cardset, size=(30, 100), card_size=(20, 30)),
+            HorizontalPileGraphic(cardset, size=(100, 40), card_size=(20, 30)),
+        ]
+
+    def assertSameAsFullRebuild(self, graphic):
+        incremental = graphic.surface
+        # Forget the previous composition to rebuild the surface
+        graphic._composition = None
+        graphic.clear_cache()
+        self.assertTrue(numpy.array_equal(pixels(incremental), pixels(graphic.surface)))
+
+    def test_random_mutations(self):
+        for graphic in self.new_graphics(get_cards(5)):
+            # Use a copy of the card to not share it between graphics
+            graphic.cardset = CardsSet(graphic.cardset)
+            spare_cards = get_cards(10)
+            for _ in range(30):
+                match random.choice(["append", "remove", "pop"]):
+                    case "append" if spare_cards:
+                        graphic.append_card(spare_cards.pop())
+                    case "remove" if graphic.cardset:
+                        graphic.remove_card(random.choice(graphic.cardset))
+                    case "pop" if graphic.cardset:
+                        graphic.pop_card(-1)
+                with self.subTest(graphic=type(graphic).__name__):
+                    self.assertSameAsFullRebuild(graphic)
+
+    def test_append_blits_only_new_card(self):
+        pile = VerticalPileGraphic(get_cards(3), size=(30, 200), card_size=(20, 30))
+        surface = pile.surface
+        new_card = get_cards(1)[0]
+        pile.append_card(new_card)
+
+        self.assertIsNot(pile.surface, surface)
+        self.assertEqual(pile.surface.get_at((1, 1)), surface.get_at((1, 1)))
+
+    def test_unchanged_keeps_surface(self):
+        pile = VerticalPileGraphic(get_cards(3), size=(30, 200), card_size=(20, 30))
+        surface = pile.surface
+        pile.clear_cache()
+        self.assertIs(pile.surface, surface)
+
+
+class TestCardAt(unittest.TestCase):
+    def test_aligned_hand(self):
+        for n_cards in [0, 1, 3, 10]:
+            for spacing in [-0.5, -0.15, 0, 0.3]:
+                for overlap in CardOverlap:
+                    hand = AlignedHand(
+                        get_cards(n_cards),
+                        size=(200, 50),
+                        card_size=(30, 40),
+                        card_spacing=spacing,
+                        overlap_hide=overlap,
+                    )
+                    with self.subTest(n=n_cards, spacing=spacing, overlap=overlap):
+                        for x in range(-5, 205):
+                            self.assertIs(
+                                hand.get_card_at((x, 10)),
+                                reference_aligned_card_at(hand, (x, 10)),
+                                x,
+                            )
+
+    def test_piles(self):
+        for n_cards in [1, 3, 30]:
+            vertical = VerticalPileGraphic(
+                get_cards(n_cards), size=(40, 200), card_size=(30, 40)
+            )
+            horizontal = HorizontalPileGraphic(
+                get_cards(n_cards), size=(200, 50), card_size=(30, 40)
+            )
+            with self.subTest(n=n_cards):
+                for i in range(-5, 205):
+                    self.assertEqual(
+                        vertical._get_card_index_at((10, i)),
+                        reference_pile_index_at(vertical.y_positions, 40, i),
+                    )
+                    self.assertEqual(
+                        horizontal._get_card_index_at((i, 10)),
+                        reference_pile_index_at(horizontal.x_positions, 30, i),
+                    )
+
+    def test_rounded_hand(self):
+        for n_cards in [1, 2, 7, 40]:
+            for quantum in [0, 1, 5]:
+                hand = RoundedHand(
+                    get_cards(n_cards),
+                    size=(300, 160),
+                    card_size=(30, 40),
+                    angle_quantum=quantum,
+                )
+                with self.subTest(n=n_cards, quantum=quantum):
+                    for x in range(-2, 302, 3):
+                        for y in range(-2, 162, 3):
+                            self.assertIs(
+                                hand.get_card_at((x, y)),
+                                reference_rounded_card_at(hand, (x, y)),
+                                (x, y),
+                            )
+
+    def test_rounded_hand_probed_pixels(self):
+        """Positions where the scan of all the cards was wrong."""
+        hand = RoundedHand(get_cards(5), size=(300, 160), card_size=(30, 40))
+        surface = hand.surface
+        # Right of the middle card, the scan picked it
+        self.assertEqual(surface.get_at((165, 24)).a, 0)
+        self.assertIs(reference_rounded_card_at(hand, (165, 24)), hand.cardset[2])
+        self.assertIsNone(hand.get_card_at((165, 24)))
+        self.assertIs(hand.get_card_at((164, 24)), hand.cardset[2])
+        # On the axis of the middle card, the scan raised a math domain error
+        self.assertRaises(ValueError, reference_rounded_card_at, hand, (150, 24))
+        self.assertIs(hand.get_card_at((150, 24)), hand.cardset[2])
+
+    def test_rounded_hand_after_plays(self):
+        hand = RoundedHand(get_cards(13), size=(300, 160), card_size=(30, 40))
+        for index in [3, 0, 8, 4]:
+            hand.pop_card(index)
+            with self.subTest(n=len(hand.cardset)):
+                for x in range(-2, 302, 3):
+                    for y in range(-2, 162, 3):
+                        self.assertIs(
+                            hand.get_card_at((x, y)),
+                            reference_rounded_card_at(hand, (x, y)),
+                            (x, y),
+                        )
+
+    def test_rounded_hand_before_surface(self):
+        hand = RoundedHand(get_cards(5), size=(300, 160), card_size=(30, 40))
+        self.assertIs(hand.get_card_at((150, 30)), hand.cardset[2])
+        self.assertNotIn("surface", hand.__dict__)
+
+    def test_positions_follow_cards(self):
+        hand = AlignedHand(get_cards(3), size=(200, 50), card_size=(30, 40))
+        hand.get_card_at((10, 10))
+        card = get_cards(1)[0]
+        hand.append_card(card)
+        self.assertEqual(len(hand.x_positions), 4)
+        self.assertIs(hand.get_card_at((hand.x_positions[3] + 1, 10)), card)
+
+
+class TestHoveredSprite(unittest.TestCase):
+    def setUp(self) -> None:
+        self.hand = AlignedHand(get_cards(4), size=(200, 80), card_size=(30, 40))
+
+    def test_card_sized(self):
+        card = self.hand.cardset[1]
+        sprite, position = self.hand.hovered_sprite(card)
+        self.assertEqual(sprite.get_size(), (70, 80))
+        self.assertEqual(position, (self.hand.x_positions[1] - 20, 20 - 20))
+
+    def test_same_as_with_hovered(self):
+        card = self.hand.cardset[2]
+        sprite, position = self.hand.hovered_sprite(card)
+        surf = pygame.Surface(self.hand.size, pygame.SRCALPHA)
+        surf.blit(sprite, position)
+        numpy.testing.assert_array_equal(
+            pixels(surf), pixels(self.hand.with_hovered(card))
+        )
+
+    def test_cached_until_layout_changes(self):
+        card = self.hand.cardset[0]
+        sprite, _ = self.hand.hovered_sprite(card)
+        self.assertIs(self.hand.hovered_sprite(card)[0], sprite)
+        self.hand.append_card(get_cards(1)[0])
+        self.assertIsNot(self.hand.hovered_sprite(card)[0], sprite)
+
+    def test_card_surface_changed(self):
+        card = self.hand.cardset[0]
+        sprite, _ = self.hand.hovered_sprite(card)
+        card.graphics.clear_cache()
+        self.assertIsNot(self.hand.hovered_sprite(card)[0], sprite)
+
+
+class AnimatedHoverHand(AlignedHand):
+    """A hand with a hovered card changing at every frame."""
+
+    def with_hovered(self, card, **kwargs) -> pygame.Surface:
+        return pygame.Surface(self.size, pygame.SRCALPHA)
+
+
+class TestHoveredSpriteOverridden(unittest.TestCase):
+    def test_with_hovered_not_cached(self):
+        hand = AnimatedHoverHand(get_cards(4), size=(200, 80), card_size=(30, 40))
+        card = hand.cardset[0]
+        sprite, position = hand.hovered_sprite(card)
+        self.assertEqual(position, (0, 0))
+        self.assertEqual(sprite.get_size(), hand.size)
+        self.assertIsNot(hand.hovered_sprite(card)[0], sprite)
+
+    def test_render_hovered_sprite_cached(self):
+        hand = AlignedHand(get_cards(4), size=(200, 80), card_size=(30, 40))
+        card = hand.cardset[0]
+        self.assertIs(hand.hovered_sprite(card)[0], hand.hovered_sprite(card)[0])
+
+
+class TestAvoidRescaling(unittest.TestCase):
+    def test_same_size_not_rescaled(self):
+        hand = AlignedHand(get_cards(4), size=(200, 50), card_size=(20, 30))
+        hand.surface
+        self.assertEqual(hand.n_scales, 0)
+        self.assertEqual(hand.n_avoided_scales, 4)
+        card = hand.cardset[0]
+        self.assertIs(hand.card_surface(card), card.graphics.surface)
+
+    def test_rescaled_once(self):
+        hand = AlignedHand(get_cards(4), size=(200, 50), card_size=(20, 30))
+        card = hand.cardset[0]
+        card.graphics = ColoredGraphics(card, size=(40, 60))
+
+        scaled = hand.card_surface(card)
+        self.assertEqual(scaled.get_size(), (20, 30))
+        self.assertIs(hand.card_surface(card), scaled)
+        self.assertEqual(hand.n_scales, 1)
+
+    def test_moved_card_not_rendered_again(self):
+        hand = AlignedHand(get_cards(4), size=(200, 50), card_size=(20, 30))
+        other = AlignedHand(get_cards(2), size=(200, 50), card_size=(20, 30))
+        card = hand.cardset[0]
+        surface = card.graphics.surface
+        other.append_card(hand.pop_card(0))
+        self.assertIs(card.graphics.surface, surface)
+        smaller = AlignedHand(get_cards(2), size=(200, 50), card_size=(10, 15))
+        smaller.extend_cards(CardsSet([other.pop_card(2)]))
+        self.assertEqual(card.graphics.surface.get_size(), (10, 15))
+
+    def test_hovered_not_rescaled(self):
+        hand = AlignedHand(get_cards(4), size=(200, 50), card_size=(20, 30))
+        hand.with_hovered(hand.cardset[1], radius=5)
+        self.assertEqual(hand.n_scales, 0)
+
+
+class TestRotationCache(unittest.TestCase):
+    def setUp(self) -> None:
+        rotation_cache.clear()
+        rotation_cache.reset_stats()
+
+    def test_rotations_reused(self):
+        cards = get_cards(13)
+        hand = RoundedHand(cards, card_size=(20, 30), angle_quantum=5)
+        hand.surface
+        hand.pop_card(6)
+        hand.surface
+        self.assertGreater(rotation_cache.stats.hits, 0)
+
+    def test_angles_kept_when_card_played(self):
+        hand = RoundedHand(get_cards(13), card_size=(20, 30))
+        hand.surface
+        angles = dict(zip(hand.cardset, hand.geometry.angles))
+        hand.pop_card(3)
+        rotation_cache.reset_stats()
+        hand.surface
+        kept = [
+            card
+            for card, angle in zip(hand.cardset, hand.geometry.angles)
+            if angles[card] == angle
+        ]
+        # The cards on the longest side of the played card keep their angle
+        self.assertEqual(len(kept), 9)
+        self.assertEqual(rotation_cache.stats.hits, 9)
+        # Still centered up to half a step
+        self.assertAlmostEqual(
+            hand.geometry.angles[0] + hand.geometry.angles[-1], 90 / 12
+        )
+
+    def test_spread_again_when_card_added(self):
+        hand = RoundedHand(get_cards(7), card_size=(20, 30))
+        hand.surface
+        hand.pop_card(0)
+        hand.surface
+        hand.append_card(get_cards(1)[0])
+        self.assertAlmostEqual(hand.geometry.angles[0], -45)
+        self.assertAlmostEqual(hand.geometry.angles[-1], 45)
+
+    def test_angles_quantized(self):
+        hand = RoundedHand(get_cards(4), card_size=(20, 30), angle_quantum=2)
+        hand.surface
+        for angle in hand.geometry.angles:
+            self.assertAlmostEqual(angle % 2, 0)
+
+    def test_no_quantum(self):
+        hand = RoundedHand(get_cards(4), card_size=(20, 30), angle_quantum=0)
+        hand.surface
+        self.assertAlmostEqual(hand.geometry.angles[1], -15)
+
+    def test_exact_angles_by_default(self):
+        hand = RoundedHand(get_cards(7), card_size=(20, 30), angle=100)
+        self.assertAlmostEqual(hand.geometry.angles[1], -50 + 100 / 6)
+
+    def test_no_reference_to_source(self):
+        hand = RoundedHand(get_cards(4), card_size=(20, 30))
+        hand.surface
+        n_rotations = len(rotation_cache)
+        self.assertGreater(n_rotations, 0)
+        card = hand.cardset[0]
+        source = weakref.ref(hand.card_surface(card))
+        card.graphics.clear_cache()
+        hand.clear_cache()
+        self.assertIsNone(source())
+        self.assertEqual(len(rotation_cache), n_rotations - 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+import logging
+import unittest
+from pygame_cards.io.utils import _logger, item_to_json
+
+
+class CountingRepr:
+    """Object counting how many times it was formatted."""
+
+    n_formats = 0
+
+    def __init__(self) -> None:
+        self.value = 1
+
+    def __repr__(self) -> str:
+        type(self).n_formats += 1
+        return "CountingRepr()"
+
+
+class TestLazyLogging(unittest.TestCase):
+    def setUp(self) -> None:
+        CountingRepr.n_formats = 0
+        self.addCleanup(_logger.setLevel, _logger.level)
+
+    def test_not_formatted_at_info(self):
+        _logger.setLevel(logging.INFO)
+        self.assertEqual(item_to_json([CountingRepr()]), [{"value": 1}])
+        self.assertEqual(CountingRepr.n_formats, 0)
+
+    def test_formatted_at_debug(self):
+        _logger.setLevel(logging.DEBUG)
+        with self.assertLogs(_logger, logging.DEBUG):
+            self.assertEqual(item_to_json([CountingRepr()]), [{"value": 1}])
+        self.assertGreater(CountingRepr.n_formats, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
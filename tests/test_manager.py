@@ -0,0 +1,351 @@
+import unittest
+import pygame
+from pygame_cards.abstract import AbstractCard, AbstractCardGraphics
+from pygame_cards.events import CARD_MOVED, CARDSSET_CLICKED
+from pygame_cards.hands import AlignedHand
+from pygame_cards.manager import CardSetRights, CardsManager, DragSprite
+from pygame_cards.set import CardsSet
+
+
+def get_hand(n: int) -> AlignedHand:
+    """Return a hand with n cards."""
+    cards = CardsSet([AbstractCard(f"{i}") for i in range(n)])
+    for card in cards:
+        card.graphics_type = AbstractCardGraphics
+    return AlignedHand(cards, size=(100, 50), card_size=(20, 40))
+
+
+class TestDirtyRects(unittest.TestCase):
+    def setUp(self) -> None:
+        self.window = pygame.Surface((400, 300))
+        self.manager = CardsManager(dirty_rects=True)
+        self.hand, self.other_hand = get_hand(3), get_hand(2)
+        self.manager.add_set(self.hand, (10, 10))
+        self.manager.add_set(self.other_hand, (200, 200))
+
+    def test_full_draw_by_default(self):
+        manager = CardsManager()
+        manager.add_set(self.hand, (10, 10))
+        self.assertEqual(manager.draw(self.window), [self.window.get_rect()])
+        self.assertEqual(manager.draw(self.window), [self.window.get_rect()])
+
+    def test_first_draw_is_full(self):
+        self.assertEqual(self.manager.draw(self.window), [self.window.get_rect()])
+
+    def test_nothing_changed(self):
+        self.manager.draw(self.window)
+        self.assertEqual(self.manager.draw(self.window), [])
+
+    def test_only_changed_set(self):
+        self.manager.draw(self.window)
+        card = AbstractCard("new")
+        card.graphics_type = AbstractCardGraphics
+        self.other_hand.append_card(card)
+
+        self.assertEqual(
+            self.manager.draw(self.window), [pygame.Rect((200, 200), (100, 50))]
+        )
+
+    def test_hover_changed(self):
+        self.manager.draw(self.window)
+        self.manager.mouse_pos = (15, 30)
+        self.manager.update(1)
+
+        self.assertEqual(
+            self.manager.draw(self.window), [pygame.Rect((10, 10), (100, 50))]
+        )
+        self.assertEqual(self.manager.draw(self.window), [])
+
+    def test_hovered_clipped_to_set(self):
+        """The hovered card is drawn the same with and without dirty rects."""
+        windows = []
+        for dirty_rects in [True, False]:
+            manager = CardsManager(dirty_rects=dirty_rects)
+            manager.add_set(self.hand, (10, 10))
+            manager.mouse_pos = (15, 30)
+            manager.update(1)
+            window = pygame.Surface((400, 300))
+            window.fill("blue")
+            manager.draw(window)
+            windows.append(pygame.surfarray.array3d(window))
+        self.assertTrue((windows[0] == windows[1]).all())
+        # The halo of the hovered card does not go out of the set
+        self.assertEqual(
+            pygame.Color(*windows[1][5, 30].tolist()), pygame.Color("blue")
+        )
+
+    def test_background_restored(self):
+        self.window.fill("red")
+        self.manager.draw(self.window)
+        self.hand.remove_all_cards()
+        self.manager.draw(self.window)
+        self.assertEqual(self.window.get_at((15, 30)), pygame.Color("red"))
+
+    def test_moved_set(self):
+        self.manager.draw(self.window)
+        self.manager.move_set(self.other_hand, (250, 200))
+        self.assertEqual(
+            self.manager.draw(self.window), [pygame.Rect((200, 200), (150, 50))]
+        )
+
+    def test_removed_set(self):
+        self.manager.draw(self.window)
+        self.manager.remove_set(self.other_hand)
+        self.assertEqual(
+            self.manager.draw(self.window), [pygame.Rect((200, 200), (100, 50))]
+        )
+
+    def test_invalidate(self):
+        self.manager.draw(self.window)
+        self.manager.invalidate()
+        self.assertEqual(self.manager.draw(self.window), [self.window.get_rect()])
+
+
+class TestSetsUnderMouse(unittest.TestCase):
+    def setUp(self) -> None:
+        self.manager = CardsManager()
+        self.hand, self.other_hand = get_hand(3), get_hand(2)
+        self.manager.add_set(self.hand, (10, 10))
+        self.manager.add_set(self.other_hand, (200, 200))
+
+    def test_hovered_set(self):
+        self.manager.mouse_pos = (215, 220)
+        self.manager.update(1)
+        self.assertIs(self.manager._cardset_under_mouse, self.other_hand)
+        self.assertIs(self.manager._card_under_mouse, self.other_hand.cardset[0])
+
+    def test_set_moved(self):
+        self.manager.move_set(self.other_hand, (10, 100))
+        self.manager.mouse_pos = (215, 220)
+        self.manager.update(1)
+        self.assertIsNone(self.manager._cardset_under_mouse)
+        self.manager.mouse_pos = (15, 120)
+        self.manager.update(1)
+        self.assertIs(self.manager._cardset_under_mouse, self.other_hand)
+        self.assertEqual(self.manager.get_position(self.other_hand), (10, 100))
+
+    def test_set_removed(self):
+        self.manager.mouse_pos = (215, 220)
+        self.manager.update(1)
+        self.manager.remove_set(self.other_hand)
+        self.assertIsNone(self.manager._cardset_under_mouse)
+        self.assertEqual(self.manager.card_sets, [self.hand])
+        self.manager.update(1)
+        self.assertIsNone(self.manager._cardset_under_mouse)
+
+    def test_card_sets_changes_deprecated(self):
+        hand = get_hand(1)
+        with self.assertWarns(DeprecationWarning):
+            self.manager.card_sets.append(hand)
+        self.assertEqual(self.manager.get_position(hand), (0, 0))
+        self.assertIs(self.manager.card_sets[-1], hand)
+        with self.assertWarns(DeprecationWarning):
+            self.manager.card_sets.remove(self.hand)
+        self.assertListEqual(self.manager.card_sets, [self.other_hand, hand])
+        with self.assertWarns(DeprecationWarning):
+            del self.manager.card_sets[0]
+        self.assertListEqual(self.manager.card_sets, [hand])
+
+    def test_z_order(self):
+        # Same layout as the hand, at the same position
+        below = get_hand(3)
+        self.manager.add_set(below, (10, 10), z_order=-1)
+        self.assertListEqual(
+            self.manager.card_sets, [below, self.hand, self.other_hand]
+        )
+        self.manager.mouse_pos = (15, 20)
+        self.manager.update(1)
+        self.assertIs(self.manager._cardset_under_mouse, self.hand)
+
+        self.manager.set_z_order(below, 5)
+        self.assertEqual(self.manager.card_sets, [self.hand, self.other_hand, below])
+        self.manager.mouse_pos = (15, 20)
+        self.manager.update(1)
+        self.assertIs(self.manager._cardset_under_mouse, below)
+        self.assertIs(self.manager._card_under_mouse, below.cardset[0])
+
+    def test_set_resized(self):
+        self.hand.size = (300, 50)
+        self.manager.mouse_pos = (250, 30)
+        self.manager.update(1)
+        self.assertIs(self.manager._cardset_under_mouse, self.hand)
+
+
+class TestHeadless(unittest.TestCase):
+    def setUp(self) -> None:
+        self.events = []
+        self.pointer_pos = (0, 0)
+        self.manager = CardsManager(
+            headless=True,
+            pointer=lambda: self.pointer_pos,
+            post_event=self.events.append,
+        )
+        self.hand, self.other_hand = get_hand(3), get_hand(2)
+        self.manager.add_set(
+            self.hand, (10, 10), CardSetRights(clickable=True, draggable_in=False)
+        )
+        self.manager.add_set(self.other_hand, (200, 200))
+
+    def press(self, button_type: int, pos: tuple[int, int]) -> None:
+        self.manager.process_events(pygame.event.Event(button_type, {"pos": pos}))
+        self.manager.update(1)
+
+    def test_click(self):
+        card = self.hand.cardset[0]
+        self.press(pygame.MOUSEBUTTONDOWN, (15, 30))
+        self.press(pygame.MOUSEBUTTONUP, (15, 30))
+        self.assertEqual([event.type for event in self.events], [CARDSSET_CLICKED])
+        self.assertIs(self.events[0].card, card)
+
+    def test_drag_and_drop(self):
+        card = self.hand.cardset[0]
+        self.press(pygame.MOUSEBUTTONDOWN, (15, 30))
+        self.pointer_pos = (210, 220)
+        self.manager.update(1)
+        self.press(pygame.MOUSEBUTTONUP, (210, 220))
+
+        self.assertIn(card, self.other_hand.cardset)
+        self.assertEqual([event.type for event in self.events], [CARD_MOVED])
+
+    def test_nothing_rendered(self):
+        self.pointer_pos = (15, 30)
+        self.manager.update(1)
+        self.assertEqual(self.manager.draw(pygame.Surface((400, 300))), [])
+        self.assertIs(self.manager._card_under_mouse, self.hand.cardset[0])
+        self.assertNotIn("surface", self.hand.__dict__)
+        self.assertNotIn("surface", self.other_hand.__dict__)
+
+
+class TestAnimations(unittest.TestCase):
+    def setUp(self) -> None:
+        self.events = []
+        self.manager = CardsManager(post_event=self.events.append)
+        self.hand, self.other_hand = get_hand(3), get_hand(2)
+        self.manager.add_set(self.hand, (10, 10))
+        self.manager.add_set(self.other_hand, (200, 200))
+
+    def test_move(self):
+        card = self.hand.cardset[1]
+        animation = self.manager.animate_card_move(
+            card, self.hand, self.other_hand, duration=100
+        )
+        self.assertNotIn(card, self.hand.cardset)
+        self.assertNotIn(card, self.other_hand.cardset)
+        self.assertEqual(animation.start, (10 + self.hand.x_positions[1], 15))
+        self.manager.update(50)
+        self.assertEqual(self.events, [])
+
+        self.manager.update(50)
+        self.assertEqual(self.manager.animations, [])
+        self.assertIs(self.other_hand.cardset[-1], card)
+        self.assertEqual([event.type for event in self.events], [CARD_MOVED])
+        end = self.other_hand.get_card_positions()[card]
+        self.assertEqual(animation.end, (200 + end[0], 200 + end[1]))
+
+    def test_target_unchanged_during_move(self):
+        surface = self.other_hand.surface
+        self.manager.animate_card_move(self.hand.cardset[0], self.hand, self.other_hand)
+        self.manager.update(10)
+        self.assertIs(self.other_hand.surface, surface)
+
+    def test_landing_after_moving_cards(self):
+        cards = list(self.hand.cardset[:2])
+        animations = [
+            self.manager.animate_card_move(card, self.hand, self.other_hand)
+            for card in cards
+        ]
+        self.assertNotEqual(animations[0].end, animations[1].end)
+        self.manager.update(1000)
+        self.assertEqual(list(self.other_hand.cardset[-2:]), cards)
+        for card, animation in zip(cards, animations):
+            end = self.other_hand.get_card_positions()[card]
+            self.assertEqual(animation.end, (200 + end[0], 200 + end[1]))
+
+    def test_landing_positions_leave_set_unchanged(self):
+        self.other_hand.cardset.add_index("name")
+        self.other_hand.cardset.count_with("name", "0")
+        next_order = self.other_hand.cardset._next_order
+        surface = self.other_hand.surface
+        state = self.other_hand.__dict__.copy()
+        cards = list(self.hand.cardset[:2])
+
+        landing = self.other_hand.landing_positions(cards)
+
+        self.assertEqual(list(landing), cards)
+        # The index of the set was not updated
+        self.assertEqual(self.other_hand.cardset._next_order, next_order)
+        self.assertEqual(self.other_hand.__dict__, state)
+        self.assertIs(self.other_hand.surface, surface)
+        self.other_hand.extend_cards(CardsSet(cards))
+        positions = self.other_hand.get_card_positions()
+        self.assertEqual(landing, {card: positions[card] for card in cards})
+
+    def test_dirty_rects(self):
+        manager = CardsManager(dirty_rects=True, post_event=self.events.append)
+        manager.add_set(self.hand, (10, 10))
+        manager.add_set(self.other_hand, (200, 200))
+        window = pygame.Surface((400, 300))
+        manager.draw(window)
+        manager.animate_card_move(self.hand.cardset[0], self.hand, self.other_hand)
+        manager.update(100)
+        dirty = manager.draw(window)
+        self.assertNotEqual(dirty, [window.get_rect()])
+        self.assertGreater(len(dirty), 0)
+
+
+class TestCrazy(unittest.TestCase):
+    def test_all_sets_bounce(self):
+        manager = CardsManager()
+        manager.add_set(get_hand(3), (10, 10))
+        manager.add_set(get_hand(2), (200, 200))
+        window = pygame.Surface((400, 300))
+        crazy_cards = manager.start_crazy(window)
+        self.assertEqual(len(crazy_cards), 5)
+
+        positions = crazy_cards.positions.copy()
+        manager.update(100)
+        self.assertFalse((crazy_cards.positions == positions).all())
+        manager.draw(window)
+        manager.stop_crazy()
+        self.assertIsNone(manager.crazy_cards)
+
+
+class TestDragSprite(unittest.TestCase):
+    def test_frames(self):
+        sprite = DragSprite(pygame.Surface((10, 20)), max_angle=30, angle_step=10)
+        self.assertEqual(len(sprite.frames), 7)
+        self.assertEqual(sprite.frame(12)[1], 10)
+        self.assertEqual(sprite.frame(-100)[1], -30)
+        self.assertEqual(sprite.frame(0)[0].get_size(), (10, 20))
+
+    def test_drag_and_drop(self):
+        window = pygame.Surface((400, 300))
+        manager = CardsManager()
+        hand, other_hand = get_hand(3), get_hand(0)
+        manager.add_set(hand, (10, 10))
+        manager.add_set(other_hand, (200, 200))
+
+        manager.process_events(
+            pygame.event.Event(pygame.MOUSEBUTTONDOWN, {"pos": (15, 30)})
+        )
+        manager.update(1)
+        manager.draw(window)
+        sprite = manager._drag_sprite
+        self.assertIsNotNone(sprite)
+        for pos in [(40, 40), (100, 100), (210, 210)]:
+            manager.mouse_pos = pos
+            manager.update(1)
+            manager.draw(window)
+            # Frames are not rendered again while dragging
+            self.assertIs(manager._drag_sprite, sprite)
+
+        manager.process_events(
+            pygame.event.Event(pygame.MOUSEBUTTONUP, {"pos": (210, 210)})
+        )
+        manager.update(1)
+        self.assertIsNone(manager._drag_sprite)
+        self.assertEqual(len(other_hand.cardset), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
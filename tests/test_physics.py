@@ -0,0 +1,60 @@
+import unittest
+import numpy
+import pygame
+from pygame_cards.abstract import AbstractCard, AbstractCardGraphics
+from pygame_cards.physics import CardParticles
+
+
+def get_cards(n: int) -> list[AbstractCard]:
+    cards = [AbstractCard(f"{i}") for i in range(n)]
+    for card in cards:
+        card.graphics = AbstractCardGraphics(card, size=(20, 30))
+    return cards
+
+
+def reference_steps(
+    particles: CardParticles, n_steps: int
+) -> tuple[list[float], list[float]]:
+    """Positions after moving the cards one by one, as start_crazy did."""
+    x_positions, y_positions = particles.positions.T.tolist()
+    x_velocities, y_velocities = particles.velocities.T.tolist()
+    width, height = particles.bounds
+    for _ in range(n_steps):
+        for i, card in enumerate(particles.cards):
+            x_positions[i] += x_velocities[i]
+            y_positions[i] += y_velocities[i]
+            y_velocities[i] += particles.gravity
+            if y_positions[i] > height - card.graphics.size[1]:
+                y_velocities[i] = -y_velocities[i]
+            if x_positions[i] < 0 or x_positions[i] > width - card.graphics.size[0]:
+                x_velocities[i] = -x_velocities[i]
+    return x_positions, y_positions
+
+
+class TestCardParticles(unittest.TestCase):
+    def setUp(self) -> None:
+        positions = [(10 * i, 5 * i) for i in range(50)]
+        self.particles = CardParticles(
+            get_cards(50), positions, bounds=(400, 300), seed=0
+        )
+
+    def test_same_as_reference(self):
+        x_positions, y_positions = reference_steps(self.particles, 200)
+        for _ in range(200):
+            self.particles.step()
+        numpy.testing.assert_allclose(self.particles.positions[:, 0], x_positions)
+        numpy.testing.assert_allclose(self.particles.positions[:, 1], y_positions)
+
+    def test_update_with_time(self):
+        self.assertEqual(self.particles.update(20), 0)
+        self.assertEqual(self.particles.update(20), 1)
+        self.assertEqual(self.particles.update(1000), 30)
+
+    def test_draw(self):
+        surface = pygame.Surface((400, 300))
+        self.particles.draw(surface)
+        self.assertEqual(surface.get_at((15, 10)), pygame.Color("white"))
+
+
+if __name__ == "__main__":
+    unittest.main()
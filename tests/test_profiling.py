@@ -0,0 +1,121 @@
+import unittest
+from functools import cached_property
+import pygame
+from pygame_cards.abstract import AbstractCard, AbstractCardGraphics
+from pygame_cards.cache import (
+    SurfaceCache,
+    cached_surface,
+    named_caches,
+    surface_cache,
+)
+from pygame_cards.profiling import Profiler, profiler
+
+
+class ProfiledGraphics(AbstractCardGraphics):
+    @cached_property
+    def surface(self) -> pygame.Surface:
+        return pygame.Surface(self.size)
+
+
+class SharedProfiledGraphics(AbstractCardGraphics):
+    @property
+    def render_key(self):
+        return self.card.name
+
+    @cached_surface
+    def surface(self) -> pygame.Surface:
+        return pygame.Surface(self.size)
+
+
+class TestProfiler(unittest.TestCase):
+    def test_phase_recorded_only_when_enabled(self):
+        prof = Profiler()
+        with prof.phase("a"):
+            pass
+        self.assertNotIn("a", prof.totals)
+        prof.enable()
+        with prof.phase("a"):
+            pass
+        self.assertIn("a", prof.totals)
+        self.assertEqual(len(prof._durations["a"]), 1)
+
+    def test_profiled(self):
+        prof = Profiler()
+        func = prof.profiled("func")(lambda x: 2 * x)
+        self.assertEqual(func(2), 4)
+        self.assertNotIn("func", prof.totals)
+        prof.enable()
+        self.assertEqual(func(3), 6)
+        self.assertIn("func", prof.totals)
+
+    def test_percentiles(self):
+        prof = Profiler(window=3)
+        self.assertEqual(prof.percentiles("a"), {50: 0.0, 90: 0.0, 99: 0.0})
+        for duration in [100.0, 1.0, 2.0, 3.0]:
+            prof.record("a", duration)
+        # Only the last durations are kept
+        self.assertEqual(prof.percentiles("a", q=(0, 50, 100)), {0: 1, 50: 2, 100: 3})
+        self.assertEqual(prof.totals["a"], 106.0)
+
+
+class TestGlobalProfiler(unittest.TestCase):
+    def setUp(self) -> None:
+        profiler.reset()
+        profiler.enable()
+        surface_cache.clear()
+
+    def tearDown(self) -> None:
+        profiler.disable()
+        profiler.reset()
+
+    def test_rebuilds_counted_per_class(self):
+        card = AbstractCard("A")
+        card.graphics = ProfiledGraphics(card)
+        card.graphics.surface
+        card.graphics.surface
+        card.graphics.clear_cache()
+        card.graphics.surface
+        self.assertEqual(profiler.rebuilds["ProfiledGraphics"], 2)
+        self.assertIn("ProfiledGraphics.surface", profiler.totals)
+
+    def test_shared_surfaces_counted_once(self):
+        card, card2 = AbstractCard("A"), AbstractCard("A")
+        card.graphics = SharedProfiledGraphics(card)
+        card2.graphics = SharedProfiledGraphics(card2)
+        card.graphics.surface
+        card2.graphics.surface
+        self.assertEqual(profiler.rebuilds["SharedProfiledGraphics"], 1)
+
+    def test_frame_report(self):
+        card = AbstractCard("A")
+        card.graphics = SharedProfiledGraphics(card)
+        card.graphics.surface
+        card.graphics.clear_cache()
+        with profiler.frame() as report:
+            with profiler.phase("phase"):
+                card.graphics.surface
+                card.graphics.clear_cache()
+                card.graphics.surface
+        self.assertIn("phase", report.phases)
+        self.assertGreaterEqual(report.duration, report.phases["phase"])
+        self.assertEqual(report.rebuilds, {})
+        self.assertEqual(report.caches["surface"].hits, 2)
+        self.assertEqual(report.caches["surface"].misses, 0)
+        self.assertIn("Frame:", str(report))
+
+    def test_named_cache_reported(self):
+        cache = SurfaceCache(name="test_profiling")
+        self.addCleanup(named_caches.pop, "test_profiling")
+        cache.get("missing")
+        self.assertEqual(profiler.cache_stats()["test_profiling"].misses, 1)
+
+    def test_frame_disabled(self):
+        profiler.disable()
+        with profiler.frame() as report:
+            with profiler.phase("phase"):
+                pass
+        self.assertEqual(report.phases, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
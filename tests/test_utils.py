@@ -0,0 +1,38 @@
+import unittest
+import pygame
+from pygame_cards.utils import SpatialGrid, merge_rects
+
+
+class TestMergeRects(unittest.TestCase):
+    def test_merge_overlapping(self):
+        merged = merge_rects([(0, 0, 10, 10), (5, 5, 10, 10), (50, 50, 1, 1)])
+        self.assertEqual(merged, [pygame.Rect(0, 0, 15, 15), pygame.Rect(50, 50, 1, 1)])
+
+
+class TestSpatialGrid(unittest.TestCase):
+    def setUp(self) -> None:
+        self.grid = SpatialGrid(cell_size=10)
+        self.grid.insert("a", pygame.Rect(0, 0, 25, 25))
+        self.grid.insert("b", pygame.Rect(20, 20, 10, 10))
+
+    def test_items_at(self):
+        self.assertEqual(self.grid.items_at((5, 5)), ["a"])
+        self.assertEqual(self.grid.items_at((22, 22)), ["a", "b"])
+        self.assertEqual(self.grid.items_at((28, 5)), [])
+        self.assertEqual(self.grid.items_at((-5, -5)), [])
+
+    def test_update_keeps_order(self):
+        self.grid.insert("a", pygame.Rect(20, 20, 5, 5))
+        self.assertEqual(self.grid.items_at((22, 22)), ["a", "b"])
+        self.assertEqual(self.grid.items_at((5, 5)), [])
+
+    def test_remove(self):
+        self.grid.remove("a")
+        self.assertNotIn("a", self.grid)
+        self.assertEqual(self.grid.items_at((22, 22)), ["b"])
+        self.grid.insert("a", pygame.Rect(0, 0, 25, 25))
+        self.assertEqual(self.grid.items_at((22, 22)), ["b", "a"])
+
+
+if __name__ == "__main__":
+    unittest.main()